@@ -0,0 +1,200 @@
+"""Read-only serializers lowered into generated functions.
+
+``compile_serializer`` turns a ``ModelSerializer`` class into one generated
+Python function per (nested) serializer that builds the same dicts as
+``serializer.data``: attributes are read straight off the instance and
+converted inline, without going through ``get_attribute`` and
+``to_representation`` of every field. Within one ``many()`` call, nested
+serializers are memoized by class and primary key, so a user appearing as
+teacher of fifty courses is represented once.
+
+Only the field types the API uses are lowered (integer, char, choice,
+datetime, file, primary key related and nested model serializers, each
+reading a model field of the same name). Anything else makes the serializer
+not compilable and the caller falls back to DRF.
+"""
+
+import functools
+import itertools
+from enum import Enum
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Manager
+from django.utils import timezone
+from rest_framework import ISO_8601, fields, relations, serializers
+from rest_framework.settings import api_settings
+
+
+class NotCompilable(Exception):
+    """The serializer uses something the compiler does not reproduce exactly."""
+
+
+def _datetime(value, field, output_format, field_timezone):
+    # DateTimeField.to_representation with the aware-datetime case inlined.
+    if not value:
+        return None
+    if output_format is None or isinstance(value, str):
+        return value
+    if field_timezone is not None and value.utcoffset() is not None:
+        value = value.astimezone(field_timezone)
+    else:
+        value = field.enforce_timezone(value)
+    if output_format.lower() == ISO_8601:
+        value = value.isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+    return value.strftime(output_format)
+
+
+def _file(value, use_url, request):
+    # FileField.to_representation with the request passed in.
+    if not value:
+        return None
+    if use_url:
+        try:
+            url = value.url
+        except AttributeError:
+            return None
+        if request is not None:
+            return request.build_absolute_uri(url)
+        return url
+    return value.name
+
+
+def _choice(value, choices):
+    # ChoiceField.to_representation.
+    if value == "":
+        return value
+    if isinstance(value, Enum) and str(value) != str(value.value):
+        value = value.value
+    return choices.get(str(value), value)
+
+
+def _one(obj, source, key, represent, request, memo, tz):
+    data = memo.get(key)
+    if data is None:
+        data = memo[key] = represent(getattr(obj, source), request, memo, tz)
+    return data
+
+
+def _many(related, name, represent, request, memo, tz):
+    rows = []
+    for item in related.all() if isinstance(related, Manager) else related:
+        key = (name, item.pk)
+        data = memo.get(key)
+        if data is None:
+            data = memo[key] = represent(item, request, memo, tz)
+        rows.append(data)
+    return rows
+
+
+class CompiledSerializer:
+    """The lowered read path of one serializer class."""
+
+    def __init__(self, serializer_class):
+        self.serializer_class = serializer_class
+        self.namespace = {"_datetime": _datetime, "_file": _file, "_choice": _choice, "_one": _one, "_many": _many}
+        self.sources: list[str] = []
+        self._names = itertools.count()
+        self._lowered: dict[type, str] = {}
+        self.represent = self.namespace[self._lower(serializer_class())]
+
+    def many(self, instances, request=None) -> list[dict]:
+        """Represent every instance, as ``serializer_class(instances, many=True).data`` would."""
+        memo = {}
+        tz = timezone.get_current_timezone() if settings.USE_TZ else None
+        represent = self.represent
+        return [represent(obj, request, memo, tz) for obj in instances]
+
+    def one(self, instance, request=None) -> dict:
+        """Represent a single instance."""
+        return self.many([instance], request)[0]
+
+    def _lower(self, serializer) -> str:
+        """Generate the function for one serializer class and return its name in the namespace."""
+        serializer_class = type(serializer)
+        if serializer_class in self._lowered:
+            return self._lowered[serializer_class]
+        if not isinstance(serializer, serializers.ModelSerializer) or (
+            serializer_class.to_representation is not serializers.Serializer.to_representation
+        ):
+            raise NotCompilable(f"{serializer_class.__name__} is not a plain ModelSerializer")
+
+        name = f"_represent_{serializer_class.__name__}_{next(self._names)}"
+        self._lowered[serializer_class] = name
+        model = serializer.Meta.model
+        items = [
+            f"        {field.field_name!r}: {self._expression(field, model, name)},"
+            for field in serializer.fields.values()
+            if not field.write_only
+        ]
+        source = "\n".join([f"def {name}(obj, request, memo, tz):", "    return {", *items, "    }"])
+        exec(compile(source, f"<compiled {serializer_class.__name__}>", "exec"), self.namespace)
+        self.sources.append(source)
+        return name
+
+    def _constant(self, value) -> str:
+        name = f"_c{next(self._names)}"
+        self.namespace[name] = value
+        return name
+
+    def _expression(self, field, model, owner: str) -> str:
+        """Return the expression computing one field's value from ``obj``."""
+        source = field.source
+        try:
+            model_field = model._meta.get_field(source)
+        except FieldDoesNotExist:
+            raise NotCompilable(f"{owner}.{field.field_name} does not read a model field") from None
+        if not source.isidentifier():
+            raise NotCompilable(f"{owner}.{field.field_name} has an unsupported source")
+        value = f"v{next(self._names)}"
+
+        if isinstance(field, serializers.ListSerializer):
+            child = self._lower(field.child)
+            return f"_many(obj.{source}, {child!r}, {child}, request, memo, tz)"
+        if isinstance(field, serializers.BaseSerializer):
+            if not (model_field.many_to_one or model_field.one_to_one) or not model_field.concrete:
+                raise NotCompilable(f"{owner}.{field.field_name} nests a non-forward relation")
+            child = self._lower(field)
+            return (
+                f"(None if ({value} := obj.{model_field.attname}) is None"
+                f" else _one(obj, {source!r}, ({child!r}, {value}), {child}, request, memo, tz))"
+            )
+        if type(field) is relations.PrimaryKeyRelatedField and field.pk_field is None and model_field.concrete:
+            return f"obj.{model_field.attname}"
+
+        convert = self._converter(field, value)
+        return f"(None if ({value} := obj.{source}) is None else {convert})"
+
+    def _converter(self, field, value: str) -> str:
+        """Return the inlined ``to_representation`` of a scalar field applied to ``value``."""
+        field_type = type(field)
+        if field_type is fields.IntegerField:
+            return f"int({value})"
+        # BigIntegerField and COERCE_BIGINT_TO_STRING are new in DRF 3.16.
+        if field_type is getattr(fields, "BigIntegerField", None):
+            as_string = getattr(field, "coerce_to_string", getattr(api_settings, "COERCE_BIGINT_TO_STRING", False))
+            return f"str({value})" if as_string else f"int({value})"
+        if field_type is fields.CharField:
+            return f"str({value})"
+        if field_type is fields.ChoiceField:
+            return f"_choice({value}, {self._constant(field.choice_strings_to_values)})"
+        if field_type is fields.DateTimeField:
+            output_format = getattr(field, "format", api_settings.DATETIME_FORMAT)
+            field_timezone = self._constant(field.timezone) if hasattr(field, "timezone") else "tz"
+            return f"_datetime({value}, {self._constant(field)}, {output_format!r}, {field_timezone})"
+        if field_type is fields.FileField:
+            use_url = getattr(field, "use_url", api_settings.UPLOADED_FILES_USE_URL)
+            return f"_file({value}, {use_url!r}, request)"
+        raise NotCompilable(f"{field_type.__name__} {field.field_name!r} is not supported")
+
+
+@functools.cache
+def compile_serializer(serializer_class) -> CompiledSerializer | None:
+    """Return the compiled read path of a serializer class, or None if it cannot be compiled."""
+    try:
+        return CompiledSerializer(serializer_class)
+    except NotCompilable:
+        return None
@@ -0,0 +1,74 @@
+"""API parsers: JSON decoded with orjson, and MessagePack.
+
+The JSON parser accepts and rejects the same documents as DRF's ``JSONParser``: anything
+orjson refuses is re-parsed by the stdlib, which either accepts it or raises
+DRF's usual ``ParseError``. Bodies with integers that may not fit in 64 bits,
+which orjson would silently turn into floats, are parsed by the stdlib too.
+
+The MessagePack parser needs the optional ``msgpack`` package.
+"""
+
+import codecs
+
+from django.conf import settings
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional format
+    msgpack = None
+
+# Integers below -2**63 have 19 digits and those above 2**64 - 1 have 20; orjson reads
+# both as floats. Any run of 19 digits goes to the stdlib, whatever its sign.
+# Mapping every digit to "0" lets a plain substring search find them, much faster than a regex.
+_DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+_WIDE_NUMBER = b"0" * 19
+
+
+class JSONParser(parsers.JSONParser):
+    """Drop-in replacement for ``rest_framework.parsers.JSONParser``."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """Parse the request body, falling back to the stdlib decoder on anything unusual."""
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if orjson is None or codecs.lookup(encoding).name != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+
+        body = stream.read()
+        if _WIDE_NUMBER in body.translate(_DIGITS_TO_ZERO):
+            return super().parse(_Replay(body), media_type, parser_context)
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            return super().parse(_Replay(body), media_type, parser_context)
+
+
+class MessagePackParser(parsers.BaseParser):
+    """Parse ``application/msgpack`` request bodies, e.g. bulk uploads from sync clients."""
+
+    media_type = "application/msgpack"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """Unpack the body; binary values are kept as bytes, map keys must be strings."""
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except (ValueError, TypeError, msgpack.UnpackException) as exc:
+            raise ParseError(f"MessagePack parse error - {exc}") from exc
+
+
+class _Replay:
+    """A consumed request stream handed back to the stdlib parser."""
+
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def read(self, *args):
+        body, self.body = self.body, b""
+        return body
@@ -0,0 +1,84 @@
+"""API renderers: JSON encoded with orjson, and MessagePack.
+
+JSON output is byte-for-byte what DRF's ``JSONRenderer`` produces with the
+default settings (compact, UTF-8, U+2028/U+2029 escaped). Values orjson
+does not encode the same way (datetimes, Decimals, lazy strings, querysets
+...) go through DRF's ``JSONEncoder.default``. Without orjson, or when
+indentation, ASCII-only or non-compact output is asked for, DRF's stdlib
+implementation is used. So is any output that may hold NaN or infinity, which
+orjson writes as ``null``: the stdlib raises ``ValueError`` for them under
+``STRICT_JSON`` and writes ``NaN``/``Infinity`` otherwise, as DRF does.
+
+MessagePack carries the same representation as the JSON one, for clients
+that pull large amounts of data; it needs the optional ``msgpack`` package.
+"""
+
+import decimal
+import math
+
+from rest_framework import renderers
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional format
+    msgpack = None
+
+_ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME if orjson is not None else 0
+
+
+class JSONRenderer(renderers.JSONRenderer):
+    """Drop-in replacement for ``rest_framework.renderers.JSONRenderer``."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render ``data`` into JSON bytes, falling back to the stdlib encoder where orjson differs."""
+        if (
+            orjson is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits; let the stdlib encode them (or raise its own error).
+            return super().render(data, accepted_media_type, renderer_context)
+        if b"null" in ret and _has_non_finite(data):
+            return super().render(data, accepted_media_type, renderer_context)
+        # Valid JSON, but not valid JavaScript; escape them as DRF does.
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+
+def _has_non_finite(data) -> bool:
+    """Tell whether ``data`` holds a NaN or infinite float or Decimal, which orjson renders as ``null``."""
+    if isinstance(data, float | decimal.Decimal):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite(value) for value in data.values())
+    if isinstance(data, list | tuple):
+        return any(_has_non_finite(value) for value in data)
+    return False
+
+
+class MessagePackRenderer(renderers.BaseRenderer):
+    """Render ``application/msgpack``; values msgpack has no type for are converted as for JSON."""
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Pack ``data``, with datetimes, Decimals, UUIDs and lazy strings encoded like the JSON renderer does."""
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=encoders.JSONEncoder().default, use_bin_type=True)
@@ -0,0 +1,121 @@
+"""OpenAPI schema generated once per process and served from memory.
+
+The schema is rendered in both formats the first time it is needed (or at
+warm-up), or loaded from the artifacts written by ``manage.py export_schema``
+into ``SCHEMA_ARTIFACT_DIR``. Artifact names carry a fingerprint of the URLconf
+and the API settings, so artifacts exported from another revision of the API
+are ignored rather than served.
+"""
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+import drf_spectacular
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseNotModified
+from django.urls import URLPattern, get_resolver
+from django.utils.http import parse_etags
+from drf_spectacular.generators import SchemaGenerator
+from drf_spectacular.renderers import OpenApiJsonRenderer, OpenApiYamlRenderer
+from drf_spectacular.settings import spectacular_settings
+from drf_spectacular.views import SpectacularAPIView
+
+SCHEMA_RENDERERS = {"yaml": OpenApiYamlRenderer, "json": OpenApiJsonRenderer}
+
+
+@dataclass(frozen=True)
+class SchemaDocument:
+    """A rendered schema and its validator."""
+
+    content: bytes
+    etag: str
+
+
+_documents: dict[str, SchemaDocument] = {}
+_lock = threading.Lock()
+
+
+def schema_version() -> str:
+    """Return the API version the schema documents."""
+    return spectacular_settings.VERSION or "0"
+
+
+def _routes(patterns, prefix=""):
+    for pattern in patterns:
+        if isinstance(pattern, URLPattern):
+            view = pattern.callback
+            view = getattr(view, "cls", None) or getattr(view, "view_class", None) or view
+            actions = sorted(getattr(pattern.callback, "actions", None) or {})
+            yield f"{prefix}{pattern.pattern} {view.__module__}.{view.__qualname__} {actions}"
+        else:
+            yield from _routes(pattern.url_patterns, f"{prefix}{pattern.pattern}")
+
+
+def schema_fingerprint() -> str:
+    """Hash the routes, their views and the settings the schema is generated from."""
+    digest = hashlib.sha256()
+    for route in _routes(get_resolver().url_patterns):
+        digest.update(route.encode() + b"\n")
+    api_settings = [settings.REST_FRAMEWORK, settings.SPECTACULAR_SETTINGS, drf_spectacular.__version__]
+    digest.update(json.dumps(api_settings, sort_keys=True, default=str).encode())
+    return digest.hexdigest()[:12]
+
+
+def artifact_path(fmt: str, directory=None) -> Path:
+    """Return the path of the exported artifact for a format, e.g. ``openapi-1.0.0-<fingerprint>.yaml``."""
+    name = f"openapi-{schema_version()}-{schema_fingerprint()}.{fmt}"
+    return Path(directory or settings.SCHEMA_ARTIFACT_DIR) / name
+
+
+def render_schemas() -> dict[str, bytes]:
+    """Introspect the API and render the schema in every served format."""
+    schema = SchemaGenerator().get_schema(request=None, public=True)
+    return {fmt: renderer().render(schema, renderer_context={}) for fmt, renderer in SCHEMA_RENDERERS.items()}
+
+
+def load_schemas() -> dict[str, SchemaDocument]:
+    """Fill the in-memory cache from the artifacts if present, otherwise by generating the schema."""
+    with _lock:
+        if _documents:
+            return _documents
+        paths = {fmt: artifact_path(fmt) for fmt in SCHEMA_RENDERERS}
+        if all(path.is_file() for path in paths.values()):
+            rendered = {fmt: path.read_bytes() for fmt, path in paths.items()}
+        else:
+            rendered = render_schemas()
+        for fmt, content in rendered.items():
+            _documents[fmt] = SchemaDocument(content, f'"{hashlib.sha256(content).hexdigest()[:32]}"')
+        return _documents
+
+
+def clear_schema_cache() -> None:
+    """Forget the cached schema so the next request regenerates or reloads it."""
+    with _lock:
+        _documents.clear()
+
+
+class CachedSchemaView(SpectacularAPIView):
+    """Serve the OpenAPI schema from memory with an ``ETag``.
+
+    Content negotiation (``Accept`` or ``?format=``) works as in
+    ``SpectacularAPIView``; ``If-None-Match`` gets a ``304``.
+    """
+
+    def _get_schema_response(self, request):
+        if self.api_version or request.GET.get("version") or request.GET.get("lang"):
+            # Variants are rare; generate them on demand rather than caching each one.
+            return super()._get_schema_response(request)
+
+        document = load_schemas()[request.accepted_renderer.format]
+        # Weak comparison: compressed responses carry the ETag as W/"...".
+        if document.etag in {tag.removeprefix("W/") for tag in parse_etags(request.headers.get("If-None-Match", ""))}:
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(document.content, content_type=request.accepted_media_type)
+            response["Content-Disposition"] = f'inline; filename="{self._get_filename(request, None)}"'
+        response["ETag"] = document.etag
+        response["Cache-Control"] = f"public, max-age={settings.SCHEMA_MAX_AGE}"
+        return response
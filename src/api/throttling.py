@@ -0,0 +1,117 @@
+"""Token-bucket API throttling with the buckets kept in the shared cache.
+
+Each scope has a rate in ``DEFAULT_THROTTLE_RATES`` such as ``"30/min"``: a
+client's bucket holds up to 30 tokens, refills evenly at 30 per minute and each
+request takes one, so bursts are allowed up to the bucket size. Buckets are
+kept per user, or per client IP for anonymous requests such as logins. The IP
+is ``REMOTE_ADDR`` unless DRF's ``NUM_PROXIES`` says how many trusted proxies
+append to ``X-Forwarded-For``; with DRF's default of ``None`` a client could
+spoof the header and get a fresh bucket per request.
+
+With the Redis cache a Lua script refills and takes from the bucket atomically
+in one round trip, so every worker process shares the same buckets. Other
+caches read and write the bucket under a process-local lock, which is exact
+only within one process: use Redis when several workers serve the API.
+"""
+
+import threading
+
+from django.core.cache.backends.redis import RedisCache
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.throttling import SimpleRateThrottle
+
+READ_SCOPE = "read"
+
+# KEYS[1]: bucket hash; ARGV: capacity, refill rate in tokens per second, TTL in seconds.
+# The server clock is used so that every worker agrees on the refill.
+_TAKE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call("TIME")
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "updated")
+local tokens = tonumber(bucket[1]) or capacity
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "updated", tostring(now))
+redis.call("EXPIRE", KEYS[1], ARGV[3])
+return {allowed, tostring((1 - tokens) / rate)}
+"""
+
+_lock = threading.Lock()
+
+
+class TokenBucketThrottle(SimpleRateThrottle):
+    """Throttle each client with a token bucket per scope.
+
+    Safe-method requests use the ``read`` scope. Other requests use the scope
+    the view gives their action in ``throttle_scopes``, else the view's
+    ``throttle_scope``; writes without a scope are not throttled.
+    """
+
+    cache_format = "throttle:%(scope)s:%(ident)s"
+    _script = None
+
+    def __init__(self):
+        # The scope, and with it the rate, depends on the request; see allow_request().
+        self.retry_after = None
+
+    def get_scope(self, request, view):
+        """Name the bucket the request takes a token from, or ``None`` to let it through."""
+        if request.method in SAFE_METHODS:
+            return READ_SCOPE
+        scope = getattr(view, "throttle_scopes", {}).get(getattr(view, "action", None))
+        return scope or getattr(view, "throttle_scope", None)
+
+    def get_cache_key(self, request, view):
+        user = request.user
+        ident = user.pk if user and user.is_authenticated else self.get_ident(request)
+        return self.cache_format % {"scope": self.scope, "ident": ident}
+
+    def allow_request(self, request, view):
+        self.scope = self.get_scope(request, view)
+        if self.scope is None:
+            return True
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        if self.rate is None:
+            return True
+
+        allowed, self.retry_after = self.take(self.get_cache_key(request, view))
+        return allowed
+
+    def take(self, key: str) -> tuple[bool, float]:
+        """Take a token from the bucket; return whether there was one and the seconds until the next."""
+        if isinstance(self.cache, RedisCache):
+            return self._take_redis(key)
+        return self._take_locked(key)
+
+    def _take_redis(self, key: str) -> tuple[bool, float]:
+        key = self.cache.make_and_validate_key(key)
+        client = self.cache._cache.get_client(key, write=True)
+        if TokenBucketThrottle._script is None:
+            # Runs by EVALSHA; redis-py loads the script once if the server does not know it yet.
+            TokenBucketThrottle._script = client.register_script(_TAKE_SCRIPT)
+        args = [self.num_requests, self.num_requests / self.duration, self.duration]
+        allowed, wait = self._script(keys=[key], args=args, client=client)
+        return bool(allowed), float(wait)
+
+    def _take_locked(self, key: str) -> tuple[bool, float]:
+        rate = self.num_requests / self.duration
+        with _lock:
+            now = self.timer()
+            tokens, updated = self.cache.get(key, (self.num_requests, now))
+            tokens = min(self.num_requests, tokens + max(0.0, now - updated) * rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self.cache.set(key, (tokens, now), self.duration)
+        return allowed, (1 - tokens) / rate
+
+    def wait(self):
+        return self.retry_after
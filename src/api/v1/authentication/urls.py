@@ -1,8 +1,9 @@
 from django.urls import path
-from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from rest_framework_simplejwt.views import TokenRefreshView
 
+from .views import LoginView
 
 urlpatterns = [
-    path("jwt/create", TokenObtainPairView.as_view(), name="jwt-create"),
+    path("jwt/create", LoginView.as_view(), name="jwt-create"),
     path("jwt/refresh", TokenRefreshView.as_view(), name="jwt-refresh"),
 ]
@@ -0,0 +1,7 @@
+from rest_framework_simplejwt.views import TokenObtainPairView
+
+
+class LoginView(TokenObtainPairView):
+    """Issue a JWT pair; throttled per client IP under the ``login`` scope."""
+
+    throttle_scope = "login"
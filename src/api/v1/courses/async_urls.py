@@ -0,0 +1,19 @@
+from django.urls import path
+
+from .async_views import (
+    AsyncCourseView,
+    AsyncHomeworkAssignmentView,
+    AsyncLectureView,
+    AsyncSubmissionView,
+)
+
+urlpatterns = [
+    path("courses/", AsyncCourseView.as_view(), name="async-course-list"),
+    path("courses/<int:pk>/", AsyncCourseView.as_view(), name="async-course-detail"),
+    path("lectures/", AsyncLectureView.as_view(), name="async-lecture-list"),
+    path("lectures/<int:pk>/", AsyncLectureView.as_view(), name="async-lecture-detail"),
+    path("assignments/", AsyncHomeworkAssignmentView.as_view(), name="async-assignment-list"),
+    path("assignments/<int:pk>/", AsyncHomeworkAssignmentView.as_view(), name="async-assignment-detail"),
+    path("submissions/", AsyncSubmissionView.as_view(), name="async-submission-list"),
+    path("submissions/<int:pk>/", AsyncSubmissionView.as_view(), name="async-submission-detail"),
+]
@@ -0,0 +1,194 @@
+from abc import ABC, abstractmethod
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.http import JsonResponse
+from django.views import View
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from api.compiled import compile_serializer
+from authentication.claims import ais_revoked, user_from_claims
+from courses.models import Course, HomeworkAssignment, Lecture, Submission
+from courses.services import CourseService
+
+from .serializers import (
+    CourseSerializer,
+    HomeworkAssignmentSerializer,
+    LectureSerializer,
+    SubmissionSerializer,
+)
+
+User = get_user_model()
+
+
+class AsyncReadOnlyView(ABC, View):
+    """Base view serving list/retrieve reads with the async ORM under ASGI.
+
+    Mirrors the read side of the DRF viewsets without tying up a worker thread
+    while the database answers; the queryset is fully fetched (including
+    prefetches) before serialization so the serializers never touch the DB.
+    """
+
+    http_method_names = ["get", "head", "options"]
+    serializer_class = None
+
+    async def get(self, request, pk=None):
+        """Authenticate the request and dispatch to list or retrieve."""
+        user = await self.authenticate(request)
+        if user is None:
+            return self.error("Authentication credentials were not provided.", status=401)
+
+        if pk is None:
+            instances = [obj async for obj in self.get_queryset(request, user)]
+            return self.respond(request, instances, many=True)
+
+        try:
+            instance = await self.get_object_queryset(request, user).aget(pk=pk)
+        except self.model.DoesNotExist:
+            return self.error("No object found.", status=404)
+
+        if not await self.has_object_permission(user, instance):
+            return self.error("You do not have permission to perform this action.", status=403)
+        return self.respond(request, instance)
+
+    async def authenticate(self, request):
+        """Validate the bearer token and resolve its user from the claims or the async ORM."""
+        authenticator = JWTAuthentication()
+        header = authenticator.get_header(request)
+        if header is None:
+            return None
+        raw_token = authenticator.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        try:
+            token = authenticator.get_validated_token(raw_token)
+        except (InvalidToken, TokenError):
+            return None
+
+        if settings.AUTH_TOKEN_CLAIMS_USER:
+            claims_user = user_from_claims(token)
+            if claims_user is not None:
+                return None if await ais_revoked(token) else claims_user
+
+        user_id = token.get(jwt_settings.USER_ID_CLAIM)
+        user = await User.objects.filter(**{jwt_settings.USER_ID_FIELD: user_id}).afirst()
+        if user is None or not user.is_active:
+            return None
+        return user
+
+    @abstractmethod
+    def get_queryset(self, request, user):
+        """Return the queryset used by the list action."""
+
+    def get_object_queryset(self, request, user):
+        """Return the queryset used to look up a single object."""
+        return self.get_queryset(request, user)
+
+    async def has_object_permission(self, user, instance) -> bool:
+        """Check object-level access; open to any authenticated user by default."""
+        return True
+
+    def respond(self, request, data, many=False):
+        """Serialize already-loaded instances into a JSON response."""
+        compiled = compile_serializer(self.serializer_class) if many and settings.COMPILED_SERIALIZERS else None
+        if compiled is not None:
+            return JsonResponse(compiled.many(data, request), safe=False)
+        serializer = self.serializer_class(data, many=many, context={"request": request})
+        return JsonResponse(serializer.data, safe=False)
+
+    @staticmethod
+    def error(detail: str, status: int):
+        """Build an error payload shaped like DRF's."""
+        response = JsonResponse({"detail": detail}, status=status)
+        if status == 401:
+            response["WWW-Authenticate"] = 'Bearer realm="api"'
+        return response
+
+
+class CourseMemberReadMixin:
+    """Restrict retrieve to the course's teachers and students."""
+
+    async def has_object_permission(self, user, instance) -> bool:
+        """Allow course teachers and enrolled students to read the object."""
+        course = self.get_course(instance)
+        if await CourseService.ais_user_course_teacher(course=course, user=user):
+            return True
+        return await CourseService.ais_user_course_student(course=course, user=user)
+
+
+class AsyncCourseView(AsyncReadOnlyView):
+    """Async read view for courses."""
+
+    model = Course
+    serializer_class = CourseSerializer
+
+    def get_queryset(self, request, user):
+        return Course.objects.with_relations().order_by("-created_at")
+
+
+class AsyncLectureView(CourseMemberReadMixin, AsyncReadOnlyView):
+    """Async read view for lectures, listed per course."""
+
+    model = Lecture
+    serializer_class = LectureSerializer
+
+    def get_queryset(self, request, user):
+        """Get queryset based on course filter."""
+        course_id = request.GET.get("course")
+        if not course_id:
+            return Lecture.objects.none()
+        return Lecture.objects.for_course(course_id).with_relations().order_by("-created_at")
+
+    def get_object_queryset(self, request, user):
+        return Lecture.objects.with_relations()
+
+    @staticmethod
+    def get_course(instance):
+        return instance.course
+
+
+class AsyncHomeworkAssignmentView(CourseMemberReadMixin, AsyncReadOnlyView):
+    """Async read view for homework assignments, listed per lecture."""
+
+    model = HomeworkAssignment
+    serializer_class = HomeworkAssignmentSerializer
+
+    def get_queryset(self, request, user):
+        """Get queryset based on lecture filter."""
+        lecture_id = request.GET.get("lecture")
+        if not lecture_id:
+            return HomeworkAssignment.objects.none()
+        return HomeworkAssignment.objects.for_lecture(lecture_id).with_relations().order_by("-created_at")
+
+    def get_object_queryset(self, request, user):
+        return HomeworkAssignment.objects.with_relations()
+
+    @staticmethod
+    def get_course(instance):
+        return instance.lecture.course
+
+
+class AsyncSubmissionView(AsyncReadOnlyView):
+    """Async read view for submissions scoped to the user's role."""
+
+    model = Submission
+    serializer_class = SubmissionSerializer
+
+    def get_queryset(self, request, user):
+        """Get queryset based on user role and assignment filter."""
+        assignment_id = request.GET.get("assignment")
+
+        if user.is_teacher():
+            queryset = Submission.objects.for_course_teachers(user)
+        elif user.is_student():
+            queryset = Submission.objects.for_student(user)
+        else:
+            return Submission.objects.none()
+
+        if assignment_id:
+            queryset = queryset.for_assignment(assignment_id)
+
+        return queryset.with_relations().order_by("-submitted_at")
@@ -1,6 +1,6 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
-from courses.models import Course, Grade, GradeComment, HomeworkAssignment, Lecture, Submission
+from courses.models import Course, Grade, GradeComment, HomeworkAssignment, Lecture, MissingSubmission, Submission
 from courses.services import (
     CourseService,
     LectureService,
@@ -198,3 +198,15 @@ class GradeCommentSerializer(serializers.ModelSerializer):
         return GradingService.create_grade_comment(
             grade=validated_data["grade"], author=user, text=validated_data["text"]
         )
+
+
+class MissingSubmissionSerializer(serializers.ModelSerializer):
+    """Serializer for a student's missing submission."""
+
+    assignment_id = serializers.PrimaryKeyRelatedField(source="assignment", read_only=True)
+    course_id = serializers.PrimaryKeyRelatedField(source="course", read_only=True)
+    student = UserMiniSerializer(read_only=True)
+
+    class Meta:
+        model = MissingSubmission
+        fields = ("id", "assignment_id", "course_id", "student", "due_date", "detected_at")
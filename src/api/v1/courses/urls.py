@@ -6,6 +6,7 @@ from .views import (
     GradeCommentViewSet,
     HomeworkAssignmentViewSet,
     LectureViewSet,
+    MissingSubmissionViewSet,
     SubmissionViewSet,
 )
 
@@ -15,6 +16,7 @@ router.register(r"lectures", LectureViewSet, basename="lecture")
 router.register(r"assignments", HomeworkAssignmentViewSet, basename="assignment")
 router.register(r"submissions", SubmissionViewSet, basename="submission")
 router.register(r"grade-comments", GradeCommentViewSet, basename="grade-comment")
+router.register(r"missing-submissions", MissingSubmissionViewSet, basename="missing-submission")
 
 urlpatterns = [
     path("", include(router.urls)),
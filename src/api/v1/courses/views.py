@@ -1,24 +1,26 @@
 from rest_framework import decorators, permissions, response, status, viewsets
 from rest_framework.parsers import FormParser, MultiPartParser
 
-from courses.models import Course, GradeComment, HomeworkAssignment, Lecture, Submission
+from courses.models import Course, GradeComment, HomeworkAssignment, Lecture, MissingSubmission, Submission
 from courses.permissions import IsCourseStudentOrTeacherReadOnly, IsCourseTeacher, IsTeacher
 from courses.services import (
     CourseService,
     GradingService,
 )
+from ..mixins import CompiledListMixin, ReplicaReadMixin, ServerTimingMixin, SyncDestroyMixin
 from .serializers import (
     CourseSerializer,
     GradeCommentSerializer,
     GradeSerializer,
     HomeworkAssignmentSerializer,
     LectureSerializer,
+    MissingSubmissionSerializer,
     SubmissionSerializer,
     UserMiniSerializer,
 )
 
 
-class CourseViewSet(viewsets.ModelViewSet):
+class CourseViewSet(ServerTimingMixin, ReplicaReadMixin, CompiledListMixin, SyncDestroyMixin, viewsets.ModelViewSet):
     """ViewSet for managing courses."""
 
     queryset = Course.objects.with_relations().order_by("-created_at")
@@ -77,7 +79,7 @@ class CourseViewSet(viewsets.ModelViewSet):
         return response.Response(status=status.HTTP_201_CREATED)
 
 
-class LectureViewSet(viewsets.ModelViewSet):
+class LectureViewSet(ServerTimingMixin, ReplicaReadMixin, CompiledListMixin, SyncDestroyMixin, viewsets.ModelViewSet):
     """ViewSet for managing lectures."""
 
     queryset = Lecture.objects.none()
@@ -99,7 +101,9 @@ class LectureViewSet(viewsets.ModelViewSet):
         return Lecture.objects.for_course(course_id).with_relations().order_by("-created_at")
 
 
-class HomeworkAssignmentViewSet(viewsets.ModelViewSet):
+class HomeworkAssignmentViewSet(
+    ServerTimingMixin, ReplicaReadMixin, CompiledListMixin, SyncDestroyMixin, viewsets.ModelViewSet
+):
     """ViewSet for managing homework assignments."""
 
     queryset = HomeworkAssignment.objects.none()
@@ -120,12 +124,15 @@ class HomeworkAssignmentViewSet(viewsets.ModelViewSet):
         return HomeworkAssignment.objects.for_lecture(lecture_id).with_relations().order_by("-created_at")
 
 
-class SubmissionViewSet(viewsets.ModelViewSet):
+class SubmissionViewSet(
+    ServerTimingMixin, ReplicaReadMixin, CompiledListMixin, SyncDestroyMixin, viewsets.ModelViewSet
+):
     """ViewSet for managing submissions."""
 
     queryset = Submission.objects.none()
     serializer_class = SubmissionSerializer
     permission_classes = [permissions.IsAuthenticated]
+    throttle_scopes = {"create": "submission", "grade": "grading"}
 
     def get_queryset(self):
         """Get queryset based on user role and assignment filter."""
@@ -171,7 +178,9 @@ class SubmissionViewSet(viewsets.ModelViewSet):
         return response.Response(GradeSerializer(grade).data)
 
 
-class GradeCommentViewSet(viewsets.ModelViewSet):
+class GradeCommentViewSet(
+    ServerTimingMixin, ReplicaReadMixin, CompiledListMixin, SyncDestroyMixin, viewsets.ModelViewSet
+):
     """ViewSet for managing grade comments."""
 
     queryset = GradeComment.objects.none()
@@ -188,3 +197,25 @@ class GradeCommentViewSet(viewsets.ModelViewSet):
             queryset = queryset.for_grade(grade_id)
 
         return queryset.with_relations().order_by("-created_at")
+
+
+class MissingSubmissionViewSet(ServerTimingMixin, ReplicaReadMixin, CompiledListMixin, viewsets.ReadOnlyModelViewSet):
+    """ViewSet for reading recorded missing submissions."""
+
+    queryset = MissingSubmission.objects.none()
+    serializer_class = MissingSubmissionSerializer
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        """Get queryset based on user visibility and course/student filters."""
+        user = self.request.user
+        course_id = self.request.query_params.get("course")
+        student_id = self.request.query_params.get("student")
+
+        queryset = MissingSubmission.objects.visible_to(user)
+        if course_id:
+            queryset = queryset.for_course(course_id)
+        if student_id:
+            queryset = queryset.for_student(student_id)
+
+        return queryset.with_relations().order_by("-due_date", "pk")
@@ -0,0 +1,61 @@
+from rest_framework import serializers
+
+from courses.models import Course, Grade, HomeworkAssignment
+
+from ..courses.serializers import UserMiniSerializer
+
+
+class DashboardCourseSerializer(serializers.ModelSerializer):
+    """Serializer for a course on a dashboard, without its student list."""
+
+    teachers = UserMiniSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Course
+        fields = ("id", "title", "teachers")
+
+
+class DashboardAssignmentSerializer(serializers.ModelSerializer):
+    """Serializer for an assignment on a dashboard, with where it belongs."""
+
+    course_id = serializers.IntegerField(source="lecture.course_id", read_only=True)
+    lecture_id = serializers.IntegerField(read_only=True)
+    lecture_topic = serializers.CharField(source="lecture.topic", read_only=True)
+
+    class Meta:
+        model = HomeworkAssignment
+        fields = ("id", "course_id", "lecture_id", "lecture_topic", "text", "due_date")
+
+
+class UpcomingAssignmentSerializer(DashboardAssignmentSerializer):
+    """Serializer for an upcoming assignment, with whether it was already submitted."""
+
+    submitted = serializers.BooleanField(read_only=True)
+
+    class Meta(DashboardAssignmentSerializer.Meta):
+        fields = (*DashboardAssignmentSerializer.Meta.fields, "submitted")
+
+
+class DashboardGradeSerializer(serializers.ModelSerializer):
+    """Serializer for a recent grade, with the assignment it is for."""
+
+    submission_id = serializers.IntegerField(read_only=True)
+    assignment_id = serializers.IntegerField(source="submission.assignment_id", read_only=True)
+    graded_by = UserMiniSerializer(read_only=True)
+
+    class Meta:
+        model = Grade
+        fields = ("id", "submission_id", "assignment_id", "score", "comment", "graded_by", "graded_at")
+
+
+class CourseWorkloadSerializer(serializers.Serializer):
+    """Serializer for one course's figures on the teacher dashboard."""
+
+    id = serializers.IntegerField()
+    title = serializers.CharField()
+    student_count = serializers.IntegerField()
+    assignment_count = serializers.IntegerField()
+    due_this_week = serializers.IntegerField()
+    submission_count = serializers.IntegerField()
+    awaiting_grading = serializers.IntegerField()
+    average_score = serializers.FloatField(allow_null=True)
@@ -0,0 +1,42 @@
+from rest_framework import permissions, response, views
+
+from courses.permissions import IsStudent, IsTeacher
+from courses.services import DashboardService
+
+from ..mixins import ServerTimingMixin
+from .serializers import (
+    CourseWorkloadSerializer,
+    DashboardAssignmentSerializer,
+    DashboardCourseSerializer,
+    DashboardGradeSerializer,
+    UpcomingAssignmentSerializer,
+)
+
+
+class StudentDashboardView(ServerTimingMixin, views.APIView):
+    """API view returning a student's home screen in one call."""
+
+    permission_classes = [permissions.IsAuthenticated, IsStudent]
+
+    def get(self, request):
+        """Return courses, upcoming and missing assignments and recent grades."""
+        dashboard = DashboardService.get_student_dashboard(request.user)
+        return response.Response(
+            {
+                "courses": DashboardCourseSerializer(dashboard.courses, many=True).data,
+                "upcoming": UpcomingAssignmentSerializer(dashboard.upcoming, many=True).data,
+                "missing": DashboardAssignmentSerializer(dashboard.missing, many=True).data,
+                "recent_grades": DashboardGradeSerializer(dashboard.recent_grades, many=True).data,
+            }
+        )
+
+
+class TeacherDashboardView(ServerTimingMixin, views.APIView):
+    """API view returning the workload of each course a teacher teaches, in one call."""
+
+    permission_classes = [permissions.IsAuthenticated, IsTeacher]
+
+    def get(self, request):
+        """Return per-course student, assignment, submission and grading figures."""
+        workloads = DashboardService.get_teacher_dashboard(request.user)
+        return response.Response({"courses": CourseWorkloadSerializer(workloads, many=True).data})
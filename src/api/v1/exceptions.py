@@ -3,6 +3,7 @@ from rest_framework.response import Response
 from rest_framework import status
 
 from courses.exceptions import (
+    CursorExpiredException,
     PermissionDeniedException,
     ValidationException,
     UserRoleException,
@@ -19,5 +20,8 @@ def custom_exception_handler(exc, context):
     if isinstance(exc, PermissionDeniedException):
         return Response({"detail": str(exc)}, status=status.HTTP_403_FORBIDDEN)
 
+    if isinstance(exc, CursorExpiredException):
+        return Response({"detail": str(exc), "code": "cursor_expired"}, status=status.HTTP_410_GONE)
+
     if isinstance(exc, (ValidationException, UserRoleException, AlreadyGradedException)):
         return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,131 @@
+import time
+
+from django.conf import settings
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+
+from api.compiled import compile_serializer
+from core.db_router import is_pinned_to_primary, pin_to_primary, replica_configured, routing_context
+from core.timing import current_timings, measure
+from courses.services import SyncService
+
+
+class ReplicaReadMixin:
+    """Serve safe-method reads from the read replica, with read-your-writes stickiness.
+
+    Authentication and everything in unsafe requests run on the primary. A user
+    whose request wrote to the database is pinned to the primary for
+    ``DB_REPLICA_STICKY_SECONDS`` so their next reads never see stale data.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        """Run the request inside its own routing context."""
+        if not replica_configured():
+            return super().dispatch(request, *args, **kwargs)
+
+        with routing_context() as state:
+            self.routing_state = state
+            response = super().dispatch(request, *args, **kwargs)
+            user = getattr(request, "user", None)
+            if state.wrote and user is not None and user.is_authenticated:
+                pin_to_primary(user.pk)
+        return response
+
+    def perform_authentication(self, request):
+        """Enable replica reads once the user is known and not pinned."""
+        super().perform_authentication(request)
+        state = getattr(self, "routing_state", None)
+        if state is not None and request.method in SAFE_METHODS:
+            user = request.user
+            state.use_replica = not (user.is_authenticated and is_pinned_to_primary(user.pk))
+
+
+class CompiledListMixin:
+    """Serve the ``list`` action through the compiled serializer (see ``api.compiled``).
+
+    The response is identical to ``ListModelMixin.list``; serializers the
+    compiler does not support, or ``COMPILED_SERIALIZERS=0``, use DRF as usual.
+    """
+
+    def list(self, request, *args, **kwargs):
+        """List the filtered queryset, paginated if the view paginates."""
+        compiled = compile_serializer(self.get_serializer_class()) if settings.COMPILED_SERIALIZERS else None
+        if compiled is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(compiled.many(page, request))
+        return Response(compiled.many(queryset, request))
+
+
+class SyncDestroyMixin:
+    """Delete through ``SyncService.delete``, which writes the tombstones of the whole cascade in bulk."""
+
+    def perform_destroy(self, instance):
+        """Delete the object and everything it cascades to."""
+        SyncService.delete(instance)
+
+
+class ServerTimingMixin:
+    """Record the DRF lifecycle phases of a view in the request's Server-Timing breakdown.
+
+    ``auth`` and ``perm`` time authentication and permission checks. ``serialize``
+    is the handler's own time (queryset building, serializer ``.data``,
+    pagination) with database and object-permission time taken out, since
+    querysets are only evaluated while serializing and show up under ``db``.
+    ``render`` times the accepted renderer. Does nothing without
+    ``ServerTimingMiddleware``.
+    """
+
+    def perform_authentication(self, request):
+        """Time authentication."""
+        with measure("auth"):
+            super().perform_authentication(request)
+
+    def check_permissions(self, request):
+        """Time view-level permission checks, including ``get_permissions``."""
+        with measure("perm"):
+            super().check_permissions(request)
+
+    def check_object_permissions(self, request, obj):
+        """Time object-level permission checks."""
+        with measure("perm"):
+            super().check_object_permissions(request, obj)
+
+    def initial(self, request, *args, **kwargs):
+        """Mark the start of the handler once authentication and permissions have run."""
+        super().initial(request, *args, **kwargs)
+        timings = current_timings()
+        if timings is not None:
+            self._handler_started = (time.perf_counter(), self._excluded_time(timings))
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        """Close the handler phase and time rendering of the response."""
+        response = super().finalize_response(request, response, *args, **kwargs)
+        timings = current_timings()
+        started = getattr(self, "_handler_started", None)
+        if timings is None:
+            return response
+
+        if started is not None:
+            start, excluded = started
+            elapsed = time.perf_counter() - start - (self._excluded_time(timings) - excluded)
+            timings.add("serialize", max(elapsed, 0.0))
+            self._handler_started = None
+
+        if isinstance(response, Response) and getattr(response, "accepted_renderer", None) is not None:
+            renderer = response.accepted_renderer
+            render = renderer.render
+
+            def timed_render(*render_args, **render_kwargs):
+                with timings.measure("render"):
+                    return render(*render_args, **render_kwargs)
+
+            renderer.render = timed_render
+        return response
+
+    @staticmethod
+    def _excluded_time(timings):
+        return timings.durations.get("db", 0.0) + timings.durations.get("perm", 0.0)
@@ -0,0 +1,57 @@
+from rest_framework import serializers
+
+from ..courses.serializers import (
+    CourseSerializer,
+    GradeCommentSerializer,
+    GradeSerializer,
+    HomeworkAssignmentSerializer,
+    LectureSerializer,
+    SubmissionSerializer,
+)
+
+
+class SyncCourseSerializer(CourseSerializer):
+    """Course as sent by delta sync, with its modification time."""
+
+    class Meta(CourseSerializer.Meta):
+        fields = (*CourseSerializer.Meta.fields, "updated_at")
+
+
+class SyncLectureSerializer(LectureSerializer):
+    """Lecture as sent by delta sync, with its course id and modification time."""
+
+    course_id = serializers.PrimaryKeyRelatedField(source="course", read_only=True)
+
+    class Meta(LectureSerializer.Meta):
+        fields = (*LectureSerializer.Meta.fields, "updated_at")
+
+
+class SyncHomeworkAssignmentSerializer(HomeworkAssignmentSerializer):
+    """Homework assignment as sent by delta sync, with its lecture id and modification time."""
+
+    lecture_id = serializers.PrimaryKeyRelatedField(source="lecture", read_only=True)
+
+    class Meta(HomeworkAssignmentSerializer.Meta):
+        fields = (*HomeworkAssignmentSerializer.Meta.fields, "updated_at")
+
+
+class SyncSubmissionSerializer(SubmissionSerializer):
+    """Submission as sent by delta sync, with its assignment id and modification time."""
+
+    assignment_id = serializers.PrimaryKeyRelatedField(source="assignment", read_only=True)
+
+    class Meta(SubmissionSerializer.Meta):
+        fields = (*SubmissionSerializer.Meta.fields, "updated_at")
+
+
+class SyncGradeSerializer(GradeSerializer):
+    """Grade as sent by delta sync, with its submission id."""
+
+    submission_id = serializers.PrimaryKeyRelatedField(source="submission", read_only=True)
+
+
+class SyncGradeCommentSerializer(GradeCommentSerializer):
+    """Grade comment as sent by delta sync, with its modification time."""
+
+    class Meta(GradeCommentSerializer.Meta):
+        fields = (*GradeCommentSerializer.Meta.fields, "updated_at")
@@ -0,0 +1,54 @@
+from django.conf import settings
+from rest_framework import permissions, response, views
+
+from api.compiled import compile_serializer
+from courses.services import SyncService
+
+from ..mixins import ServerTimingMixin
+from .serializers import (
+    SyncCourseSerializer,
+    SyncGradeCommentSerializer,
+    SyncGradeSerializer,
+    SyncHomeworkAssignmentSerializer,
+    SyncLectureSerializer,
+    SyncSubmissionSerializer,
+)
+
+SERIALIZERS = {
+    "courses": SyncCourseSerializer,
+    "lectures": SyncLectureSerializer,
+    "assignments": SyncHomeworkAssignmentSerializer,
+    "submissions": SyncSubmissionSerializer,
+    "grades": SyncGradeSerializer,
+    "grade_comments": SyncGradeCommentSerializer,
+}
+
+
+def _represent(serializer_class, rows, request) -> list[dict]:
+    compiled = compile_serializer(serializer_class) if settings.COMPILED_SERIALIZERS else None
+    if compiled is None:
+        return serializer_class(rows, many=True, context={"request": request}).data
+    return compiled.many(rows, request)
+
+
+class SyncView(ServerTimingMixin, views.APIView):
+    """API view returning what changed for the user since a sync cursor.
+
+    Always reads the primary: a lagging replica could hide rows older than the
+    cursor handed out.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        """Return changed rows and deleted ids per collection, and the cursor to pass as ``since`` next."""
+        since = request.query_params.get("since")
+        changes = SyncService.get_changes(request.user, SyncService.decode_cursor(since) if since else None)
+        return response.Response(
+            {
+                "cursor": SyncService.encode_cursor(changes.cursor),
+                "has_more": changes.has_more,
+                "changed": {key: _represent(SERIALIZERS[key], rows, request) for key, rows in changes.changed.items()},
+                "deleted": changes.deleted,
+            }
+        )
@@ -3,5 +3,8 @@ from django.urls import include, path
 urlpatterns = [
     path("auth/", include("api.v1.authentication.urls")),
     path("users/", include("api.v1.users.urls")),
+    path("async/", include("api.v1.courses.async_urls")),
+    path("dashboard/", include("api.v1.dashboard.urls")),
+    path("", include("api.v1.sync.urls")),
     path("", include("api.v1.courses.urls")),
 ]
@@ -1,9 +1,10 @@
 from django.urls import path
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
-from .views import MeView, RegisterView
+from .views import BulkProvisionView, MeView, RegisterView
 
 urlpatterns = [
     path("register", RegisterView.as_view(), name="register"),
     path("me", MeView.as_view(), name="me"),
+    path("bulk", BulkProvisionView.as_view(), name="bulk-provision"),
 ]
@@ -1,12 +1,18 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from rest_framework import generics, permissions
+from rest_framework import generics, permissions, response, status, views
+from rest_framework.exceptions import ParseError
 
+from users.provisioning import detect_format, read_rows
+from users.services import UserService
+
+from ..mixins import ServerTimingMixin
 from .serializers import RegisterSerializer, UserPublicSerializer
 
 User = get_user_model()
 
 
-class RegisterView(generics.CreateAPIView):
+class RegisterView(ServerTimingMixin, generics.CreateAPIView):
     """API view for user registration."""
 
     queryset = User.objects.all()
@@ -14,10 +20,42 @@ class RegisterView(generics.CreateAPIView):
     permission_classes = [permissions.AllowAny]
 
 
-class MeView(generics.RetrieveAPIView):
+class MeView(ServerTimingMixin, generics.RetrieveAPIView):
     """API view for retrieving the current user's details."""
 
     serializer_class = UserPublicSerializer
 
     def get_object(self):
-        return self.request.user
+        # The authenticated user may be built from token claims only; load the full row.
+        return User.objects.get(pk=self.request.user.pk)
+
+
+class BulkProvisionView(ServerTimingMixin, views.APIView):
+    """API view for creating many users from a JSON or MessagePack list, or an uploaded CSV/JSON file."""
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def post(self, request):
+        """Provision users and report per-row errors."""
+        upload = request.FILES.get("file")
+        try:
+            if upload is not None:
+                rows = read_rows(upload.read(), detect_format(upload.name))
+            else:
+                rows = request.data.get("users", []) if isinstance(request.data, dict) else request.data
+                if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+                    raise ValueError("Expected a list of user objects.")
+        except ValueError as e:
+            raise ParseError(str(e))
+
+        if len(rows) > settings.BULK_PROVISION_MAX_ROWS:
+            detail = (
+                f"At most {settings.BULK_PROVISION_MAX_ROWS} users per request; "
+                "use manage.py provision_users for larger intakes."
+            )
+            return response.Response({"detail": detail}, status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE)
+
+        result = UserService.bulk_create_users(rows)
+        payload = {"created": len(result.created), "errors": result.errors}
+        status_code = status.HTTP_201_CREATED if result.created or not result.errors else status.HTTP_400_BAD_REQUEST
+        return response.Response(payload, status=status_code)
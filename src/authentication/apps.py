@@ -1,6 +1,17 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_save, pre_save
 
 
 class AuthConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "authentication"
+
+    def ready(self):
+        """Connect the token revocation signal handlers."""
+        from django.contrib.auth import get_user_model
+
+        from .signals import bump_token_version_on_claims_change, publish_token_revocation
+
+        User = get_user_model()
+        pre_save.connect(bump_token_version_on_claims_change, sender=User, dispatch_uid="auth.bump_token_version")
+        post_save.connect(publish_token_revocation, sender=User, dispatch_uid="auth.publish_token_revocation")
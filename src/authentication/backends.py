@@ -0,0 +1,63 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.exceptions import PermissionDenied
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed
+
+from .claims import is_revoked, user_from_claims
+from .password_pool import PoolFull, verifier
+
+User = get_user_model()
+
+
+class PooledModelBackend(ModelBackend):
+    """ModelBackend whose password check runs in the bounded login pool (see ``password_pool``).
+
+    When the pool is full the login fails like a wrong password would, for the
+    admin and any other caller of ``authenticate()``. The request is flagged with
+    ``login_pool_full`` so the API login can answer 503 instead.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        """Return the active user matching the credentials, upgrading an outdated password hash."""
+        if username is None:
+            username = kwargs.get(User.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+
+        user = User._default_manager.filter(**{User.USERNAME_FIELD: username}).first()
+
+        def save_upgraded_hash(encoded):
+            user.password = encoded
+            user.save(update_fields=["password"])
+
+        try:
+            valid = verifier.verify(
+                password, user.password if user is not None else None, on_upgrade=save_upgraded_hash
+            )
+        except PoolFull:
+            if request is not None:
+                request.login_pool_full = True
+            # Stops authenticate() from trying other backends; it returns None and signals a failed login.
+            raise PermissionDenied("Too many concurrent logins.") from None
+        if not valid:
+            return None
+        return user if self.user_can_authenticate(user) else None
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """JWT authentication that trusts the token's user claims instead of loading the User row.
+
+    Tokens issued before the claims were added fall back to the database lookup.
+    """
+
+    def get_user(self, validated_token):
+        """Return a ClaimsUser unless the token has been revoked by a deactivation."""
+        user = user_from_claims(validated_token)
+        if user is None:
+            return super().get_user(validated_token)
+
+        if is_revoked(validated_token):
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
@@ -0,0 +1,98 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import ClaimsUser
+
+USERNAME_CLAIM = "username"
+ROLE_CLAIM = "role"
+STAFF_CLAIM = "is_staff"
+VERSION_CLAIM = "token_version"
+TOKEN_VERSION_CACHE_KEY = "auth:token-version:{user_id}"
+INACTIVE_VERSION = -1
+
+# Changing any of these fields changes what a token would claim, so it revokes the user's tokens.
+CLAIM_FIELDS = ("username", "role", "is_staff", "is_active")
+
+
+def _user_id_claim() -> str:
+    # simplejwt's settings module imports django.test; keep it out of django.setup().
+    from rest_framework_simplejwt.settings import api_settings
+
+    return api_settings.USER_ID_CLAIM
+
+
+def add_user_claims(token, user) -> None:
+    """Embed what permission checks need so requests can skip the User lookup."""
+    token[USERNAME_CLAIM] = user.username
+    token[ROLE_CLAIM] = user.role
+    token[STAFF_CLAIM] = user.is_staff
+    token[VERSION_CLAIM] = user.token_version
+    publish_token_version(user)
+
+
+def user_from_claims(token) -> ClaimsUser | None:
+    """Build a lightweight user from the token, or None for tokens issued without claims."""
+    if VERSION_CLAIM not in token or ROLE_CLAIM not in token:
+        return None
+    return ClaimsUser.from_claims(
+        user_id=token[_user_id_claim()],
+        username=token.get(USERNAME_CLAIM, ""),
+        role=token[ROLE_CLAIM],
+        is_staff=token.get(STAFF_CLAIM, False),
+    )
+
+
+def _version_key(user_id) -> str:
+    return TOKEN_VERSION_CACHE_KEY.format(user_id=user_id)
+
+
+def _current_version(row) -> int:
+    # A deleted or inactive user has no valid version; every token of theirs is revoked.
+    if row is None or not row[1]:
+        return INACTIVE_VERSION
+    return row[0]
+
+
+def publish_token_version(user) -> None:
+    """Cache the user's current token version, as read from their row."""
+    current = user.token_version if user.is_active else INACTIVE_VERSION
+    cache.set(_version_key(user.pk), current, timeout=settings.AUTH_TOKEN_VERSION_CACHE_SECONDS)
+
+
+def forget_token_versions(user_ids) -> None:
+    """Drop cached versions so the next request reads them from the database."""
+    cache.delete_many([_version_key(user_id) for user_id in user_ids])
+
+
+def _is_stale(token, current: int) -> bool:
+    return current == INACTIVE_VERSION or token[VERSION_CLAIM] < current
+
+
+def is_revoked(token) -> bool:
+    """Check the token's version against the user's current ``token_version``.
+
+    The version is read from the database and cached for
+    ``AUTH_TOKEN_VERSION_CACHE_SECONDS``; a missing or evicted entry costs one query.
+    """
+    from django.contrib.auth import get_user_model
+
+    user_id = token[_user_id_claim()]
+    current = cache.get(_version_key(user_id))
+    if current is None:
+        row = get_user_model().objects.filter(pk=user_id).values_list("token_version", "is_active").first()
+        current = _current_version(row)
+        cache.set(_version_key(user_id), current, timeout=settings.AUTH_TOKEN_VERSION_CACHE_SECONDS)
+    return _is_stale(token, current)
+
+
+async def ais_revoked(token) -> bool:
+    """Async variant of `is_revoked`."""
+    from django.contrib.auth import get_user_model
+
+    user_id = token[_user_id_claim()]
+    current = await cache.aget(_version_key(user_id))
+    if current is None:
+        row = await get_user_model().objects.filter(pk=user_id).values_list("token_version", "is_active").afirst()
+        current = _current_version(row)
+        await cache.aset(_version_key(user_id), current, timeout=settings.AUTH_TOKEN_VERSION_CACHE_SECONDS)
+    return _is_stale(token, current)
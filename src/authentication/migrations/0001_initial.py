@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-19 05:56
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("users", "0002_user_token_version"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ClaimsUser",
+            fields=[],
+            options={
+                "proxy": True,
+                "indexes": [],
+                "constraints": [],
+            },
+            bases=("users.user",),
+        ),
+    ]
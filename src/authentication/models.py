@@ -0,0 +1,29 @@
+from django.db import DEFAULT_DB_ALIAS
+
+from users.models import User
+
+
+class ClaimsUser(User):
+    """Read-only user rebuilt from access token claims, without a database query.
+
+    It is a real ``User`` instance, so it can be assigned to foreign keys and
+    used in filters, but only ``id``, ``username``, ``role`` and ``is_staff`` are
+    populated. Load the ``User`` row before reading or saving anything else.
+    """
+
+    class Meta:
+        proxy = True
+
+    @classmethod
+    def from_claims(cls, user_id, username: str, role: str, is_staff: bool = False) -> "ClaimsUser":
+        """Build an instance that looks like a row loaded from the database."""
+        user = cls(id=user_id, username=username, role=role, is_staff=is_staff, is_active=True)
+        user._state.adding = False
+        user._state.db = DEFAULT_DB_ALIAS
+        return user
+
+    def save(self, *args, **kwargs):
+        raise TypeError("ClaimsUser is built from token claims and cannot be saved; load the User row instead.")
+
+    def delete(self, *args, **kwargs):
+        raise TypeError("ClaimsUser is built from token claims and cannot be deleted; load the User row instead.")
@@ -0,0 +1,117 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, identify_hasher, make_password
+from django.utils.crypto import get_random_string
+from rest_framework import exceptions, status
+
+from users.hashing import setup_hashing_worker
+
+
+class PoolFull(Exception):
+    """Raised by ``PasswordVerifier.verify`` when no verification slot is free in time."""
+
+
+class LoginCapacityExceeded(exceptions.APIException):
+    """Raised by the API login when the login pool is full; rendered as 503 with Retry-After."""
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Too many concurrent logins, please retry shortly."
+    default_code = "login_capacity_exceeded"
+
+    def __init__(self, detail=None, code=None):
+        super().__init__(detail, code)
+        # DRF's exception handler turns `wait` into a Retry-After header.
+        self.wait = settings.LOGIN_RETRY_AFTER
+
+
+class PasswordVerifier:
+    """Runs password checks in a dedicated, bounded process pool.
+
+    At most ``LOGIN_HASH_WORKERS + LOGIN_QUEUE_SIZE`` verifications may be in
+    flight per server process; further logins are rejected immediately instead
+    of queueing behind CPU-bound hashing. With ``LOGIN_HASH_WORKERS = 0`` checks
+    run inline, which is meant for development and tests.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pool = None
+        self._slots = None
+        self._dummy_hash = None
+
+    def verify(self, password: str, encoded: str | None, on_upgrade=None) -> bool:
+        """Check a password against its hash; a missing hash still costs one hash run.
+
+        Raises ``PoolFull`` when every slot is taken or the check times out.
+        When the password is right but its hash uses outdated hasher settings,
+        ``on_upgrade`` is called with a new hash computed in the pool.
+        """
+        slots = self._get_slots()
+        if not slots.acquire(blocking=False):
+            raise PoolFull()
+        try:
+            pool = self._get_pool()
+            if pool is None:
+                valid, upgraded = check_and_upgrade(password, encoded or self._get_dummy_hash())
+            else:
+                future = pool.submit(check_and_upgrade, password, encoded or self._get_dummy_hash())
+        except BaseException:
+            slots.release()
+            raise
+
+        if pool is None:
+            slots.release()
+        else:
+            # The slot is held until the hashing itself is done, even if this request stops waiting for it.
+            future.add_done_callback(lambda _: slots.release())
+            try:
+                valid, upgraded = future.result(timeout=settings.LOGIN_HASH_TIMEOUT)
+            except FutureTimeoutError:
+                raise PoolFull() from None
+
+        if valid and upgraded and encoded and on_upgrade is not None:
+            on_upgrade(upgraded)
+        return valid
+
+    def _get_slots(self):
+        if self._slots is None:
+            with self._lock:
+                if self._slots is None:
+                    self._slots = threading.BoundedSemaphore(settings.LOGIN_HASH_WORKERS + settings.LOGIN_QUEUE_SIZE)
+        return self._slots
+
+    def _get_pool(self):
+        if settings.LOGIN_HASH_WORKERS <= 0:
+            return None
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=settings.LOGIN_HASH_WORKERS,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=setup_hashing_worker,
+                    )
+        return self._pool
+
+    def _get_dummy_hash(self) -> str:
+        if self._dummy_hash is None:
+            self._dummy_hash = make_password(get_random_string(32))
+        return self._dummy_hash
+
+
+def check_and_upgrade(password: str, encoded: str) -> tuple[bool, str | None]:
+    """Check a password and, if its hash is outdated, return a fresh hash; runs in the login pool."""
+    if not check_password(password, encoded):
+        return False, None
+    try:
+        outdated = identify_hasher(encoded).must_update(encoded)
+    except ValueError:
+        outdated = False
+    return True, make_password(password) if outdated else None
+
+
+verifier = PasswordVerifier()
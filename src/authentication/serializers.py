@@ -0,0 +1,31 @@
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer as BaseTokenObtainPairSerializer
+
+from .claims import add_user_claims
+from .password_pool import LoginCapacityExceeded
+
+
+class TokenObtainPairSerializer(BaseTokenObtainPairSerializer):
+    """Token pair serializer embedding the user claims used by ClaimsJWTAuthentication.
+
+    Credentials go through ``authenticate()``, where ``PooledModelBackend``
+    verifies the password in the bounded login pool so bursts of logins cannot
+    pin the API's worker threads on hashing. A full pool is answered with 503
+    and ``Retry-After`` rather than 401.
+    """
+
+    def validate(self, attrs):
+        """Issue the token pair, or raise ``LoginCapacityExceeded`` if the login pool was full."""
+        try:
+            return super().validate(attrs)
+        except AuthenticationFailed:
+            if getattr(self.context.get("request"), "login_pool_full", False):
+                raise LoginCapacityExceeded() from None
+            raise
+
+    @classmethod
+    def get_token(cls, user):
+        """Add username, role, staff flag and token version to the refresh and access tokens."""
+        token = super().get_token(user)
+        add_user_claims(token, user)
+        return token
@@ -0,0 +1,28 @@
+from django.contrib.auth import get_user_model
+
+from .claims import CLAIM_FIELDS, publish_token_version
+
+User = get_user_model()
+
+
+def bump_token_version_on_claims_change(sender, instance, update_fields=None, **kwargs):
+    """Invalidate outstanding access tokens when a field baked into their claims changes."""
+    instance._token_version_bumped = False
+    if instance.pk is None:
+        return
+    fields = CLAIM_FIELDS if update_fields is None else [name for name in CLAIM_FIELDS if name in update_fields]
+    if not fields:
+        return
+    stored = User.objects.filter(pk=instance.pk).values(*fields).first()
+    if stored is not None and any(stored[name] != getattr(instance, name) for name in fields):
+        instance.token_version += 1
+        instance._token_version_bumped = True
+
+
+def publish_token_revocation(sender, instance, created, update_fields=None, **kwargs):
+    """Persist a bump the save did not write, and push the new token version to the cache."""
+    if not getattr(instance, "_token_version_bumped", False):
+        return
+    if update_fields is not None and "token_version" not in update_fields:
+        User.objects.filter(pk=instance.pk).update(token_version=instance.token_version)
+    publish_token_version(instance)
@@ -0,0 +1,143 @@
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from authentication.models import ClaimsUser
+from authentication.serializers import TokenObtainPairSerializer
+from courses.tests.factories import CourseFactory, StudentFactory, TeacherFactory
+
+User = get_user_model()
+
+
+def _claims_client(user) -> APIClient:
+    client = APIClient()
+    access = TokenObtainPairSerializer.get_token(user).access_token
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+    return client
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.django_db
+class TestClaimsJWTAuthentication:
+    def test_token_carries_user_claims(self):
+        teacher = TeacherFactory()
+
+        access = TokenObtainPairSerializer.get_token(teacher).access_token
+
+        assert access["username"] == teacher.username
+        assert access["role"] == "TEACHER"
+        assert access["token_version"] == 0
+
+    def test_authenticates_without_queries(self, django_assert_num_queries):
+        client = _claims_client(StudentFactory())
+
+        with django_assert_num_queries(0):
+            response = client.get("/api/v1/lectures/")
+
+        assert response.status_code == 200
+
+    def test_claims_user_can_create_objects(self):
+        teacher = TeacherFactory()
+
+        response = _claims_client(teacher).post("/api/v1/courses/", {"title": "Claims", "description": ""})
+
+        assert response.status_code == 201
+        assert response.data["created_by"]["id"] == teacher.id
+
+    def test_role_permission_uses_claims(self):
+        response = _claims_client(StudentFactory()).post("/api/v1/courses/", {"title": "Nope"})
+        assert response.status_code == 403
+
+    def test_deactivation_revokes_outstanding_tokens(self):
+        student = StudentFactory()
+        client = _claims_client(student)
+
+        student.is_active = False
+        student.save()
+
+        student.refresh_from_db()
+        assert student.token_version == 1
+        assert client.get("/api/v1/lectures/").status_code == 401
+
+    @pytest.mark.parametrize("field, value", [("role", "STUDENT"), ("is_staff", True), ("username", "renamed")])
+    def test_claim_change_revokes_outstanding_tokens(self, field, value):
+        teacher = TeacherFactory()
+        client = _claims_client(teacher)
+
+        setattr(teacher, field, value)
+        teacher.save(update_fields=[field])
+
+        teacher.refresh_from_db()
+        assert teacher.token_version == 1
+        assert client.get("/api/v1/lectures/").status_code == 401
+        assert _claims_client(teacher).get("/api/v1/lectures/").status_code == 200
+
+    def test_unrelated_change_keeps_tokens(self):
+        student = StudentFactory()
+        client = _claims_client(student)
+
+        student.first_name = "Renamed"
+        student.save()
+
+        student.refresh_from_db()
+        assert student.token_version == 0
+        assert client.get("/api/v1/lectures/").status_code == 200
+
+    def test_queryset_update_revokes_outstanding_tokens(self):
+        student = StudentFactory()
+        client = _claims_client(student)
+
+        User.objects.filter(pk=student.pk).update(is_active=False)
+
+        student.refresh_from_db()
+        assert student.token_version == 1
+        assert client.get("/api/v1/lectures/").status_code == 401
+
+    def test_revocation_survives_cache_flush(self):
+        student = StudentFactory()
+        client = _claims_client(student)
+        student.role = "TEACHER"
+        student.save()
+
+        cache.clear()
+
+        assert client.get("/api/v1/lectures/").status_code == 401
+
+    def test_token_version_is_read_once_after_cache_flush(self, django_assert_num_queries):
+        client = _claims_client(StudentFactory())
+        cache.clear()
+
+        with django_assert_num_queries(1):
+            assert client.get("/api/v1/lectures/").status_code == 200
+        with django_assert_num_queries(0):
+            assert client.get("/api/v1/lectures/").status_code == 200
+
+    def test_legacy_token_falls_back_to_database(self):
+        student = StudentFactory()
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(student)}")
+
+        assert client.get("/api/v1/lectures/").status_code == 200
+
+    def test_me_endpoint_loads_full_user(self):
+        student = StudentFactory()
+
+        response = _claims_client(student).get("/api/v1/users/me")
+
+        assert response.data["email"] == student.email
+
+    def test_claims_user_cannot_be_saved(self):
+        course = CourseFactory()
+        user = ClaimsUser.from_claims(user_id=course.created_by_id, username="x", role="TEACHER")
+
+        assert course.teachers.filter(id=user.id).exists()
+        with pytest.raises(TypeError):
+            user.save()
@@ -0,0 +1,130 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+from django.test import Client, RequestFactory
+from rest_framework.test import APIClient
+
+from authentication.password_pool import PasswordVerifier, PoolFull, verifier
+from courses.tests.factories import StudentFactory
+
+LOGIN_URL = "/api/v1/auth/jwt/create"
+
+
+@pytest.fixture
+def inline_hashing(settings):
+    settings.LOGIN_HASH_WORKERS = 0
+
+
+@pytest.mark.django_db
+class TestPooledLogin:
+    def test_valid_credentials_issue_tokens(self, inline_hashing):
+        student = StudentFactory()
+
+        response = APIClient().post(LOGIN_URL, {"username": student.username, "password": "testpass123"})
+
+        assert response.status_code == 200
+        assert {"access", "refresh"} <= set(response.data)
+
+    def test_wrong_password_is_rejected(self, inline_hashing):
+        student = StudentFactory()
+
+        response = APIClient().post(LOGIN_URL, {"username": student.username, "password": "nope"})
+
+        assert response.status_code == 401
+
+    def test_unknown_user_is_rejected(self, inline_hashing):
+        response = APIClient().post(LOGIN_URL, {"username": "ghost", "password": "testpass123"})
+        assert response.status_code == 401
+
+    def test_full_queue_returns_503_with_retry_after(self, inline_hashing, settings, monkeypatch):
+        settings.LOGIN_RETRY_AFTER = 3
+        monkeypatch.setattr(verifier, "_slots", threading.BoundedSemaphore(1))
+        verifier._slots.acquire()
+        student = StudentFactory()
+
+        response = APIClient().post(LOGIN_URL, {"username": student.username, "password": "testpass123"})
+
+        assert response.status_code == 503
+        assert response["Retry-After"] == "3"
+
+    def test_full_queue_fails_plain_authenticate(self, inline_hashing, monkeypatch):
+        from django.contrib.auth import authenticate
+
+        monkeypatch.setattr(verifier, "_slots", threading.BoundedSemaphore(1))
+        verifier._slots.acquire()
+        student = StudentFactory()
+        request = RequestFactory().post("/admin/login/")
+
+        assert authenticate(request, username=student.username, password="testpass123") is None
+        assert request.login_pool_full is True
+
+    def test_admin_login_with_full_queue_is_a_failed_login(self, inline_hashing, monkeypatch):
+        monkeypatch.setattr(verifier, "_slots", threading.BoundedSemaphore(1))
+        verifier._slots.acquire()
+        admin = StudentFactory(is_staff=True, is_superuser=True)
+
+        response = Client().post("/admin/login/", {"username": admin.username, "password": "testpass123"})
+
+        assert response.status_code == 200
+        assert not response.wsgi_request.user.is_authenticated
+
+    def test_outdated_hash_is_upgraded(self, inline_hashing):
+        from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+        student = StudentFactory()
+        student.password = PBKDF2PasswordHasher().encode("testpass123", "saltsalt", iterations=1000)
+        student.save(update_fields=["password"])
+
+        response = APIClient().post(LOGIN_URL, {"username": student.username, "password": "testpass123"})
+
+        student.refresh_from_db()
+        assert response.status_code == 200
+        assert student.password.startswith("pbkdf2_sha256$")
+        assert student.check_password("testpass123")
+
+    def test_failed_login_sends_signal(self, inline_hashing):
+        from django.contrib.auth.signals import user_login_failed
+
+        failures = []
+
+        def record(sender, credentials, **kwargs):
+            failures.append(credentials["username"])
+
+        user_login_failed.connect(record)
+        student = StudentFactory()
+        try:
+            APIClient().post(LOGIN_URL, {"username": student.username, "password": "nope"})
+        finally:
+            user_login_failed.disconnect(record)
+
+        assert failures == [student.username]
+
+
+def test_slot_is_held_until_hashing_finishes(settings, monkeypatch):
+    from concurrent.futures import Future
+
+    settings.LOGIN_HASH_TIMEOUT = 0.01
+    pending = Future()
+    pool_verifier = PasswordVerifier()
+    monkeypatch.setattr(pool_verifier, "_get_pool", lambda: SimpleNamespace(submit=lambda *args: pending))
+    monkeypatch.setattr(pool_verifier, "_slots", threading.BoundedSemaphore(1))
+
+    with pytest.raises(PoolFull):
+        pool_verifier.verify("secret", "pbkdf2_sha256$1$salt$hash")
+    assert not pool_verifier._slots.acquire(blocking=False)
+
+    pending.set_result((False, None))
+    assert pool_verifier._slots.acquire(blocking=False)
+
+
+def test_verifier_checks_in_process_pool(settings):
+    from django.contrib.auth.hashers import make_password
+
+    settings.LOGIN_HASH_WORKERS = 1
+    pool_verifier = PasswordVerifier()
+    encoded = make_password("secret")
+
+    assert pool_verifier.verify("secret", encoded) is True
+    assert pool_verifier.verify("wrong", encoded) is False
+    pool_verifier._pool.shutdown()
@@ -0,0 +1,8 @@
+import pytest
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache, so throttle buckets never carry over between tests."""
+    cache.clear()
@@ -0,0 +1,22 @@
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    """Configuration class for the core app (cross-cutting infrastructure)."""
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "core"
+
+    def ready(self):
+        """Connect the database instrumentation signal handlers."""
+        from django.db.backends.signals import connection_created
+
+        from .db import track_connection_age
+        from .querystats import install_query_stats
+        from .timing import install_query_timer
+        from .tracing import install_query_tracer
+
+        connection_created.connect(track_connection_age, dispatch_uid="core.track_connection_age")
+        connection_created.connect(install_query_timer, dispatch_uid="core.install_query_timer")
+        connection_created.connect(install_query_tracer, dispatch_uid="core.install_query_tracer")
+        connection_created.connect(install_query_stats, dispatch_uid="core.install_query_stats")
@@ -0,0 +1,37 @@
+from django.core.cache.backends.locmem import LocMemCache as DjangoLocMemCache
+from django.core.cache.backends.redis import RedisCache as DjangoRedisCache
+
+from .metrics import CACHE_LOOKUPS
+
+_MISSING = object()
+
+
+class InstrumentedCacheMixin:
+    """Count cache hits and misses for the ``ocms_cache_lookups_total`` metric."""
+
+    def get(self, key, default=None, version=None):
+        value = super().get(key, _MISSING, version)
+        self._count_lookups(hits=int(value is not _MISSING), total=1)
+        return default if value is _MISSING else value
+
+    def _count_lookups(self, hits: int, total: int) -> None:
+        backend = type(self).__name__
+        if hits:
+            CACHE_LOOKUPS.labels(backend, "hit").inc(hits)
+        if total - hits:
+            CACHE_LOOKUPS.labels(backend, "miss").inc(total - hits)
+
+
+class LocMemCache(InstrumentedCacheMixin, DjangoLocMemCache):
+    """Local-memory cache with hit/miss metrics."""
+
+
+class RedisCache(InstrumentedCacheMixin, DjangoRedisCache):
+    """Redis cache with hit/miss metrics."""
+
+    def get_many(self, keys, version=None):
+        # Redis fetches all keys in one MGET instead of going through get().
+        keys = list(keys)
+        found = super().get_many(keys, version)
+        self._count_lookups(hits=len(found), total=len(keys))
+        return found
@@ -0,0 +1,149 @@
+"""Content-encoding negotiation and compressors for ``CompressionMiddleware``.
+
+gzip is always available; ``br`` needs the ``brotli`` package and ``zstd``
+the ``zstandard`` package, and are simply not offered when missing.
+"""
+
+import zlib
+
+from django.conf import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional codec
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional codec
+    zstandard = None
+
+# Media types worth compressing; images, archives and the like already are.
+_COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "application/vnd.oai.openapi",
+)
+_COMPRESSIBLE_SUFFIXES = ("+json", "+xml", "yaml")
+
+
+class GzipCompressor:
+    encoding = "gzip"
+
+    def __init__(self):
+        self._compressor = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliCompressor:
+    encoding = "br"
+
+    def __init__(self):
+        self._compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdCompressor:
+    encoding = "zstd"
+
+    def __init__(self):
+        self._compressor = zstandard.ZstdCompressor(level=settings.COMPRESSION_ZSTD_LEVEL).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+def available_compressors() -> dict[str, type]:
+    """Return the usable compressors by encoding, in ``COMPRESSION_ENCODINGS`` preference order."""
+    known = {"gzip": GzipCompressor}
+    if brotli is not None:
+        known["br"] = BrotliCompressor
+    if zstandard is not None:
+        known["zstd"] = ZstdCompressor
+    return {encoding: known[encoding] for encoding in settings.COMPRESSION_ENCODINGS if encoding in known}
+
+
+def parse_accept_encoding(header: str) -> dict[str, float]:
+    """Parse ``Accept-Encoding`` into ``{coding: q}``; malformed q-values count as 0."""
+    accepted = {}
+    for item in header.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+def negotiate(header: str, compressors: dict[str, type]) -> type | None:
+    """Pick the compressor the client accepts with the highest q, preferring earlier ones on ties."""
+    if not header:
+        return None
+    accepted = parse_accept_encoding(header)
+    wildcard = accepted.get("*", 0.0)
+    best, best_q = None, 0.0
+    for encoding, compressor in compressors.items():
+        q = accepted.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = compressor, q
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    """Whether responses of this media type benefit from compression."""
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type.startswith(_COMPRESSIBLE_TYPES) or media_type.endswith(_COMPRESSIBLE_SUFFIXES)
+
+
+def compress_sequence(compressor, chunks):
+    """Compress an iterable of chunks incrementally, yielding output as it is produced.
+
+    Each chunk is flushed, as Django's ``compress_sequence`` does, so the client
+    can decode it without waiting for the rest of the stream.
+    """
+    for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+async def acompress_sequence(compressor, chunks):
+    """Async variant of `compress_sequence` for async streaming responses."""
+    async for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
@@ -0,0 +1,87 @@
+import threading
+import time
+
+from django.db import connections
+
+_MAX_TRACKED_CONNECTIONS = 256
+
+_births: dict[tuple[str, object], float] = {}
+_births_lock = threading.Lock()
+
+
+def _backend_id(connection):
+    """Identify the physical connection behind a Django wrapper."""
+    raw = connection.connection
+    info = getattr(raw, "info", None)
+    if info is not None and hasattr(info, "backend_pid"):
+        return info.backend_pid
+    return id(raw)
+
+
+def track_connection_age(sender, connection, **kwargs):
+    """Remember when each physical connection was first handed to Django.
+
+    With pooling, ``connection_created`` fires on every checkout, so the first
+    sighting of a backend is taken as its birth.
+    """
+    settings_dict = connection.settings_dict
+    if not settings_dict.get("OPTIONS", {}).get("pool") and settings_dict.get("CONN_MAX_AGE") == 0:
+        return  # a fresh connection per request has no meaningful age
+
+    key = (connection.alias, _backend_id(connection))
+    now = time.monotonic()
+    with _births_lock:
+        _births.setdefault(key, now)
+        if len(_births) > _MAX_TRACKED_CONNECTIONS:
+            for stale in sorted(_births, key=_births.get)[: len(_births) - _MAX_TRACKED_CONNECTIONS]:
+                del _births[stale]
+
+
+def _connection_ages(alias: str, max_lifetime: float | None) -> list[float]:
+    now = time.monotonic()
+    with _births_lock:
+        if max_lifetime:
+            # The pool retires connections after max_lifetime (plus up to 5% jitter).
+            for key in [key for key, born in _births.items() if key[0] == alias and now - born > max_lifetime * 1.05]:
+                del _births[key]
+        return [now - born for (key_alias, _), born in _births.items() if key_alias == alias]
+
+
+def pool_stats() -> dict[str, dict]:
+    """Return connection pool and connection age metrics for every database alias."""
+
+    stats = {}
+    for connection in connections.all():
+        pool = getattr(connection, "pool", None)
+        entry = {"pooled": pool is not None, "conn_max_age": connection.settings_dict.get("CONN_MAX_AGE")}
+        max_lifetime = entry["conn_max_age"] or None
+
+        if pool is not None:
+            pool_data = pool.get_stats()
+            max_lifetime = pool.max_lifetime
+            requests_queued = pool_data.get("requests_queued", 0)
+            entry.update(
+                {
+                    "pool_min": pool_data.get("pool_min"),
+                    "pool_max": pool_data.get("pool_max"),
+                    "pool_size": pool_data.get("pool_size", 0),
+                    "pool_available": pool_data.get("pool_available", 0),
+                    "requests_waiting": pool_data.get("requests_waiting", 0),
+                    "requests_num": pool_data.get("requests_num", 0),
+                    "requests_queued": requests_queued,
+                    "requests_wait_ms": pool_data.get("requests_wait_ms", 0),
+                    "requests_wait_ms_avg": pool_data.get("requests_wait_ms", 0) / requests_queued
+                    if requests_queued
+                    else 0.0,
+                    "requests_errors": pool_data.get("requests_errors", 0),
+                    "connections_num": pool_data.get("connections_num", 0),
+                    "connections_lost": pool_data.get("connections_lost", 0),
+                    "max_lifetime": max_lifetime,
+                }
+            )
+
+        ages = _connection_ages(connection.alias, max_lifetime)
+        entry["connection_age_max_seconds"] = max(ages, default=0.0)
+        entry["connection_age_avg_seconds"] = sum(ages) / len(ages) if ages else 0.0
+        stats[connection.alias] = entry
+    return stats
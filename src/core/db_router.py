@@ -0,0 +1,77 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+REPLICA_DB_ALIAS = "replica"
+PIN_CACHE_KEY = "db:primary-pin:{user_id}"
+
+
+@dataclass
+class RoutingState:
+    """Per-request routing decision shared with the router through a context variable."""
+
+    use_replica: bool = False
+    wrote: bool = False
+
+
+_routing_state: ContextVar[RoutingState | None] = ContextVar("db_routing_state", default=None)
+
+
+def replica_configured() -> bool:
+    """Check whether a read replica alias is configured."""
+    return REPLICA_DB_ALIAS in settings.DATABASES
+
+
+@contextmanager
+def routing_context():
+    """Scope a routing state to the current request; reads default to the primary."""
+    state = RoutingState()
+    token = _routing_state.set(state)
+    try:
+        yield state
+    finally:
+        _routing_state.reset(token)
+
+
+def pin_to_primary(user_id) -> None:
+    """Keep the user's reads on the primary for the sticky window after a write."""
+    cache.set(PIN_CACHE_KEY.format(user_id=user_id), 1, timeout=settings.DB_REPLICA_STICKY_SECONDS)
+
+
+def is_pinned_to_primary(user_id) -> bool:
+    """Check whether the user wrote within the sticky window."""
+    return cache.get(PIN_CACHE_KEY.format(user_id=user_id)) is not None
+
+
+class PrimaryReplicaRouter:
+    """Send writes to the primary and opted-in reads to the replica.
+
+    Reads only go to the replica inside a request that enabled it (see
+    ``api.v1.mixins.ReplicaReadMixin``) and only until the first write of that
+    request; everything else, including service-layer writes and management
+    commands, uses the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        state = _routing_state.get()
+        if state is None or not state.use_replica or state.wrote or not replica_configured():
+            return DEFAULT_DB_ALIAS
+        return REPLICA_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        state = _routing_state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        """Primary and replica hold the same data."""
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        """Only migrate the primary; the replica follows it."""
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,158 @@
+"""Non-blocking structured logging.
+
+``BackgroundHandler`` only puts records on a bounded queue; a listener thread
+formats them (``JsonFormatter`` by default) and writes them to the real sink,
+so slow log sinks never add latency to requests. ``RequestIdFilter`` tags every
+record with the id set by ``RequestIdMiddleware`` and ``SamplingFilter`` keeps
+a fraction of INFO/DEBUG records, deciding per request so sampled requests
+keep all their lines.
+"""
+
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import threading
+import zlib
+from contextvars import ContextVar
+from datetime import UTC, datetime
+
+request_id_var: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+# Attributes every LogRecord has; anything else was passed through ``extra``.
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime", "request_id"}
+
+
+def get_request_id() -> str | None:
+    """Return the id of the request being handled, if any."""
+    return request_id_var.get()
+
+
+class RequestIdFilter(logging.Filter):
+    """Add ``record.request_id`` from the current request context."""
+
+    def filter(self, record):
+        record.request_id = request_id_var.get() or "-"
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """Keep only ``rate`` of the records below WARNING; warnings and errors always pass."""
+
+    def __init__(self, rate: float = 1.0):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        if self.rate >= 1 or record.levelno >= logging.WARNING:
+            return True
+        request_id = request_id_var.get()
+        if request_id is None:
+            return random.random() < self.rate
+        return zlib.crc32(request_id.encode()) % 10_000 < self.rate * 10_000
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line, including ``extra`` fields."""
+
+    def format(self, record):
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, UTC).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": request_id_var.get() if getattr(record, "request_id", "-") == "-" else record.request_id,
+            "process": record.process,
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str)
+
+
+class StderrHandler(logging.StreamHandler):
+    """Stream handler that always writes to the current ``sys.stderr``."""
+
+    def __init__(self):
+        logging.Handler.__init__(self)
+
+    @property
+    def stream(self):
+        return sys.stderr
+
+
+class BackgroundHandler(logging.handlers.QueueHandler):
+    """Queue records for a listener thread that formats and writes them.
+
+    Writes to ``filename`` if given, else to stderr. The queue holds at most
+    ``queue_size`` records; when the sink cannot keep up, new records are
+    dropped and counted rather than blocking the caller. The listener is
+    started lazily in each process, so it survives gunicorn's preload fork.
+    """
+
+    def __init__(self, filename: str | None = None, queue_size: int = 10_000):
+        super().__init__(queue.Queue(maxsize=queue_size))
+        self.sink = logging.FileHandler(filename, encoding="utf-8") if filename else StderrHandler()
+        self.dropped = 0
+        self._listener: logging.handlers.QueueListener | None = None
+        self._pid = None
+        self._start_lock = threading.Lock()
+
+    def prepare(self, record):
+        """Resolve the message and exception text now; leave JSON formatting to the listener."""
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def emit(self, record):
+        if self._pid != os.getpid():
+            self._start()
+        super().emit(record)
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._pid == os.getpid():
+                return
+            # After a fork the parent's listener thread does not exist in the child.
+            self.queue = queue.Queue(maxsize=self.queue.maxsize)
+            self.sink.setFormatter(self.formatter or JsonFormatter())
+            self._listener = logging.handlers.QueueListener(self.queue, self.sink, respect_handler_level=True)
+            self._listener.start()
+            self._pid = os.getpid()
+            atexit.register(self.flush_and_stop)
+
+    def flush_and_stop(self) -> None:
+        """Write out everything still queued and stop the listener."""
+        if self._listener is not None and self._pid == os.getpid():
+            self._listener.stop()
+            self._listener = None
+            self._pid = None
+        self.sink.flush()
+
+    def close(self):
+        atexit.unregister(self.flush_and_stop)
+        self.flush_and_stop()
+        self.sink.close()
+        super().close()
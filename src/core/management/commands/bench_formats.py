@@ -0,0 +1,97 @@
+import gzip
+import io
+import time
+from datetime import UTC, datetime, timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework import parsers, renderers
+
+from api.parsers import JSONParser, MessagePackParser
+from api.renderers import JSONRenderer, MessagePackRenderer
+from api.v1.courses.serializers import GradeSerializer, SubmissionSerializer
+from courses.models import Grade, Submission
+
+User = get_user_model()
+
+_TEXT = "The proof follows by induction on n; the base case is immediate and the step uses the lemma. "
+
+
+class Command(BaseCommand):
+    help = "Compare payload size and encode/decode time of JSON and MessagePack for submission and grade lists."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=2000, help="Objects per payload.")
+        parser.add_argument("--repeat", type=int, default=10, help="Timing runs; the best one is reported.")
+
+    def handle(self, *args, **options):
+        if not settings.MSGPACK:
+            raise CommandError("msgpack is not installed (pip install -e .[msgpack]).")
+        formats = [
+            ("json (stdlib)", renderers.JSONRenderer(), parsers.JSONParser()),
+            ("json (orjson)", JSONRenderer(), JSONParser()),
+            ("msgpack", MessagePackRenderer(), MessagePackParser()),
+        ]
+
+        count, repeat = options["count"], max(options["repeat"], 1)
+        payloads = {
+            "SubmissionSerializer": SubmissionSerializer(self.submissions(count), many=True).data,
+            "GradeSerializer": GradeSerializer(self.grades(count), many=True).data,
+        }
+
+        header = f"{'payload':<22} {'format':<14} {'bytes':>10} {'gzip':>9} {'encode ms':>10} {'decode ms':>10}"
+        self.stdout.write(header)
+        for name, data in payloads.items():
+            for label, renderer, parser in formats:
+                body = renderer.render(data)
+                encode = self.best(lambda renderer=renderer: renderer.render(data), repeat)
+                decode = self.best(lambda parser=parser, body=body: parser.parse(io.BytesIO(body)), repeat)
+                self.stdout.write(
+                    f"{name:<22} {label:<14} {len(body):>10} {len(gzip.compress(body)):>9}"
+                    f" {encode * 1000:>10.2f} {decode * 1000:>10.2f}"
+                )
+
+    @staticmethod
+    def best(function, repeat: int) -> float:
+        """Return the fastest of ``repeat`` runs, in seconds."""
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    @staticmethod
+    def users(count: int) -> list:
+        return [User(id=i + 1, username=f"student_{i + 1}", role=User.Roles.STUDENT) for i in range(count)]
+
+    def submissions(self, count: int) -> list[Submission]:
+        """Unsaved submissions shaped like a course's worth of real ones; no database is used."""
+        students = self.users(max(count // 5, 1))
+        start = datetime(2024, 9, 1, tzinfo=UTC)
+        return [
+            Submission(
+                id=i + 1,
+                assignment_id=i % 20 + 1,
+                student=students[i % len(students)],
+                text=_TEXT * (1 + i % 8),
+                submitted_at=start + timedelta(minutes=i, microseconds=i),
+            )
+            for i in range(count)
+        ]
+
+    def grades(self, count: int) -> list[Grade]:
+        teachers = [User(id=10_000 + i, username=f"teacher_{i}", role=User.Roles.TEACHER) for i in range(5)]
+        start = datetime(2024, 9, 8, tzinfo=UTC)
+        return [
+            Grade(
+                id=i + 1,
+                submission_id=i + 1,
+                score=i * 7 % 101,
+                comment=_TEXT[: 20 + i % 70],
+                graded_by=teachers[i % len(teachers)],
+                graded_at=start + timedelta(minutes=i),
+            )
+            for i in range(count)
+        ]
@@ -0,0 +1,25 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from api.schema import SCHEMA_RENDERERS, artifact_path, render_schemas
+
+
+class Command(BaseCommand):
+    help = "Write the OpenAPI schema as fingerprinted YAML and JSON artifacts served by /api/schema/."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output-dir", default=None, help="Target directory (SCHEMA_ARTIFACT_DIR).")
+        parser.add_argument("--format", choices=sorted(SCHEMA_RENDERERS), action="append", help="Only these formats.")
+
+    def handle(self, *args, **options):
+        directory = Path(options["output_dir"] or settings.SCHEMA_ARTIFACT_DIR)
+        directory.mkdir(parents=True, exist_ok=True)
+        formats = options["format"] or sorted(SCHEMA_RENDERERS)
+
+        rendered = render_schemas()
+        for fmt in formats:
+            path = artifact_path(fmt, directory)
+            path.write_bytes(rendered[fmt])
+            self.stdout.write(self.style.SUCCESS(f"Wrote {path} ({len(rendered[fmt])} bytes)"))
@@ -0,0 +1,84 @@
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def parse_importtime(output: str) -> list[tuple[str, int, int, int]]:
+    """Parse ``-X importtime`` output into ``(module, self_us, cumulative_us, depth)`` rows."""
+    rows = []
+    for line in output.splitlines():
+        match = _LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return rows
+
+
+class Command(BaseCommand):
+    help = "Report per-module import time of a fresh process that sets up Django (and loads the URLconf)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top", type=int, default=25, help="Number of modules to list.")
+        parser.add_argument("--sort", choices=["cumulative", "self"], default="cumulative", help="Ranking column.")
+        parser.add_argument("--by-package", action="store_true", help="Sum self time per top-level package.")
+        parser.add_argument("--setup-only", action="store_true", help="Only django.setup(), like most commands.")
+        parser.add_argument("--module", action="append", default=[], help="Extra module to import after setup.")
+        parser.add_argument("--runs", type=int, default=3, help="Runs to take the per-module minimum over.")
+
+    def handle(self, *args, **options):
+        modules = [] if options["setup_only"] else [settings.ROOT_URLCONF]
+        modules += options["module"]
+        code = "import django; django.setup()" + "".join(f"; import {module}" for module in modules)
+
+        runs = [self.measure(code) for _ in range(max(options["runs"], 1))]
+        rows = {}
+        for run in runs:
+            for module, self_us, cumulative_us, depth in run:
+                best = rows.get(module)
+                if best is None or cumulative_us < best[1]:
+                    rows[module] = (self_us, cumulative_us, depth)
+        totals = sorted(sum(cumulative for _, _, cumulative, depth in run if depth == 0) for run in runs)
+
+        target = " + ".join(["django.setup()", *modules])
+        self.stdout.write(f"{target}: {totals[0] / 1000:.1f} ms total imports (best of {len(runs)})")
+
+        if options["by_package"]:
+            packages = defaultdict(int)
+            for module, (self_us, _, _) in rows.items():
+                packages[module.split(".")[0]] += self_us
+            ranked = sorted(packages.items(), key=lambda item: item[1], reverse=True)[: options["top"]]
+            for package, self_us in ranked:
+                self.stdout.write(f"{self_us / 1000:>9.1f} ms  {package}")
+            return
+
+        column = 0 if options["sort"] == "self" else 1
+        ranked = sorted(rows.items(), key=lambda item: item[1][column], reverse=True)[: options["top"]]
+        self.stdout.write(f"{'self ms':>9} {'cumul ms':>9}  module")
+        for module, (self_us, cumulative_us, _) in ranked:
+            self.stdout.write(f"{self_us / 1000:>9.1f} {cumulative_us / 1000:>9.1f}  {module}")
+
+    @staticmethod
+    def measure(code: str) -> list[tuple[str, int, int, int]]:
+        """Run ``code`` in a fresh interpreter with ``-X importtime`` and parse its report."""
+        env = {
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE,
+            "PYTHONPATH": os.pathsep.join(filter(None, [str(settings.BASE_DIR), os.environ.get("PYTHONPATH")])),
+        }
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            env=env,
+            cwd=settings.BASE_DIR,
+        )
+        if result.returncode != 0:
+            raise CommandError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "import failed")
+        return parse_importtime(result.stderr)
@@ -0,0 +1,43 @@
+import shutil
+import textwrap
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.querystats import load_stats
+
+SORT_KEYS = ("total", "p95", "max", "calls")
+
+
+class Command(BaseCommand):
+    help = "Print the SQL fingerprints with the highest total (or p95/max/calls) time across all workers."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--top", type=int, default=20, help="Number of fingerprints to show.")
+        parser.add_argument("--sort", choices=SORT_KEYS, default="total", help="Ranking metric.")
+        parser.add_argument("--dir", default=None, help="Statistics directory (QUERY_STATS_DIR).")
+        parser.add_argument("--plans", action="store_true", help="Show captured plans of slow queries.")
+        parser.add_argument("--reset", action="store_true", help="Delete the collected statistics afterwards.")
+
+    def handle(self, *args, **options):
+        directory = options["dir"] or settings.QUERY_STATS_DIR
+        stats = load_stats(directory)
+        if not stats:
+            self.stdout.write(f"No query statistics in {directory}. Is QUERY_STATS=1?")
+            return
+
+        ranked = sorted(stats.items(), key=lambda item: item[1][options["sort"]], reverse=True)[: options["top"]]
+        self.stdout.write(
+            f"{'fingerprint':<12} {'calls':>8} {'total ms':>10} {'avg ms':>8} {'p95 ms':>8} {'max ms':>8}  sql"
+        )
+        for key, stat in ranked:
+            self.stdout.write(
+                f"{key:<12} {stat['calls']:>8} {stat['total'] * 1000:>10.1f} "
+                f"{stat['total'] * 1000 / stat['calls']:>8.2f} {stat['p95'] * 1000:>8.2f} {stat['max'] * 1000:>8.2f}  "
+                f"{textwrap.shorten(stat['sql'], 100)}"
+            )
+            if options["plans"] and stat["plan"]:
+                self.stdout.write(textwrap.indent(stat["plan"], "    "))
+
+        if options["reset"]:
+            shutil.rmtree(directory, ignore_errors=True)
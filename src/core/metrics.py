@@ -0,0 +1,115 @@
+"""Prometheus metrics for the API.
+
+Under gunicorn every worker writes its samples to ``PROMETHEUS_MULTIPROC_DIR``
+(set up by ``ocms/gunicorn.py``) and ``/metrics`` aggregates all of them, so a
+scrape sees the whole server whichever worker answers it. Without that
+variable, as in development and tests, the in-process registry is used.
+"""
+
+import os
+import threading
+import time
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+REQUEST_LATENCY = Histogram(
+    "ocms_http_request_duration_seconds",
+    "Time spent handling a request, by view and action.",
+    ["view", "action", "method"],
+)
+REQUESTS = Counter("ocms_http_requests_total", "Handled requests by method and status code.", ["method", "status"])
+REQUEST_QUERIES = Histogram(
+    "ocms_http_request_queries",
+    "Database queries per request, by view and action.",
+    ["view", "action"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144),
+)
+CACHE_LOOKUPS = Counter(
+    "ocms_cache_lookups_total", "Cache lookups by backend and result (hit or miss).", ["backend", "result"]
+)
+
+DB_POOL_SIZE = Gauge("ocms_db_pool_size", "Open pooled connections.", ["alias"], multiprocess_mode="livesum")
+DB_POOL_AVAILABLE = Gauge("ocms_db_pool_available", "Idle pooled connections.", ["alias"], multiprocess_mode="livesum")
+DB_POOL_WAITING = Gauge(
+    "ocms_db_pool_requests_waiting", "Requests waiting for a pooled connection.", ["alias"], multiprocess_mode="livesum"
+)
+DB_CONNECTION_AGE = Gauge(
+    "ocms_db_connection_age_max_seconds",
+    "Age of the oldest database connection.",
+    ["alias"],
+    multiprocess_mode="livemax",
+)
+
+SUBMISSIONS_CREATED = Counter("ocms_submissions_created_total", "Homework submissions created.")
+GRADES_CREATED = Counter("ocms_grades_created_total", "Grades created.")
+ENROLLMENTS = Counter("ocms_enrollments_total", "Students enrolled into courses.")
+
+# Any other verb a client sends is labelled "other", so it cannot create new series.
+_HTTP_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS", "TRACE", "CONNECT"})
+
+_POOL_REFRESH_SECONDS = 1.0
+_pool_refreshed_at = 0.0
+_pool_lock = threading.Lock()
+
+
+def refresh_pool_gauges(force: bool = False) -> None:
+    """Copy this worker's pool statistics into the gauges, at most once a second."""
+    global _pool_refreshed_at
+    now = time.monotonic()
+    if not force and now - _pool_refreshed_at < _POOL_REFRESH_SECONDS:
+        return
+    if not _pool_lock.acquire(blocking=False):
+        return
+    try:
+        from .db import pool_stats
+
+        _pool_refreshed_at = now
+        for alias, stats in pool_stats().items():
+            DB_POOL_SIZE.labels(alias).set(stats.get("pool_size", 0))
+            DB_POOL_AVAILABLE.labels(alias).set(stats.get("pool_available", 0))
+            DB_POOL_WAITING.labels(alias).set(stats.get("requests_waiting", 0))
+            DB_CONNECTION_AGE.labels(alias).set(stats["connection_age_max_seconds"])
+    finally:
+        _pool_lock.release()
+
+
+def method_label(request) -> str:
+    """Return the method label of a request: the method if it is a standard HTTP one, else ``"other"``."""
+    return request.method if request.method in _HTTP_METHODS else "other"
+
+
+def view_labels(request) -> tuple[str, str]:
+    """Return the (view, action) labels for a request, e.g. ``("CourseViewSet", "list")``."""
+    method = method_label(request).lower()
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unmatched", method
+    view_class = getattr(match.func, "cls", None) or getattr(match.func, "view_class", None)
+    view = view_class.__name__ if view_class is not None else match.view_name or match.func.__name__
+    actions = getattr(match.func, "actions", None) or {}
+    return view, actions.get(method, method)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Serialize the metrics of every worker (or of this process) in text exposition format."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_process_dead(pid: int) -> None:
+    """Drop the live gauges of an exited worker."""
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,303 @@
+import logging
+import re
+import time
+import uuid
+from contextlib import nullcontext
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.cache import patch_vary_headers
+
+from .compression import acompress_sequence, available_compressors, compress_sequence, is_compressible, negotiate
+from .logs import request_id_var
+from .metrics import REQUEST_LATENCY, REQUEST_QUERIES, REQUESTS, method_label, refresh_pool_gauges, view_labels
+from .timing import current_timings, measure, timing_context
+from .tracing import SPAN_KIND_SERVER, STATUS_ERROR, parse_traceparent, span
+
+logger = logging.getLogger(__name__)
+
+_REGEX_GROUP = re.compile(r"\(\?P<(\w+)>[^)]*\)")
+_REQUEST_ID = re.compile(r"[A-Za-z0-9._-]{1,64}")
+
+
+def route_template(request) -> str | None:
+    """Return the matched URL route as a low-cardinality template like ``/api/v1/courses/{pk}/``."""
+    match = getattr(request, "resolver_match", None)
+    if match is None or not match.route:
+        return None
+    return "/" + _REGEX_GROUP.sub(r"{\1}", match.route).replace("^", "").replace("$", "")
+
+
+class ServerTimingMiddleware:
+    """Emit a ``Server-Timing`` header with the per-phase breakdown of each request.
+
+    The middleware opens the timing context and records ``db`` and ``total``;
+    API views using ``ServerTimingMixin`` add ``auth``, ``perm``, ``serialize``
+    and ``render``. ``SERVER_TIMING`` chooses who gets the header: nobody
+    (``"0"``), staff users (``"staff"``) or everyone (``"1"``). With
+    ``SERVER_TIMING_LOG`` the breakdown is also logged.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if settings.SERVER_TIMING == "0" and not settings.SERVER_TIMING_LOG:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with timing_context() as timings:
+            start = time.perf_counter()
+            response = self.get_response(request)
+            timings.add("total", time.perf_counter() - start)
+        return self.finish(request, response, timings)
+
+    async def __acall__(self, request):
+        with timing_context() as timings:
+            start = time.perf_counter()
+            response = await self.get_response(request)
+            timings.add("total", time.perf_counter() - start)
+        return self.finish(request, response, timings)
+
+    def finish(self, request, response, timings):
+        """Attach the header for the callers allowed to see it and, if enabled, log the breakdown."""
+        if self.shows_header(request):
+            response["Server-Timing"] = timings.header_value()
+        if settings.SERVER_TIMING_LOG:
+            breakdown = timings.as_dict()
+            logger.info(
+                "%s %s %s %s",
+                request.method,
+                request.path,
+                response.status_code,
+                " ".join(f"{name}={duration}ms" for name, duration in breakdown.items()),
+                extra={"timings": breakdown, "queries": timings.queries},
+            )
+        return response
+
+    @staticmethod
+    def shows_header(request) -> bool:
+        """Check whether the caller may see the header; DRF sets the token user on the Django request."""
+        if settings.SERVER_TIMING == "staff":
+            user = getattr(request, "user", None)
+            return bool(user is not None and user.is_authenticated and user.is_staff)
+        return settings.SERVER_TIMING == "1"
+
+
+class TracingMiddleware:
+    """Open the root span of each request when ``TRACING`` is enabled.
+
+    An incoming W3C ``traceparent`` header is honoured, so the request joins
+    the caller's trace.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.TRACING:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with self.root_span(request) as root:
+            response = self.get_response(request)
+            self.finish(request, response, root)
+        return response
+
+    async def __acall__(self, request):
+        with self.root_span(request) as root:
+            response = await self.get_response(request)
+            self.finish(request, response, root)
+        return response
+
+    @staticmethod
+    def root_span(request):
+        """Start the server span for the request."""
+        trace_id, parent_id = parse_traceparent(request.headers.get("traceparent", ""))
+        return span(
+            f"{request.method} {request.path}",
+            kind=SPAN_KIND_SERVER,
+            trace_id=trace_id,
+            parent_id=parent_id,
+            **{"http.request.method": request.method, "url.path": request.path},
+        )
+
+    @staticmethod
+    def finish(request, response, root):
+        """Name the span after the matched route and record the response status."""
+        if root is None:
+            return
+        route = route_template(request)
+        if route is not None:
+            root.name = f"{request.method} {route}"
+            root.set_attribute("http.route", route)
+        root.set_attribute("http.response.status_code", response.status_code)
+        if response.status_code >= 500:
+            root.status = (STATUS_ERROR, "")
+
+
+class MetricsMiddleware:
+    """Record request latency, status and query-count metrics for ``/metrics``.
+
+    Query counts come from the request's timing context, which is opened here
+    when ``ServerTimingMiddleware`` is disabled.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.METRICS:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with self.timing_scope() as scoped:
+            start = time.perf_counter()
+            response = self.get_response(request)
+            self.observe(request, response, time.perf_counter() - start, scoped or current_timings())
+        return response
+
+    async def __acall__(self, request):
+        with self.timing_scope() as scoped:
+            start = time.perf_counter()
+            response = await self.get_response(request)
+            self.observe(request, response, time.perf_counter() - start, scoped or current_timings())
+        return response
+
+    @staticmethod
+    def timing_scope():
+        """Reuse the enclosing timing context, or open one for query counting."""
+        return nullcontext() if current_timings() is not None else timing_context()
+
+    @staticmethod
+    def observe(request, response, elapsed, timings):
+        """Record the metrics of a finished request."""
+        view, action = view_labels(request)
+        method = method_label(request)
+        REQUEST_LATENCY.labels(view, action, method).observe(elapsed)
+        REQUESTS.labels(method, str(response.status_code)).inc()
+        if timings is not None:
+            REQUEST_QUERIES.labels(view, action).observe(timings.queries)
+        refresh_pool_gauges()
+
+
+class RequestIdMiddleware:
+    """Give every request an id for log correlation and echo it as ``X-Request-ID``.
+
+    A well-formed ``X-Request-ID`` from the client or proxy is reused;
+    otherwise a new one is generated.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = request_id_var.set(self.request_id(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            request_id_var.reset(token)
+        response["X-Request-ID"] = request.request_id
+        return response
+
+    async def __acall__(self, request):
+        token = request_id_var.set(self.request_id(request))
+        try:
+            response = await self.get_response(request)
+        finally:
+            request_id_var.reset(token)
+        response["X-Request-ID"] = request.request_id
+        return response
+
+    @staticmethod
+    def request_id(request) -> str:
+        """Pick the request id and store it on the request."""
+        incoming = request.headers.get("X-Request-ID", "")
+        request.request_id = incoming if _REQUEST_ID.fullmatch(incoming) else uuid.uuid4().hex
+        return request.request_id
+
+
+class CompressionMiddleware:
+    """Compress responses with the best encoding the client accepts (zstd, br or gzip).
+
+    Only compressible media types are compressed, and only bodies of at least
+    ``COMPRESSION_MIN_SIZE`` bytes; streaming responses are compressed chunk
+    by chunk as they are produced. Time spent compressing regular responses
+    shows up as ``compress`` in the Server-Timing breakdown.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.COMPRESSION:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.compressors = available_compressors()
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.compress(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.compress(request, await self.get_response(request))
+
+    def compress(self, request, response):
+        """Negotiate an encoding and compress the response body with it."""
+        if response.has_header("Content-Encoding") or not is_compressible(response.get("Content-Type", "")):
+            return response
+        if not response.streaming and len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        compressor_class = negotiate(request.headers.get("Accept-Encoding", ""), self.compressors)
+        if compressor_class is None:
+            return response
+        compressor = compressor_class()
+
+        if response.streaming:
+            if response.is_async:
+                response.streaming_content = acompress_sequence(compressor, response.streaming_content)
+            else:
+                response.streaming_content = compress_sequence(compressor, response.streaming_content)
+            del response["Content-Length"]
+        else:
+            with measure("compress"):
+                content = compressor.compress(response.content) + compressor.finish()
+            if len(content) >= len(response.content):
+                return response
+            response.content = content
+            response["Content-Length"] = str(len(content))
+
+        # The compressed body is a different representation; strong validators no longer hold.
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+        response["Content-Encoding"] = compressor.encoding
+        return response
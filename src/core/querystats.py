@@ -0,0 +1,235 @@
+"""Per-fingerprint SQL statistics and slow-query plans.
+
+With ``QUERY_STATS=1`` every statement is normalized into a fingerprint
+(literals and placeholders replaced, ``IN`` lists collapsed) and its call
+count, total, max and p95 time are aggregated in memory. Each process
+periodically writes its aggregate to ``QUERY_STATS_DIR`` so the
+``querystats`` management command can merge the workers' files.
+SELECTs slower than ``SLOW_QUERY_MS`` get their plan captured once per
+fingerprint: ``EXPLAIN (ANALYZE, BUFFERS)`` on PostgreSQL and
+``EXPLAIN QUERY PLAN`` on SQLite.
+"""
+
+import atexit
+import functools
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+MAX_SAMPLES = 200
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_SAVEPOINT = re.compile(r'"s\d+_x\d+"')
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|\$\d+")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_VALUE_ROWS = re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+")
+_WHITESPACE = re.compile(r"\s+")
+_LOCKING_CLAUSE = re.compile(r"\bFOR\s+(?:NO\s+KEY\s+)?(?:UPDATE|SHARE|KEY\s+SHARE)\b", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=4096)
+def fingerprint(sql: str) -> tuple[str, str]:
+    """Return ``(id, normalized_sql)`` for a statement; queries differing only in values share both."""
+    normalized = _STRING.sub("?", sql)
+    normalized = _SAVEPOINT.sub('"?"', normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _VALUE_LIST.sub("(...)", normalized)
+    normalized = _VALUE_ROWS.sub("(...)", normalized)
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    return hashlib.sha1(normalized.encode()).hexdigest()[:12], normalized
+
+
+class QueryStat:
+    """Aggregated timings of one fingerprint."""
+
+    def __init__(self, sql: str):
+        self.sql = sql
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: list[float] = []
+        self.plan = ""
+
+    def add(self, duration: float) -> None:
+        """Record one execution, keeping a uniform reservoir of durations for percentiles."""
+        self.calls += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        if len(self.samples) < MAX_SAMPLES:
+            self.samples.append(duration)
+        else:
+            slot = random.randrange(self.calls)
+            if slot < MAX_SAMPLES:
+                self.samples[slot] = duration
+
+    def to_dict(self) -> dict:
+        return {
+            "sql": self.sql,
+            "calls": self.calls,
+            "total": self.total,
+            "max": self.max,
+            "samples": self.samples,
+            "plan": self.plan,
+        }
+
+
+def percentile(samples: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of the given samples."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class QueryStatsCollector:
+    """Process-wide fingerprint aggregate, flushed to ``QUERY_STATS_DIR``."""
+
+    def __init__(self):
+        self.stats: dict[str, QueryStat] = {}
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._atexit_registered = False
+
+    def record(self, sql: str, duration: float) -> QueryStat:
+        """Add an execution to its fingerprint's aggregate."""
+        key, normalized = fingerprint(sql)
+        with self._lock:
+            stat = self.stats.get(key)
+            if stat is None:
+                stat = self.stats[key] = QueryStat(normalized)
+            stat.add(duration)
+        return stat
+
+    def maybe_flush(self) -> None:
+        """Flush if ``QUERY_STATS_FLUSH_SECONDS`` have passed since the last flush."""
+        if not self._atexit_registered:
+            self._atexit_registered = True
+            atexit.register(self.flush)
+        if time.monotonic() - self._last_flush >= settings.QUERY_STATS_FLUSH_SECONDS:
+            self.flush()
+
+    def flush(self) -> Path | None:
+        """Atomically write this process's aggregate to its file in ``QUERY_STATS_DIR``."""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self.stats:
+                return None
+            payload = {"pid": os.getpid(), "stats": {key: stat.to_dict() for key, stat in self.stats.items()}}
+        directory = Path(settings.QUERY_STATS_DIR)
+        directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f"querystats-{os.getpid()}.json"
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w") as output:
+            json.dump(payload, output)
+        os.replace(tmp_path, path)
+        return path
+
+    def reset(self) -> None:
+        """Forget the in-memory aggregate."""
+        with self._lock:
+            self.stats.clear()
+
+
+collector = QueryStatsCollector()
+
+_explaining: ContextVar[bool] = ContextVar("explaining", default=False)
+
+
+def explain(connection, sql: str, params) -> str:
+    """Return the execution plan of a SELECT as text, or an empty string if unsupported.
+
+    ``EXPLAIN ANALYZE`` runs the statement again, so only SELECTs are explained,
+    inside a savepoint that is always rolled back: a failing EXPLAIN leaves the
+    request's transaction usable, and nothing the statement did is kept.
+    """
+    if not _is_select(sql):
+        return ""
+    if connection.vendor == "postgresql":
+        prefix = "EXPLAIN (ANALYZE, BUFFERS) "
+    elif connection.vendor == "sqlite":
+        prefix = "EXPLAIN QUERY PLAN "
+    else:
+        return ""
+    token = _explaining.set(True)
+    try:
+        with transaction.atomic(using=connection.alias):
+            with connection.cursor() as cursor:
+                cursor.execute(prefix + sql, params)
+                rows = cursor.fetchall()
+            transaction.set_rollback(True, using=connection.alias)
+    finally:
+        _explaining.reset(token)
+    if connection.vendor == "sqlite":
+        # (id, parent, notused, detail)
+        return "\n".join(str(row[-1]) for row in rows)
+    return "\n".join(str(row[0]) for row in rows)
+
+
+def collect_query_stats(execute, sql, params, many, context):
+    """Database execute wrapper feeding the fingerprint aggregate and slow-query plans."""
+    if not settings.QUERY_STATS or _explaining.get():
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        result = execute(sql, params, many, context)
+    except Exception:
+        collector.record(sql, time.perf_counter() - start)
+        raise
+    duration = time.perf_counter() - start
+    stat = collector.record(sql, duration)
+    if not many and not stat.plan and duration * 1000 >= settings.SLOW_QUERY_MS and _is_select(sql):
+        try:
+            stat.plan = explain(context["connection"], sql, params) or "(no plan)"
+        except Exception:
+            logger.warning("Could not capture plan for slow query %s", fingerprint(sql)[0], exc_info=True)
+    collector.maybe_flush()
+    return result
+
+
+def _is_select(sql: str) -> bool:
+    # SELECT ... FOR UPDATE/SHARE would take its row locks a second time.
+    return sql.lstrip()[:6].upper() == "SELECT" and not _LOCKING_CLAUSE.search(sql)
+
+
+def install_query_stats(sender, connection, **kwargs):
+    """Attach the statistics wrapper to every database connection once."""
+    if collect_query_stats not in connection.execute_wrappers:
+        connection.execute_wrappers.append(collect_query_stats)
+
+
+def load_stats(directory) -> dict[str, dict]:
+    """Merge every process's flushed aggregate in ``directory`` by fingerprint."""
+    merged: dict[str, dict] = {}
+    for path in sorted(Path(directory).glob("querystats-*.json")):
+        try:
+            payload = json.loads(path.read_text())
+        except (OSError, ValueError):
+            continue
+        for key, stat in payload["stats"].items():
+            entry = merged.setdefault(
+                key, {"sql": stat["sql"], "calls": 0, "total": 0.0, "max": 0.0, "samples": [], "plan": ""}
+            )
+            entry["calls"] += stat["calls"]
+            entry["total"] += stat["total"]
+            entry["max"] = max(entry["max"], stat["max"])
+            entry["samples"].extend(stat["samples"])
+            entry["plan"] = entry["plan"] or stat["plan"]
+    for entry in merged.values():
+        entry["p95"] = percentile(entry.pop("samples"), 0.95)
+    return merged
@@ -0,0 +1,203 @@
+import asyncio
+import gzip
+import json
+import zlib
+
+import pytest
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from django.test import RequestFactory
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.compression import GzipCompressor, available_compressors, negotiate, parse_accept_encoding
+from core.middleware import CompressionMiddleware
+from courses.tests.factories import CourseFactory, StudentFactory
+
+PAYLOAD = json.dumps([{"id": i, "username": f"student_{i}", "role": "student"} for i in range(200)]).encode()
+
+
+def _middleware(response):
+    return CompressionMiddleware(lambda request: response)
+
+
+def _request(accept_encoding="gzip, deflate, br, zstd"):
+    return RequestFactory().get("/", HTTP_ACCEPT_ENCODING=accept_encoding)
+
+
+def test_parse_accept_encoding():
+    assert parse_accept_encoding("gzip;q=0.5, br, *;q=0, zstd;q=oops") == {
+        "gzip": 0.5,
+        "br": 1.0,
+        "*": 0.0,
+        "zstd": 0.0,
+    }
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip, br, zstd", "zstd"),
+        ("gzip;q=1.0, zstd;q=0.5", "gzip"),
+        ("*", "zstd"),
+        ("deflate", None),
+        ("gzip;q=0", None),
+        ("", None),
+    ],
+)
+def test_negotiate_prefers_highest_q_then_server_order(settings, header, expected):
+    compressors = {"zstd": "zstd", "br": "br", "gzip": "gzip"}
+
+    assert negotiate(header, compressors) == expected
+
+
+def test_compresses_large_json(settings):
+    settings.COMPRESSION_ENCODINGS = ["gzip"]
+    response = _middleware(HttpResponse(PAYLOAD, content_type="application/json"))(_request())
+
+    assert response["Content-Encoding"] == "gzip"
+    assert response["Vary"] == "Accept-Encoding"
+    assert int(response["Content-Length"]) == len(response.content) < len(PAYLOAD) / 4
+    assert gzip.decompress(response.content) == PAYLOAD
+
+
+@pytest.mark.parametrize(
+    "response",
+    [
+        HttpResponse(b"{}", content_type="application/json"),
+        HttpResponse(PAYLOAD, content_type="image/png"),
+        HttpResponse(PAYLOAD, content_type="application/json", headers={"Content-Encoding": "gzip"}),
+    ],
+    ids=["small", "incompressible", "already-encoded"],
+)
+def test_leaves_response_alone(response):
+    body = response.content
+
+    result = _middleware(response)(_request())
+
+    assert result.content == body
+    assert "Vary" not in result
+
+
+def test_identity_when_client_does_not_accept(settings):
+    response = _middleware(HttpResponse(PAYLOAD, content_type="application/json"))(_request(""))
+
+    assert response.content == PAYLOAD
+    assert not response.has_header("Content-Encoding")
+    assert response["Vary"] == "Accept-Encoding"
+
+
+def test_min_size_and_level_settings(settings):
+    settings.COMPRESSION_MIN_SIZE = len(PAYLOAD) + 1
+    assert not _middleware(HttpResponse(PAYLOAD, content_type="text/csv"))(_request()).has_header("Content-Encoding")
+
+    for level, extra_flags in [(1, 4), (9, 2)]:
+        settings.COMPRESSION_GZIP_LEVEL = level
+        compressor = GzipCompressor()
+        # The gzip header's XFL byte records fastest (4) or maximum (2) compression.
+        assert (compressor.compress(PAYLOAD) + compressor.finish())[8] == extra_flags
+
+
+def test_weakens_etag(settings):
+    settings.COMPRESSION_ENCODINGS = ["gzip"]
+    response = _middleware(HttpResponse(PAYLOAD, content_type="application/json", headers={"ETag": '"abc"'}))
+
+    assert response(_request())["ETag"] == 'W/"abc"'
+
+
+def test_streaming_response_is_compressed_incrementally(settings):
+    settings.COMPRESSION_ENCODINGS = ["gzip"]
+    chunks = [PAYLOAD[i : i + 1000] for i in range(0, len(PAYLOAD), 1000)]
+    consumed = []
+
+    def produce():
+        for chunk in chunks:
+            consumed.append(chunk)
+            yield chunk
+
+    response = _middleware(StreamingHttpResponse(produce(), content_type="application/json"))(_request())
+
+    assert response["Content-Encoding"] == "gzip"
+    assert not response.has_header("Content-Length")
+    assert consumed == []
+    assert gzip.decompress(b"".join(response.streaming_content)) == PAYLOAD
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br", "zstd"])
+def test_streamed_chunks_decode_before_the_end(settings, encoding):
+    if encoding == "gzip":
+        decompress = zlib.decompressobj(16 + zlib.MAX_WBITS).decompress
+    elif encoding == "br":
+        decompress = pytest.importorskip("brotli").Decompressor().process
+    else:
+        decompress = pytest.importorskip("zstandard").ZstdDecompressor().decompressobj().decompress
+    settings.COMPRESSION_ENCODINGS = [encoding]
+    chunks = [PAYLOAD[:100], PAYLOAD[100:200], PAYLOAD[200:]]
+
+    response = _middleware(StreamingHttpResponse(iter(chunks), content_type="application/json"))(_request())
+    stream = iter(response.streaming_content)
+
+    assert decompress(next(stream)) == chunks[0]
+    assert decompress(next(stream)) == chunks[1]
+
+
+def test_async_streaming_response(settings):
+    settings.COMPRESSION_ENCODINGS = ["gzip"]
+
+    async def produce():
+        yield PAYLOAD[:500]
+        yield PAYLOAD[500:]
+
+    response = _middleware(StreamingHttpResponse(produce(), content_type="application/json"))(_request())
+
+    async def collect():
+        return b"".join([chunk async for chunk in response.streaming_content])
+
+    assert gzip.decompress(asyncio.run(collect())) == PAYLOAD
+
+
+@pytest.mark.parametrize("encoding, module", [("br", "brotli"), ("zstd", "zstandard")])
+def test_optional_encodings(settings, encoding, module):
+    codec = pytest.importorskip(module)
+    settings.COMPRESSION_ENCODINGS = [encoding, "gzip"]
+
+    response = _middleware(JsonResponse(json.loads(PAYLOAD), safe=False))(_request())
+
+    assert response["Content-Encoding"] == encoding
+    decompress = codec.decompress if encoding == "br" else codec.ZstdDecompressor().decompressobj().decompress
+    assert json.loads(decompress(response.content)) == json.loads(PAYLOAD)
+
+
+def test_missing_codecs_are_not_offered(settings, monkeypatch):
+    monkeypatch.setattr("core.compression.brotli", None)
+    monkeypatch.setattr("core.compression.zstandard", None)
+
+    assert list(available_compressors()) == ["gzip"]
+
+
+@pytest.mark.django_db
+def test_api_list_is_compressed_end_to_end(settings):
+    settings.COMPRESSION_ENCODINGS = ["gzip"]
+    settings.SERVER_TIMING = "1"
+    student = StudentFactory()
+    CourseFactory.create_batch(10, students=[student])
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(student)}")
+
+    plain = client.get("/api/v1/courses/")
+    compressed = client.get("/api/v1/courses/", HTTP_ACCEPT_ENCODING="gzip")
+
+    assert compressed["Content-Encoding"] == "gzip"
+    assert "compress;dur=" in compressed["Server-Timing"]
+    assert gzip.decompress(compressed.content) == plain.content
+
+
+def test_schema_revalidates_with_weakened_etag(settings, tmp_path):
+    settings.SCHEMA_ARTIFACT_DIR = str(tmp_path)
+    settings.COMPRESSION_ENCODINGS = ["gzip"]
+    client = APIClient()
+
+    etag = client.get("/api/schema/", HTTP_ACCEPT_ENCODING="gzip")["ETag"]
+    response = client.get("/api/schema/", HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=etag)
+
+    assert etag.startswith('W/"')
+    assert response.status_code == 304
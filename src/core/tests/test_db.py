@@ -0,0 +1,46 @@
+import pytest
+from django.db import connection
+from rest_framework.test import APIClient
+
+from core import db
+from courses.tests.factories import UserFactory
+
+
+@pytest.mark.django_db
+class TestPoolStats:
+    def test_reports_every_alias_without_pool(self):
+        stats = db.pool_stats()
+
+        assert stats["default"]["pooled"] is False
+        assert stats["default"]["connection_age_max_seconds"] >= 0
+
+    def test_tracks_connection_age_for_persistent_connections(self, monkeypatch):
+        monkeypatch.setattr(db, "_births", {})
+        monkeypatch.setitem(connection.settings_dict, "CONN_MAX_AGE", 600)
+
+        db.track_connection_age(sender=None, connection=connection)
+        ages = db._connection_ages("default", max_lifetime=600)
+
+        assert len(ages) == 1
+
+    def test_skips_per_request_connections(self, monkeypatch):
+        monkeypatch.setattr(db, "_births", {})
+        monkeypatch.setitem(connection.settings_dict, "CONN_MAX_AGE", 0)
+
+        db.track_connection_age(sender=None, connection=connection)
+
+        assert db._births == {}
+
+
+@pytest.mark.django_db
+def test_pool_stats_endpoint_is_admin_only():
+    client = APIClient()
+    user = UserFactory()
+    client.force_authenticate(user=user)
+    assert client.get("/internal/db-pool/").status_code == 403
+
+    user.is_staff = True
+    user.save()
+    response = client.get("/internal/db-pool/")
+    assert response.status_code == 200
+    assert "default" in response.json()
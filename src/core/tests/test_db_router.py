@@ -0,0 +1,67 @@
+import pytest
+from django.core.cache import cache
+from rest_framework import response, viewsets
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from api.v1.mixins import ReplicaReadMixin
+from core.db_router import PrimaryReplicaRouter, is_pinned_to_primary, routing_context
+from courses.models import Course
+from courses.tests.factories import StudentFactory
+
+
+@pytest.fixture
+def replica(settings):
+    settings.DATABASES = {**settings.DATABASES, "replica": settings.DATABASES["default"]}
+    cache.clear()
+    yield
+    cache.clear()
+
+
+class TestPrimaryReplicaRouter:
+    def test_reads_default_to_primary_outside_requests(self, replica):
+        assert PrimaryReplicaRouter().db_for_read(Course) == "default"
+
+    def test_reads_use_replica_until_first_write(self, replica):
+        router = PrimaryReplicaRouter()
+        with routing_context() as state:
+            state.use_replica = True
+            assert router.db_for_read(Course) == "replica"
+
+            assert router.db_for_write(Course) == "default"
+            assert router.db_for_read(Course) == "default"
+
+    def test_replica_not_configured(self):
+        with routing_context() as state:
+            state.use_replica = True
+            assert PrimaryReplicaRouter().db_for_read(Course) == "default"
+
+
+class RoutingProbeViewSet(ReplicaReadMixin, viewsets.ViewSet):
+    def list(self, request):
+        return response.Response({"db": PrimaryReplicaRouter().db_for_read(Course)})
+
+    def create(self, request):
+        PrimaryReplicaRouter().db_for_write(Course)
+        return response.Response(status=201)
+
+
+@pytest.mark.django_db
+class TestReplicaReadMixin:
+    def _call(self, method, user):
+        factory = APIRequestFactory()
+        request = getattr(factory, method)("/probe/")
+        force_authenticate(request, user=user)
+        view = RoutingProbeViewSet.as_view({"get": "list", "post": "create"})
+        return view(request)
+
+    def test_safe_reads_go_to_replica(self, replica):
+        assert self._call("get", StudentFactory()).data == {"db": "replica"}
+
+    def test_write_pins_user_to_primary(self, replica):
+        user = StudentFactory()
+
+        self._call("post", user)
+
+        assert is_pinned_to_primary(user.pk)
+        assert self._call("get", user).data == {"db": "default"}
+        assert self._call("get", StudentFactory()).data == {"db": "replica"}
@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+
+from rest_framework.test import APIClient
+
+from core.management.commands.importtime import parse_importtime
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       310 |        950 |     encodings.utf_8
+import time:      1500 |       2450 | encodings
+some unrelated stderr line
+"""
+
+
+def test_parse_importtime():
+    assert parse_importtime(SAMPLE) == [
+        ("_io", 120, 120, 1),
+        ("encodings.utf_8", 310, 950, 2),
+        ("encodings", 1500, 2450, 0),
+    ]
+
+
+def test_setup_does_not_import_heavy_modules():
+    code = (
+        "import sys, django; django.setup(); import courses.services;"
+        "print(' '.join(m for m in ('unittest', 'prometheus_client', 'drf_spectacular.views',"
+        " 'courses.services.grading_service') if m in sys.modules))"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env)
+
+    assert result.stdout.strip() == ""
+
+
+def test_lazy_services_resolve():
+    from courses import services
+    from courses.services.grading_service import GradingService
+
+    assert services.GradingService is GradingService
+    assert "CourseService" in dir(services)
+
+
+def test_schema_views_load_on_first_request():
+    client = APIClient()
+
+    assert client.get("/api/docs/").status_code == 200
+    assert client.get("/api/schema/").status_code == 200
@@ -0,0 +1,120 @@
+import datetime
+import decimal
+import io
+import uuid
+
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework import parsers, renderers
+from rest_framework.exceptions import ErrorDetail, ParseError
+from rest_framework.test import APIClient
+from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+from rest_framework_simplejwt.tokens import AccessToken
+
+import api.parsers
+import api.renderers
+from api.parsers import JSONParser
+from api.renderers import JSONRenderer
+from courses.tests.factories import CourseFactory, StudentFactory, SubmissionWithCommentsFactory
+
+PAYLOADS = [
+    {"id": 1, "title": "Intro", "students": [], "created_at": "2024-05-01T12:00:00Z"},
+    [{"text": "Zürich, 東京, emoji 🎓"}, {"text": "line\u2028separator\u2029paragraph"}],
+    {"when": datetime.datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=datetime.UTC)},
+    {"naive": datetime.datetime(2024, 5, 1, 12, 30), "day": datetime.date(2024, 5, 1), "at": datetime.time(9, 5)},
+    {"score": decimal.Decimal("87.50"), "uuid": uuid.UUID(int=7), "delta": datetime.timedelta(minutes=90)},
+    {"detail": ErrorDetail("Not allowed.", code="denied"), "lazy": gettext_lazy("This field is required.")},
+    ReturnDict({"nested": ReturnList([1, 2.5, None, True], serializer=None)}, serializer=None),
+    {"big": 2**70, "negative": -(2**63), "float": 0.1},
+    {"set": frozenset(), "tuple": (1, 2)},
+    None,
+    "",
+    [],
+]
+
+
+@pytest.mark.parametrize("data", PAYLOADS)
+def test_renderer_matches_drf(data):
+    assert JSONRenderer().render(data) == renderers.JSONRenderer().render(data)
+
+
+@pytest.mark.parametrize("media_type", ["application/json; indent=4", "application/json"])
+def test_renderer_honours_indent(media_type):
+    data = {"a": [1, {"b": "c"}]}
+
+    assert JSONRenderer().render(data, media_type) == renderers.JSONRenderer().render(data, media_type)
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("-inf"), decimal.Decimal("NaN")])
+def test_renderer_rejects_non_finite_like_drf(value):
+    data = {"score": value, "comment": None}
+    with pytest.raises(ValueError) as expected:
+        renderers.JSONRenderer().render(data)
+    with pytest.raises(ValueError) as actual:
+        JSONRenderer().render(data)
+
+    assert str(actual.value) == str(expected.value)
+
+
+def test_renderer_writes_non_finite_like_drf_when_not_strict(monkeypatch):
+    monkeypatch.setattr(renderers.JSONRenderer, "strict", False)
+    data = [{"score": float("inf")}, None]
+
+    assert JSONRenderer().render(data) == renderers.JSONRenderer().render(data) == b'[{"score":Infinity},null]'
+
+
+def test_renderer_falls_back_without_orjson(monkeypatch):
+    monkeypatch.setattr(api.renderers, "orjson", None)
+
+    assert JSONRenderer().render(PAYLOADS[1]) == renderers.JSONRenderer().render(PAYLOADS[1])
+
+
+BODIES = [
+    b'{"title": "Intro", "description": "Z\\u00fcrich \xc3\xa9", "students": [1, 2]}',
+    b'[1, 2.5, -3e2, true, null, "\\ud83c\\udf93"]',
+    b'{"big": 123456789012345678901234567890, "u64": 18446744073709551615}',
+    b'{"below_i64": -9999999999999999999, "i64_min": -9223372036854775808, "i64_max": 9223372036854775807}',
+    b'{"wide_float": 0.12345678901234567890123}',
+    b'  {"padded": 1}  ',
+]
+
+
+@pytest.mark.parametrize("body", BODIES)
+def test_parser_matches_drf(body):
+    assert JSONParser().parse(io.BytesIO(body)) == parsers.JSONParser().parse(io.BytesIO(body))
+
+
+@pytest.mark.parametrize("body", [b"", b"{", b'{"score": NaN}', b"[1,]", b"\xff"])
+def test_parser_rejects_like_drf(body):
+    with pytest.raises(ParseError) as expected:
+        parsers.JSONParser().parse(io.BytesIO(body))
+    with pytest.raises(ParseError) as actual:
+        JSONParser().parse(io.BytesIO(body))
+
+    assert str(actual.value) == str(expected.value)
+
+
+def test_parser_falls_back_without_orjson(monkeypatch):
+    monkeypatch.setattr(api.parsers, "orjson", None)
+
+    assert JSONParser().parse(io.BytesIO(BODIES[0])) == parsers.JSONParser().parse(io.BytesIO(BODIES[0]))
+
+
+@pytest.mark.django_db
+def test_api_responses_match_stdlib_renderer(settings):
+    student = StudentFactory()
+    SubmissionWithCommentsFactory(student=student)
+    CourseFactory(students=[student], title="Cours d'été  ")
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(student)}")
+    paths = ["/api/v1/courses/", "/api/v1/submissions/", "/api/v1/grade-comments/", "/api/v1/courses/0/"]
+
+    fast = [client.get(path) for path in paths]
+    settings.REST_FRAMEWORK = {
+        **settings.REST_FRAMEWORK,
+        "DEFAULT_RENDERER_CLASSES": ("rest_framework.renderers.JSONRenderer",),
+    }
+    stdlib = [client.get(path) for path in paths]
+
+    for ours, theirs in zip(fast, stdlib, strict=True):
+        assert (ours.status_code, ours.content) == (theirs.status_code, theirs.content)
@@ -0,0 +1,68 @@
+import json
+import logging
+
+from rest_framework.test import APIClient
+
+from core.logs import BackgroundHandler, JsonFormatter, RequestIdFilter, SamplingFilter, request_id_var
+
+
+def _record(level=logging.INFO, msg="Course %s created successfully", args=(7,), **extra):
+    record = logging.LogRecord("courses.services", level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_background_handler_writes_json_with_request_id(tmp_path):
+    path = tmp_path / "app.log"
+    handler = BackgroundHandler(filename=str(path))
+    handler.addFilter(RequestIdFilter())
+    handler.setFormatter(JsonFormatter())
+
+    token = request_id_var.set("req-1")
+    try:
+        handler.handle(_record(course_id=7))
+    finally:
+        request_id_var.reset(token)
+    handler.close()
+
+    entry = json.loads(path.read_text())
+    assert entry["message"] == "Course 7 created successfully"
+    assert entry["request_id"] == "req-1"
+    assert entry["course_id"] == 7
+
+
+def test_full_queue_drops_instead_of_blocking():
+    handler = BackgroundHandler(queue_size=1)
+
+    handler.enqueue(_record())
+    handler.enqueue(_record())
+
+    assert handler.dropped == 1
+
+
+def test_sampling_keeps_warnings_and_whole_requests():
+    never = SamplingFilter(rate=0)
+    assert not never.filter(_record())
+    assert never.filter(_record(level=logging.WARNING))
+
+    half = SamplingFilter(rate=0.5)
+    token = request_id_var.set("abc")
+    try:
+        decisions = {half.filter(_record()) for _ in range(20)}
+    finally:
+        request_id_var.reset(token)
+    assert len(decisions) == 1
+
+
+class TestRequestIdMiddleware:
+    def test_generates_request_id(self):
+        response = APIClient().get("/api/v1/courses/")
+        assert len(response["X-Request-ID"]) == 32
+
+    def test_reuses_valid_incoming_id(self):
+        response = APIClient().get("/api/v1/courses/", HTTP_X_REQUEST_ID="edge-42")
+        assert response["X-Request-ID"] == "edge-42"
+
+    def test_replaces_malformed_incoming_id(self):
+        response = APIClient().get("/api/v1/courses/", HTTP_X_REQUEST_ID="bad id\\n")
+        assert response["X-Request-ID"] != "bad id\\n"
@@ -0,0 +1,85 @@
+import pytest
+from django.core.cache import cache
+from prometheus_client import REGISTRY
+from rest_framework.test import APIClient
+
+from courses.tests.factories import CourseFactory, HomeworkAssignmentFactory, StudentFactory
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.django_db
+class TestMetrics:
+    def test_request_metrics_per_viewset_action(self):
+        client = APIClient()
+        client.force_authenticate(StudentFactory())
+        labels = {"view": "CourseViewSet", "action": "list", "method": "GET"}
+        before = _sample("ocms_http_request_duration_seconds_count", **labels)
+        before_ok = _sample("ocms_http_requests_total", method="GET", status="200")
+
+        client.get("/api/v1/courses/")
+
+        assert _sample("ocms_http_request_duration_seconds_count", **labels) == before + 1
+        assert _sample("ocms_http_requests_total", method="GET", status="200") == before_ok + 1
+        assert _sample("ocms_http_request_queries_count", view="CourseViewSet", action="list") >= 1
+
+    def test_unknown_methods_share_one_label(self):
+        client = APIClient()
+        client.force_authenticate(StudentFactory())
+        labels = {"view": "CourseViewSet", "action": "other", "method": "other"}
+        before = _sample("ocms_http_request_duration_seconds_count", **labels)
+
+        client.generic("FOOBAR", "/api/v1/courses/")
+        client.generic("BAZQUX", "/api/v1/courses/")
+
+        assert _sample("ocms_http_request_duration_seconds_count", **labels) == before + 2
+        assert not [
+            sample
+            for metric in REGISTRY.collect()
+            for sample in metric.samples
+            if sample.labels.get("method") in ("FOOBAR", "BAZQUX") or sample.labels.get("action") == "foobar"
+        ]
+
+    def test_cache_hit_ratio(self):
+        hits = _sample("ocms_cache_lookups_total", backend="LocMemCache", result="hit")
+        misses = _sample("ocms_cache_lookups_total", backend="LocMemCache", result="miss")
+        cache.set("metrics-key", 1)
+
+        cache.get("metrics-key")
+        cache.get("metrics-absent")
+
+        assert _sample("ocms_cache_lookups_total", backend="LocMemCache", result="hit") == hits + 1
+        assert _sample("ocms_cache_lookups_total", backend="LocMemCache", result="miss") == misses + 1
+
+    def test_domain_counters_count_on_commit(self, django_capture_on_commit_callbacks):
+        assignment = HomeworkAssignmentFactory()
+        before = (_sample("ocms_enrollments_total"), _sample("ocms_submissions_created_total"))
+
+        with django_capture_on_commit_callbacks(execute=True):
+            student = StudentFactory()
+            assignment.lecture.course.students.add(student)
+            assignment.submissions.create(student=student, text="done")
+
+        assert _sample("ocms_enrollments_total") == before[0] + 1
+        assert _sample("ocms_submissions_created_total") == before[1] + 1
+
+    def test_metrics_endpoint(self, settings):
+        settings.METRICS_TOKEN = "scrape"
+        CourseFactory()
+
+        assert APIClient().get("/metrics").status_code == 403
+
+        response = APIClient().get("/metrics", HTTP_AUTHORIZATION="Bearer scrape")
+        assert response.status_code == 200
+        assert b"ocms_http_requests_total" in response.content
+        assert b'ocms_db_pool_size{alias="default"}' in response.content
+
+    def test_metrics_without_token_are_local_only(self, settings):
+        settings.METRICS_TOKEN = ""
+
+        assert APIClient().get("/metrics", REMOTE_ADDR="127.0.0.1").status_code == 200
+        assert APIClient().get("/metrics", REMOTE_ADDR="203.0.113.7").status_code == 403
+        proxied = APIClient().get("/metrics", REMOTE_ADDR="127.0.0.1", HTTP_X_FORWARDED_FOR="203.0.113.7")
+        assert proxied.status_code == 403
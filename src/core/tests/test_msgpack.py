@@ -0,0 +1,87 @@
+import datetime
+import decimal
+import io
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from rest_framework.exceptions import ParseError
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from api.parsers import MessagePackParser
+from api.renderers import JSONRenderer, MessagePackRenderer
+from courses.tests.factories import GradedSubmissionFactory
+
+msgpack = pytest.importorskip("msgpack")
+
+User = get_user_model()
+
+
+def test_renderer_carries_the_json_representation():
+    data = {
+        "when": datetime.datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=datetime.UTC),
+        "score": decimal.Decimal("87.5"),
+        "text": "Zürich",
+        "items": (1, None, True),
+    }
+
+    assert msgpack.unpackb(MessagePackRenderer().render(data)) == json.loads(JSONRenderer().render(data))
+
+
+def test_parser_round_trip_and_errors():
+    payload = {"users": [{"username": "bulk1", "role": "TEACHER"}], "blob": b"\x00\x01"}
+
+    assert MessagePackParser().parse(io.BytesIO(msgpack.packb(payload, use_bin_type=True))) == payload
+    with pytest.raises(ParseError):
+        MessagePackParser().parse(io.BytesIO(b"\xc1"))
+    with pytest.raises(ParseError):
+        MessagePackParser().parse(io.BytesIO(msgpack.packb([1]) + b"\x01"))
+
+
+@pytest.mark.django_db
+def test_list_negotiates_msgpack():
+    submission = GradedSubmissionFactory()
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(submission.student)}")
+
+    as_json = client.get("/api/v1/submissions/")
+    as_msgpack = client.get("/api/v1/submissions/", HTTP_ACCEPT="application/msgpack")
+    grade = client.get(f"/api/v1/submissions/{submission.pk}/grade/", HTTP_ACCEPT="application/msgpack")
+
+    assert as_msgpack["Content-Type"] == "application/msgpack"
+    assert msgpack.unpackb(as_msgpack.content) == as_json.json()
+    assert msgpack.unpackb(grade.content)["score"] == submission.grade.score
+
+
+@pytest.mark.django_db
+def test_errors_are_rendered_as_msgpack():
+    response = APIClient().get("/api/v1/submissions/", HTTP_ACCEPT="application/msgpack")
+
+    assert response.status_code == 401
+    assert "detail" in msgpack.unpackb(response.content)
+
+
+@pytest.mark.django_db
+def test_bulk_provisioning_accepts_msgpack():
+    client = APIClient()
+    client.force_authenticate(user=User.objects.create(username="admin", is_staff=True))
+    rows = [{"username": "bulk1", "email": "b1@example.com", "password": "Str0ngPass!x", "role": "TEACHER"}]
+
+    response = client.post("/api/v1/users/bulk", msgpack.packb({"users": rows}), content_type="application/msgpack")
+    malformed = client.post("/api/v1/users/bulk", b"\xc1", content_type="application/msgpack")
+
+    assert response.status_code == 201
+    assert User.objects.filter(username="bulk1").exists()
+    assert malformed.status_code == 400
+
+
+def test_bench_formats_command():
+    output = io.StringIO()
+
+    call_command("bench_formats", count=20, repeat=1, stdout=output)
+
+    lines = output.getvalue().splitlines()
+    assert len(lines) == 7
+    assert any(line.startswith("GradeSerializer") and "msgpack" in line for line in lines)
@@ -0,0 +1,78 @@
+import pytest
+from django.core.management import call_command
+from django.db import DatabaseError, connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from core.querystats import collector, explain, fingerprint, load_stats
+from courses.models import Submission
+from courses.tests.factories import TeacherFactory
+
+
+@pytest.fixture
+def query_stats(settings, tmp_path):
+    settings.QUERY_STATS = True
+    settings.QUERY_STATS_DIR = str(tmp_path)
+    collector.reset()
+    yield tmp_path
+    collector.reset()
+
+
+def test_fingerprint_ignores_values():
+    first = fingerprint("SELECT * FROM t WHERE id IN (%s, %s, %s) AND name = 'a'")
+    second = fingerprint("SELECT *  FROM t WHERE id IN (%s) AND name = 'it''s'")
+    third = fingerprint("SELECT * FROM t WHERE id IN (1, 2) AND name = 'b'")
+
+    assert first[1] == "SELECT * FROM t WHERE id IN (...) AND name = ?"
+    assert fingerprint('SAVEPOINT "s1_x2"') == fingerprint('SAVEPOINT "s9_x10"')
+    assert third == first
+    assert second[1] == "SELECT * FROM t WHERE id IN (?) AND name = ?"
+
+
+@pytest.mark.django_db
+class TestQueryStats:
+    def test_aggregates_and_flushes(self, query_stats):
+        teacher = TeacherFactory()
+        for _ in range(3):
+            list(Submission.objects.for_course_teachers(teacher))
+
+        collector.flush()
+        stats = load_stats(query_stats)
+
+        [entry] = [s for s in stats.values() if 'FROM "courses_submission"' in s["sql"]]
+        assert entry["calls"] == 3
+        assert entry["p95"] <= entry["max"] <= entry["total"]
+
+    def test_slow_select_plan_is_captured(self, query_stats, settings, capsys):
+        settings.SLOW_QUERY_MS = 0
+        list(Submission.objects.for_course_teachers(TeacherFactory()))
+        collector.flush()
+
+        [entry] = [s for s in load_stats(query_stats).values() if s["sql"].startswith('SELECT "courses_submission"')]
+        assert "courses_courseaccess" in entry["plan"]
+
+        call_command("querystats", "--plans", "--sort", "calls", "--top", "50")
+        assert entry["plan"].splitlines()[0] in capsys.readouterr().out
+
+
+@pytest.mark.django_db
+class TestExplain:
+    def test_only_plain_selects_are_explained(self):
+        assert explain(connection, 'UPDATE "courses_course" SET "title" = %s', ["x"]) == ""
+        assert explain(connection, 'SELECT * FROM "courses_course" FOR UPDATE', []) == ""
+        assert explain(connection, 'SELECT * FROM "courses_course"', []) != ""
+
+    def test_runs_in_a_rolled_back_savepoint(self):
+        with transaction.atomic(), CaptureQueriesContext(connection) as captured:
+            explain(connection, 'SELECT * FROM "courses_course"', [])
+
+        statements = [query["sql"] for query in captured.captured_queries]
+        assert statements[0].startswith("SAVEPOINT")
+        assert any(statement.startswith("ROLLBACK TO SAVEPOINT") for statement in statements)
+
+    def test_failure_leaves_the_transaction_usable(self):
+        with transaction.atomic():
+            with pytest.raises(DatabaseError):
+                explain(connection, "SELECT * FROM no_such_table", [])
+
+            assert not connection.needs_rollback
+            assert TeacherFactory().pk
@@ -0,0 +1,69 @@
+import pytest
+from django.core.management import call_command
+from rest_framework.test import APIClient
+
+import api.schema
+from api.schema import artifact_path, clear_schema_cache, schema_fingerprint
+
+
+@pytest.fixture(autouse=True)
+def fresh_schema(settings, tmp_path):
+    settings.SCHEMA_ARTIFACT_DIR = str(tmp_path)
+    clear_schema_cache()
+    yield
+    clear_schema_cache()
+
+
+def test_schema_is_generated_once(monkeypatch):
+    calls = []
+    render = api.schema.render_schemas
+    monkeypatch.setattr(api.schema, "render_schemas", lambda: calls.append(1) or render())
+    client = APIClient()
+
+    first = client.get("/api/schema/")
+    second = client.get("/api/schema/", HTTP_ACCEPT="application/vnd.oai.openapi+json")
+
+    assert len(calls) == 1
+    assert first["Content-Type"].startswith("application/vnd.oai.openapi")
+    assert b"openapi: 3" in first.content
+    assert second.json()["info"]["title"] == "OCMS API"
+    assert first["ETag"] != second["ETag"]
+
+
+def test_if_none_match_returns_304():
+    client = APIClient()
+    etag = client.get("/api/schema/?format=json")["ETag"]
+
+    response = client.get("/api/schema/?format=json", HTTP_IF_NONE_MATCH=etag)
+
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+
+
+def test_exported_artifact_is_served(tmp_path):
+    call_command("export_schema")
+    path = artifact_path("json")
+    assert path.name == f"openapi-1.0.0-{schema_fingerprint()}.json"
+    path.write_bytes(b'{"exported": true}')
+
+    response = APIClient().get("/api/schema/?format=json")
+
+    assert response.json() == {"exported": True}
+
+
+def test_artifact_from_another_api_revision_is_ignored(settings):
+    call_command("export_schema")
+    artifact_path("json").write_bytes(b'{"exported": true}')
+
+    settings.SPECTACULAR_SETTINGS = {**settings.SPECTACULAR_SETTINGS, "DESCRIPTION": "changed"}
+    response = APIClient().get("/api/schema/?format=json")
+
+    assert response.json()["info"]["title"] == "OCMS API"
+
+
+def test_fingerprint_covers_routes(settings):
+    before = schema_fingerprint()
+
+    settings.ROOT_URLCONF = "core.urls"
+
+    assert schema_fingerprint() != before
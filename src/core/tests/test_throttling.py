@@ -0,0 +1,127 @@
+import pytest
+from rest_framework import response, viewsets
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
+
+from api.throttling import TokenBucketThrottle
+from courses.tests.factories import StudentFactory
+
+RATES = {"login": "2/min", "submission": "2/min", "grading": "2/min", "read": "3/min"}
+
+
+@pytest.fixture
+def rates(monkeypatch):
+    monkeypatch.setattr(TokenBucketThrottle, "THROTTLE_RATES", RATES)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(TokenBucketThrottle, "timer", lambda self: now[0])
+    return now
+
+
+class ThrottleProbeViewSet(viewsets.ViewSet):
+    throttle_classes = [TokenBucketThrottle]
+    throttle_scopes = {"create": "submission"}
+
+    def list(self, request, pk=None):
+        return response.Response()
+
+    def create(self, request, pk=None):
+        return response.Response(status=201)
+
+    def destroy(self, request, pk=None):
+        return response.Response(status=204)
+
+
+def _call(method, user, action):
+    request = getattr(APIRequestFactory(), method)("/probe/")
+    force_authenticate(request, user=user)
+    return ThrottleProbeViewSet.as_view({method: action})(request, pk=1)
+
+
+@pytest.mark.django_db
+class TestTokenBucketThrottle:
+    def test_burst_up_to_capacity_then_429(self, rates, clock):
+        user = StudentFactory()
+
+        assert [_call("post", user, "create").status_code for _ in range(3)] == [201, 201, 429]
+        # One token refills every 30 s at 2/min.
+        assert _call("post", user, "create")["Retry-After"] == "30"
+
+    def test_tokens_refill_over_time(self, rates, clock):
+        user = StudentFactory()
+        for _ in range(2):
+            _call("post", user, "create")
+
+        clock[0] += 29
+        assert _call("post", user, "create").status_code == 429
+        clock[0] += 1
+        assert _call("post", user, "create").status_code == 201
+        assert _call("post", user, "create").status_code == 429
+
+    def test_refill_is_capped_at_capacity(self, rates, clock):
+        user = StudentFactory()
+        clock[0] += 3600
+
+        assert [_call("get", user, "list").status_code for _ in range(4)] == [200, 200, 200, 429]
+
+    def test_scopes_and_users_have_separate_buckets(self, rates, clock):
+        user, other = StudentFactory.create_batch(2)
+        for _ in range(2):
+            _call("post", user, "create")
+
+        assert _call("post", user, "create").status_code == 429
+        assert _call("get", user, "list").status_code == 200
+        assert _call("post", other, "create").status_code == 201
+
+    def test_writes_without_scope_are_not_throttled(self, rates, clock):
+        user = StudentFactory()
+
+        assert {_call("delete", user, "destroy").status_code for _ in range(5)} == {204}
+
+
+@pytest.mark.django_db
+class TestThrottledEndpoints:
+    def test_login_is_throttled_per_client_ip(self, rates, clock):
+        client = APIClient()
+        credentials = {"username": "ghost", "password": "wrong"}
+
+        codes = [client.post("/api/v1/auth/jwt/create", credentials).status_code for _ in range(3)]
+        other_ip = client.post("/api/v1/auth/jwt/create", credentials, REMOTE_ADDR="10.0.0.2")
+
+        assert codes == [401, 401, 429]
+        assert other_ip.status_code == 401
+
+    def test_login_ignores_spoofed_forwarded_for(self, rates, clock):
+        client = APIClient()
+        credentials = {"username": "ghost", "password": "wrong"}
+
+        codes = [
+            client.post("/api/v1/auth/jwt/create", credentials, HTTP_X_FORWARDED_FOR=f"203.0.113.{i}").status_code
+            for i in range(3)
+        ]
+
+        assert codes == [401, 401, 429]
+
+    def test_login_uses_address_appended_by_trusted_proxy(self, rates, clock, settings):
+        settings.REST_FRAMEWORK = {**settings.REST_FRAMEWORK, "NUM_PROXIES": 1}
+        client = APIClient()
+        credentials = {"username": "ghost", "password": "wrong"}
+
+        def login(forwarded_for):
+            return client.post("/api/v1/auth/jwt/create", credentials, HTTP_X_FORWARDED_FOR=forwarded_for)
+
+        codes = [login(f"198.51.100.{i}, 203.0.113.7").status_code for i in range(3)]
+
+        assert codes == [401, 401, 429]
+        assert login("203.0.113.8").status_code == 401
+
+    def test_submission_create_uses_submission_scope(self, rates, clock):
+        client = APIClient()
+        client.force_authenticate(StudentFactory())
+
+        codes = [client.post("/api/v1/submissions/", {}).status_code for _ in range(3)]
+
+        assert codes == [400, 400, 429]
+        assert client.get("/api/v1/submissions/").status_code == 200
@@ -0,0 +1,82 @@
+import logging
+
+import pytest
+from rest_framework.test import APIClient
+
+from core.timing import RequestTimings
+from courses.tests.factories import CourseFactory, StudentFactory
+
+
+def _metrics(header: str) -> dict[str, str]:
+    return {metric.split(";")[0]: metric for metric in header.split(", ")}
+
+
+def test_header_value_formats_durations():
+    timings = RequestTimings()
+    timings.add("db", 0.0021)
+    timings.add("db", 0.001)
+    timings.queries = 2
+
+    assert timings.header_value() == 'db;dur=3.1;desc="2 queries"'
+
+
+@pytest.fixture
+def public_timing(settings):
+    settings.SERVER_TIMING = "1"
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("public_timing")
+class TestServerTiming:
+    def test_viewset_response_has_phase_breakdown(self):
+        student = StudentFactory()
+        CourseFactory(students=[student])
+        client = APIClient()
+        client.force_authenticate(student)
+
+        response = client.get("/api/v1/courses/")
+
+        metrics = _metrics(response["Server-Timing"])
+        assert {"auth", "perm", "db", "serialize", "render", "total"} <= set(metrics)
+        assert 'desc="' in metrics["db"]
+
+    def test_non_api_response_has_total(self):
+        response = APIClient().get("/admin/login/")
+        assert "total" in _metrics(response["Server-Timing"])
+
+    def test_structured_log_line(self, settings, caplog):
+        settings.SERVER_TIMING_LOG = True
+
+        with caplog.at_level(logging.INFO, logger="core.middleware"):
+            APIClient().get("/api/v1/courses/")
+
+        [record] = [r for r in caplog.records if r.name == "core.middleware"]
+        assert record.getMessage().startswith("GET /api/v1/courses/ 401 ")
+        assert "auth" in record.timings
+
+
+@pytest.mark.django_db
+class TestServerTimingAudience:
+    def _get(self, user):
+        client = APIClient()
+        client.force_authenticate(user)
+        return client.get("/api/v1/courses/")
+
+    def test_header_is_off_by_default(self):
+        assert "Server-Timing" not in self._get(StudentFactory(is_staff=True))
+
+    def test_staff_mode_shows_header_to_staff_only(self, settings):
+        settings.SERVER_TIMING = "staff"
+
+        assert "total" in _metrics(self._get(StudentFactory(is_staff=True))["Server-Timing"])
+        assert "Server-Timing" not in self._get(StudentFactory())
+        assert "Server-Timing" not in APIClient().get("/api/v1/courses/")
+
+    def test_log_works_without_header(self, settings, caplog):
+        settings.SERVER_TIMING_LOG = True
+
+        with caplog.at_level(logging.INFO, logger="core.middleware"):
+            response = APIClient().get("/api/v1/courses/")
+
+        assert "Server-Timing" not in response
+        assert [r for r in caplog.records if r.name == "core.middleware"]
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+from rest_framework.test import APIClient
+
+from core.tracing import get_exporter, span, traced
+from courses.tests.factories import TeacherFactory
+
+
+@pytest.fixture
+def tracing(settings, tmp_path):
+    settings.TRACING = True
+    settings.TRACING_EXPORT = str(tmp_path / "traces.jsonl")
+
+    def read_spans():
+        get_exporter().flush()
+        with open(settings.TRACING_EXPORT) as export:
+            documents = [json.loads(line) for line in export]
+        return [s for doc in documents for s in doc["resourceSpans"][0]["scopeSpans"][0]["spans"]]
+
+    return read_spans
+
+
+@traced
+class Calculator:
+    @staticmethod
+    def total(values):
+        return sum(values)
+
+    @staticmethod
+    def fail():
+        raise ValueError("boom")
+
+
+def test_traced_methods_are_untouched_outside_a_trace(settings):
+    settings.TRACING = False
+    assert Calculator.total([1, 2]) == 3
+
+
+def test_service_spans_nest_under_root(tracing):
+    with span("job"):
+        Calculator.total([1, 2, 3])
+        with pytest.raises(ValueError):
+            Calculator.fail()
+
+    root, total, fail = sorted(tracing(), key=lambda s: s["startTimeUnixNano"])
+    assert root["name"] == "job" and "parentSpanId" not in root
+    assert total["parentSpanId"] == root["spanId"] == fail["parentSpanId"]
+    assert {"key": "ocms.values.count", "value": {"intValue": "3"}} in total["attributes"]
+    assert fail["status"] == {"code": 2, "message": "boom"}
+
+
+@pytest.mark.django_db
+def test_request_trace_contains_service_and_sql_spans(tracing):
+    client = APIClient()
+    client.force_authenticate(TeacherFactory())
+    trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+
+    response = client.post(
+        "/api/v1/courses/",
+        {"title": "Traced", "description": ""},
+        HTTP_TRACEPARENT=f"00-{trace_id}-00f067aa0ba902b7-01",
+    )
+
+    spans = tracing()
+    by_name = {s["name"]: s for s in spans}
+    root = by_name["POST /api/v1/courses/"]
+    service = by_name["CourseService.create_course"]
+    queries = [s for s in spans if s["name"] == "db.query" and s["parentSpanId"] == service["spanId"]]
+
+    assert {s["traceId"] for s in spans} == {trace_id}
+    assert root["parentSpanId"] == "00f067aa0ba902b7"
+    assert {"key": "http.response.status_code", "value": {"intValue": "201"}} in root["attributes"]
+    assert service["parentSpanId"] == root["spanId"]
+    assert {"key": "ocms.result.id", "value": {"intValue": str(response.data["id"])}} in service["attributes"]
+    assert any(a["key"] == "db.rowcount" for q in queries for a in q["attributes"])
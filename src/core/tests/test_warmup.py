@@ -0,0 +1,91 @@
+from types import SimpleNamespace
+
+import pytest
+
+from api.compiled import compile_serializer
+from api.v1.courses.serializers import CourseSerializer
+from ocms import warmup
+
+
+class FakePool:
+    timeout = 5
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.opened = False
+
+    def open(self, wait, timeout):
+        if self.fail:
+            raise OSError("connection refused")
+        self.opened = wait and timeout == self.timeout
+
+
+def test_url_resolver_collects_every_view():
+    patterns, views = warmup._warm_url_resolver()
+
+    assert patterns == len(views) > 0
+    assert any(getattr(view, "cls", None) is not None and view.cls.__name__ == "CourseViewSet" for view in views)
+
+
+def test_serializers_are_compiled_into_the_shared_cache(settings):
+    settings.COMPILED_SERIALIZERS = True
+    compile_serializer.cache_clear()
+
+    compiled = warmup._warm_serializers(warmup._warm_url_resolver()[1])
+
+    assert compiled > 0
+    assert compile_serializer.cache_info().currsize >= compiled
+    hits = compile_serializer.cache_info().hits
+    compile_serializer(CourseSerializer)
+    assert compile_serializer.cache_info().hits == hits + 1
+
+
+def test_serializers_are_not_compiled_when_disabled(settings):
+    settings.COMPILED_SERIALIZERS = False
+
+    assert warmup._warm_serializers(warmup._warm_url_resolver()[1]) == 0
+
+
+@pytest.fixture
+def fake_connections(monkeypatch):
+    aliases = [
+        SimpleNamespace(alias="default", pool=FakePool()),
+        SimpleNamespace(alias="replica", pool=FakePool(fail=True)),
+        SimpleNamespace(alias="sqlite"),
+    ]
+    monkeypatch.setattr(warmup.connections, "all", lambda: aliases)
+    return aliases
+
+
+def test_open_connection_pools_fills_pooled_aliases(fake_connections):
+    assert warmup.open_connection_pools() == 1
+    assert fake_connections[0].pool.opened
+
+
+def test_open_connection_pools_without_pool():
+    # The test database is not pooled; nothing to open.
+    assert warmup.open_connection_pools() == 0
+
+
+def test_close_database_connections_closes_pools(monkeypatch, fake_connections):
+    closed = []
+    for connection in fake_connections[:2]:
+        connection.close_pool = lambda alias=connection.alias: closed.append(alias)
+    monkeypatch.setattr(warmup.connections, "close_all", lambda: None)
+
+    warmup.close_database_connections()
+
+    assert closed == ["default", "replica"]
+
+
+def test_gunicorn_config_keeps_metric_files_until_on_starting(monkeypatch, tmp_path):
+    import importlib
+
+    monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+    (tmp_path / "counter_1.db").write_bytes(b"")
+
+    config = importlib.reload(importlib.import_module("ocms.gunicorn"))
+    assert (tmp_path / "counter_1.db").exists()
+
+    config.on_starting(server=None)
+    assert tmp_path.exists() and not any(tmp_path.iterdir())
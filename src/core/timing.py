@@ -0,0 +1,89 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class RequestTimings:
+    """Accumulated per-phase durations (in seconds) for a single request."""
+
+    def __init__(self):
+        self.durations: dict[str, float] = {}
+        self.queries = 0
+
+    def add(self, name: str, seconds: float) -> None:
+        """Add time to a phase; repeated phases (e.g. several permission checks) accumulate."""
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+
+    @contextmanager
+    def measure(self, name: str):
+        """Time the wrapped block as part of the given phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def as_dict(self) -> dict[str, float]:
+        """Return durations in milliseconds, rounded for display and logging."""
+        return {name: round(seconds * 1000, 2) for name, seconds in self.durations.items()}
+
+    def header_value(self) -> str:
+        """Format the durations as a ``Server-Timing`` header value."""
+        metrics = []
+        for name, duration in self.as_dict().items():
+            metric = f"{name};dur={duration}"
+            if name == "db":
+                metric += f';desc="{self.queries} queries"'
+            metrics.append(metric)
+        return ", ".join(metrics)
+
+
+_current: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def current_timings() -> RequestTimings | None:
+    """Return the timings of the request being handled, if timing is active."""
+    return _current.get()
+
+
+@contextmanager
+def timing_context():
+    """Collect timings for everything run inside the block."""
+    timings = RequestTimings()
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def measure(name: str):
+    """Time the wrapped block under the current request, or do nothing outside one."""
+    timings = _current.get()
+    if timings is None:
+        yield
+        return
+    with timings.measure(name):
+        yield
+
+
+def time_query(execute, sql, params, many, context):
+    """Database execute wrapper that charges query time to the current request."""
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    timings.queries += 1
+    with timings.measure("db"):
+        return execute(sql, params, many, context)
+
+
+def install_query_timer(sender, connection, **kwargs):
+    """Attach the query timer to every database connection once.
+
+    Installed on ``connection_created`` rather than per request so queries run
+    from ``sync_to_async`` threads are timed too; the request is found through
+    the context variable, which asgiref propagates into those threads.
+    """
+    if time_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(time_query)
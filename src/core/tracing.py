@@ -0,0 +1,350 @@
+"""Opt-in request tracing with spans exported as OTLP/JSON.
+
+With ``TRACING=1`` every request opens a root span (``TracingMiddleware``).
+Methods of classes decorated with ``@traced`` and every SQL query run during
+the request become child spans. Finished traces are written by a background
+thread to ``TRACING_EXPORT``: a file (one OTLP ``ExportTraceServiceRequest``
+JSON document per line) or an ``http(s)://`` URL of a local collector's OTLP/HTTP
+traces endpoint, e.g. ``http://127.0.0.1:4318/v1/traces``.
+"""
+
+import functools
+import inspect
+import json
+import logging
+import os
+import queue
+import secrets
+import threading
+import time
+import urllib.request
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import models
+
+logger = logging.getLogger(__name__)
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+_MAX_STATEMENT_LENGTH = 2000
+
+
+class Trace:
+    """Finished spans of one trace, exported together when the root span ends."""
+
+    def __init__(self, trace_id: str | None = None):
+        self.trace_id = trace_id or secrets.token_hex(16)
+        self.spans: list[Span] = []
+        self.dropped = 0
+
+    def record(self, span: "Span") -> None:
+        """Keep a finished span, up to ``TRACING_MAX_SPANS`` per trace."""
+        if len(self.spans) < settings.TRACING_MAX_SPANS:
+            self.spans.append(span)
+        else:
+            self.dropped += 1
+
+
+class Span:
+    """A timed operation within a trace."""
+
+    def __init__(self, name: str, trace: Trace, parent_id: str = "", kind: int = SPAN_KIND_INTERNAL):
+        self.name = name
+        self.trace = trace
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.kind = kind
+        self.attributes: dict = {}
+        self.status = (0, "")
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+
+    def set_attribute(self, key: str, value) -> None:
+        """Attach an attribute; ``None`` values are skipped."""
+        if value is not None:
+            self.attributes[key] = value
+
+    def set_error(self, exc: BaseException) -> None:
+        """Mark the span as failed by the given exception."""
+        self.status = (STATUS_ERROR, str(exc))
+        self.set_attribute("exception.type", type(exc).__qualname__)
+
+    def end(self) -> None:
+        """Finish the span and hand it to its trace."""
+        self.end_ns = time.time_ns()
+        self.trace.record(self)
+
+    def to_otlp(self) -> dict:
+        """Return the span in OTLP/JSON form."""
+        data = {
+            "traceId": self.trace.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in self.attributes.items()],
+        }
+        if self.parent_id:
+            data["parentSpanId"] = self.parent_id
+        code, message = self.status
+        if code:
+            data["status"] = {"code": code, "message": message} if message else {"code": code}
+        return data
+
+
+def _otlp_value(value) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Span | None:
+    """Return the innermost open span, if a trace is active."""
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, kind: int = SPAN_KIND_INTERNAL, trace_id: str | None = None, parent_id: str = "", **attributes):
+    """Open a span as a child of the current one.
+
+    Outside a trace this starts a new root span when tracing is enabled, and
+    otherwise yields ``None`` without recording anything.
+    """
+    parent = _current_span.get()
+    if parent is None:
+        if not settings.TRACING:
+            yield None
+            return
+        new_span = Span(name, Trace(trace_id), parent_id=parent_id, kind=kind)
+    else:
+        new_span = Span(name, parent.trace, parent_id=parent.span_id, kind=kind)
+
+    for key, value in attributes.items():
+        new_span.set_attribute(key, value)
+    token = _current_span.set(new_span)
+    try:
+        yield new_span
+    except BaseException as exc:
+        new_span.set_error(exc)
+        raise
+    finally:
+        _current_span.reset(token)
+        new_span.end()
+        if parent is None:
+            _export_trace(new_span)
+
+
+def _argument_attributes(signature: inspect.Signature, args, kwargs) -> dict:
+    """Describe model instances and ``*_id`` arguments as span attributes."""
+    try:
+        bound = signature.bind_partial(*args, **kwargs)
+    except TypeError:
+        return {}
+    attributes = {}
+    for name, value in bound.arguments.items():
+        if isinstance(value, models.Model):
+            attributes[f"ocms.{name}.id"] = value.pk
+            course_id = value.pk if value._meta.model_name == "course" else getattr(value, "course_id", None)
+            if course_id is not None:
+                attributes.setdefault("ocms.course.id", course_id)
+        elif name.endswith("_id") and isinstance(value, int):
+            attributes[f"ocms.{name[:-3]}.id"] = value
+        elif isinstance(value, (list, tuple)):
+            attributes[f"ocms.{name}.count"] = len(value)
+    return attributes
+
+
+def _record_result(current: Span, result) -> None:
+    if isinstance(result, models.Model):
+        current.set_attribute("ocms.result.id", result.pk)
+    elif isinstance(result, (list, tuple, set)):
+        current.set_attribute("ocms.result.count", len(result))
+
+
+def _traced_function(func, name: str):
+    signature = inspect.signature(func)
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return await func(*args, **kwargs)
+            with span(name, **_argument_attributes(signature, args, kwargs)) as current:
+                result = await func(*args, **kwargs)
+                _record_result(current, result)
+                return result
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _current_span.get() is None:
+            return func(*args, **kwargs)
+        with span(name, **_argument_attributes(signature, args, kwargs)) as current:
+            result = func(*args, **kwargs)
+            _record_result(current, result)
+            return result
+
+    return wrapper
+
+
+def traced(cls):
+    """Class decorator turning every public method into a span named ``Class.method``.
+
+    Spans are only recorded inside an active trace; outside one the overhead
+    is a single context variable lookup per call.
+    """
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_"):
+            continue
+        name = f"{cls.__name__}.{attr}"
+        if isinstance(value, staticmethod):
+            setattr(cls, attr, staticmethod(_traced_function(value.__func__, name)))
+        elif isinstance(value, classmethod):
+            setattr(cls, attr, classmethod(_traced_function(value.__func__, name)))
+        elif inspect.isfunction(value):
+            setattr(cls, attr, _traced_function(value, name))
+    return cls
+
+
+def trace_query(execute, sql, params, many, context):
+    """Database execute wrapper recording each query as a client span."""
+    if _current_span.get() is None:
+        return execute(sql, params, many, context)
+    connection = context["connection"]
+    with span(
+        "db.query",
+        kind=SPAN_KIND_CLIENT,
+        **{
+            "db.system": connection.vendor,
+            "db.name": connection.alias,
+            "db.statement": sql[:_MAX_STATEMENT_LENGTH],
+            "db.executemany": many,
+        },
+    ) as current:
+        result = execute(sql, params, many, context)
+        rowcount = getattr(context.get("cursor"), "rowcount", -1)
+        if rowcount is not None and rowcount >= 0:
+            current.set_attribute("db.rowcount", rowcount)
+        return result
+
+
+def install_query_tracer(sender, connection, **kwargs):
+    """Attach the query tracer to every database connection once."""
+    if trace_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(trace_query)
+
+
+class OTLPJsonExporter:
+    """Write finished traces from a background thread to a file or an OTLP/HTTP collector."""
+
+    def __init__(self, target: str, service_name: str, max_queue: int = 1000):
+        self.target = target
+        self.service_name = service_name
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def export(self, trace: Trace) -> None:
+        """Queue a trace for export, dropping it if the exporter is backed up."""
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait(trace)
+        except queue.Full:
+            logger.warning("Tracing export queue is full, dropping trace %s", trace.trace_id)
+
+    def flush(self) -> None:
+        """Block until every queued trace has been written."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def payload(self, trace: Trace) -> dict:
+        """Build the ``ExportTraceServiceRequest`` document for a trace."""
+        resource_attributes = [
+            {"key": "service.name", "value": {"stringValue": self.service_name}},
+            {"key": "process.pid", "value": {"intValue": str(os.getpid())}},
+        ]
+        if trace.dropped:
+            resource_attributes.append({"key": "ocms.dropped_spans", "value": {"intValue": str(trace.dropped)}})
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": resource_attributes},
+                    "scopeSpans": [
+                        {"scope": {"name": __name__}, "spans": [recorded.to_otlp() for recorded in trace.spans]}
+                    ],
+                }
+            ]
+        }
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="otlp-exporter", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            trace = self._queue.get()
+            try:
+                self._write(json.dumps(self.payload(trace), separators=(",", ":")))
+            except Exception:
+                logger.exception("Failed to export trace %s", trace.trace_id)
+            finally:
+                self._queue.task_done()
+
+    def _write(self, document: str) -> None:
+        if self.target.startswith(("http://", "https://")):
+            request = urllib.request.Request(
+                self.target, data=document.encode(), headers={"Content-Type": "application/json"}, method="POST"
+            )
+            with urllib.request.urlopen(request, timeout=5):
+                pass
+        else:
+            with open(self.target, "a", encoding="utf-8") as output:
+                output.write(document + "\n")
+
+
+_exporter: OTLPJsonExporter | None = None
+_exporter_lock = threading.Lock()
+
+
+def get_exporter() -> OTLPJsonExporter:
+    """Return the process-wide exporter for the configured ``TRACING_EXPORT`` target."""
+    global _exporter
+    target = str(settings.TRACING_EXPORT)
+    if _exporter is None or _exporter.target != target:
+        with _exporter_lock:
+            if _exporter is None or _exporter.target != target:
+                _exporter = OTLPJsonExporter(target, settings.TRACING_SERVICE_NAME)
+    return _exporter
+
+
+def _export_trace(root: Span) -> None:
+    get_exporter().export(root.trace)
+
+
+def parse_traceparent(header: str) -> tuple[str | None, str]:
+    """Extract the trace and parent span ids from a W3C ``traceparent`` header."""
+    parts = header.split("-")
+    if len(parts) == 4 and len(parts[1]) == 32 and len(parts[2]) == 16 and parts[1] != "0" * 32:
+        return parts[1], parts[2]
+    return None, ""
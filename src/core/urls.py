@@ -0,0 +1,7 @@
+from django.urls import path
+
+from .views import DatabasePoolStatsView
+
+urlpatterns = [
+    path("db-pool/", DatabasePoolStatsView.as_view(), name="db-pool-stats"),
+]
@@ -0,0 +1,58 @@
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+from django.utils.module_loading import import_string
+from rest_framework import permissions, response, views
+
+from .db import pool_stats
+from .metrics import refresh_pool_gauges, render_metrics
+
+LOOPBACK_ADDRESSES = {"127.0.0.1", "::1"}
+
+
+class DatabasePoolStatsView(views.APIView):
+    """Expose this worker's database pool size, wait time and connection age."""
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        """Return pool metrics for every database alias."""
+        return response.Response(pool_stats())
+
+
+def metrics_view(request):
+    """Serve Prometheus metrics to scrapers sending ``METRICS_TOKEN``, or to direct local requests without one."""
+    token = settings.METRICS_TOKEN
+    if token:
+        allowed = constant_time_compare(request.headers.get("Authorization", ""), f"Bearer {token}")
+    else:
+        allowed = _is_direct_local_request(request)
+    if not allowed:
+        return HttpResponseForbidden()
+    refresh_pool_gauges(force=True)
+    payload, content_type = render_metrics()
+    return HttpResponse(payload, content_type=content_type)
+
+
+def _is_direct_local_request(request) -> bool:
+    # A reverse proxy on the same host connects from loopback too, but adds a forwarding header.
+    proxied = "Forwarded" in request.headers or "X-Forwarded-For" in request.headers
+    return not proxied and request.META.get("REMOTE_ADDR") in LOOPBACK_ADDRESSES
+
+
+def lazy_view(dotted_path: str, **initkwargs):
+    """Return a view that imports the class-based view at ``dotted_path`` on its first request.
+
+    For rarely used, import-heavy views (schema generation, docs) that should
+    not slow down loading the URLconf.
+    """
+    resolved = None
+
+    def view(request, *args, **kwargs):
+        nonlocal resolved
+        if resolved is None:
+            resolved = import_string(dotted_path).as_view(**initkwargs)
+        return resolved(request, *args, **kwargs)
+
+    view.__name__ = dotted_path.rpartition(".")[2]
+    return view
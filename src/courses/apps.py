@@ -1,4 +1,5 @@
 from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_save, pre_delete
 
 
 class CoursesConfig(AppConfig):
@@ -6,3 +7,25 @@ class CoursesConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "courses"
+
+    def ready(self):
+        """Connect the course access, sync tombstone, missing-submission and metrics signals."""
+        from .models import Course, Grade, GradeComment, HomeworkAssignment, Lecture, Submission
+        from .signals import (
+            clear_missing_submission,
+            count_enrollments,
+            count_grade,
+            count_submission,
+            record_tombstone,
+            sync_student_access,
+            sync_teacher_access,
+        )
+
+        m2m_changed.connect(sync_teacher_access, sender=Course.teachers.through, dispatch_uid="courses.teacher_access")
+        m2m_changed.connect(sync_student_access, sender=Course.students.through, dispatch_uid="courses.student_access")
+        m2m_changed.connect(count_enrollments, sender=Course.students.through, dispatch_uid="courses.count_enrollments")
+        post_save.connect(count_submission, sender=Submission, dispatch_uid="courses.count_submission")
+        post_save.connect(clear_missing_submission, sender=Submission, dispatch_uid="courses.clear_missing")
+        post_save.connect(count_grade, sender=Grade, dispatch_uid="courses.count_grade")
+        for model in (Course, Lecture, HomeworkAssignment, Submission, Grade, GradeComment):
+            pre_delete.connect(record_tombstone, sender=model, dispatch_uid=f"courses.tombstone.{model.__name__}")
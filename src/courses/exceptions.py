@@ -32,3 +32,9 @@ class UserRoleException(CourseException):
     """Raised when user doesn't have required role."""
 
     pass
+
+
+class CursorExpiredException(CourseException):
+    """Raised when a sync cursor is older than the retained deletion log."""
+
+    pass
@@ -0,0 +1,15 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from courses.services import SyncService
+
+
+class Command(BaseCommand):
+    help = "Delete sync tombstones older than the cursor lifetime (SYNC_TOMBSTONE_DAYS)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=settings.SYNC_TOMBSTONE_DAYS, help="Age to keep, in days.")
+
+    def handle(self, *args, **options):
+        deleted = SyncService.prune_tombstones(options["days"])
+        self.stdout.write(f"Deleted {deleted} tombstones older than {options['days']} days.")
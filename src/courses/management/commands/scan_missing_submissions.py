@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from courses.services import MissingSubmissionService
+
+
+class Command(BaseCommand):
+    help = "Record enrolled students who missed the deadline of assignments that became overdue since the last run."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None, help="Assignments per anti-join query.")
+
+    def handle(self, *args, **options):
+        result = MissingSubmissionService.scan(options["batch_size"])
+        self.stdout.write(
+            f"Scanned {result.assignments} assignments: {result.recorded} missing submissions recorded,"
+            f" {result.reset} assignments with a changed due date reset."
+        )
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-19 06:03
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_course_access(apps, schema_editor):
+    Course = apps.get_model("courses", "Course")
+    CourseAccess = apps.get_model("courses", "CourseAccess")
+    db_alias = schema_editor.connection.alias
+    memberships = [("TEACHER", Course.teachers.through), ("STUDENT", Course.students.through)]
+    for role, through in memberships:
+        rows = (
+            CourseAccess(user_id=user_id, course_id=course_id, role=role)
+            for course_id, user_id in through.objects.using(db_alias).values_list("course_id", "user_id").iterator()
+        )
+        CourseAccess.objects.using(db_alias).bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("courses", "0002_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CourseAccess",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("role", models.CharField(choices=[("TEACHER", "Teacher"), ("STUDENT", "Student")], max_length=7)),
+                (
+                    "course",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="access", to="courses.course"
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="course_access",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [models.Index(fields=["course", "role"], name="course_access_course_role_idx")],
+                "constraints": [
+                    models.UniqueConstraint(fields=("user", "role", "course"), name="unique_course_access")
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_course_access, migrations.RunPython.noop),
+    ]
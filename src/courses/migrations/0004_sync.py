@@ -0,0 +1,91 @@
+# Generated by Django 5.2.18 on 2026-10-19 09:12
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def backfill_timestamps(apps, schema_editor):
+    """Start modification times at creation times, and access grants at course creation."""
+    db_alias = schema_editor.connection.alias
+    created = {
+        "Course": "created_at",
+        "Lecture": "created_at",
+        "HomeworkAssignment": "created_at",
+        "Submission": "submitted_at",
+        "GradeComment": "created_at",
+    }
+    for model_name, field in created.items():
+        apps.get_model("courses", model_name).objects.using(db_alias).update(updated_at=models.F(field))
+
+    Course = apps.get_model("courses", "Course")
+    CourseAccess = apps.get_model("courses", "CourseAccess")
+    course_created = Course.objects.using(db_alias).filter(pk=models.OuterRef("course_id")).values("created_at")
+    CourseAccess.objects.using(db_alias).update(granted_at=models.Subquery(course_created[:1]))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("courses", "0003_course_access"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="course",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="courseaccess",
+            name="granted_at",
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="gradecomment",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="homeworkassignment",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="lecture",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name="submission",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name="grade",
+            name="graded_at",
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+        migrations.CreateModel(
+            name="Tombstone",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("model", models.CharField(max_length=32)),
+                ("object_id", models.BigIntegerField()),
+                ("course_id", models.BigIntegerField(blank=True, null=True)),
+                ("user_id", models.BigIntegerField(blank=True, null=True)),
+                ("deleted_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["course_id", "deleted_at"], name="tombstone_course_deleted_idx"),
+                    models.Index(fields=["user_id", "deleted_at"], name="tombstone_user_deleted_idx"),
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_timestamps, migrations.RunPython.noop),
+    ]
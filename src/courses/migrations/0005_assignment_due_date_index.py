@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-19 10:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("courses", "0004_sync"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="homeworkassignment",
+            name="due_date",
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+    ]
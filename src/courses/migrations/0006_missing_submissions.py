@@ -0,0 +1,73 @@
+# Generated by Django 5.2.18 on 2026-10-19 07:17
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("courses", "0005_assignment_due_date_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MissingSubmissionScan",
+            fields=[
+                (
+                    "assignment",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="missing_scan",
+                        serialize=False,
+                        to="courses.homeworkassignment",
+                    ),
+                ),
+                ("due_date", models.DateTimeField()),
+                ("scanned_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="MissingSubmission",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("due_date", models.DateTimeField()),
+                ("detected_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "assignment",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="missing_submissions",
+                        to="courses.homeworkassignment",
+                    ),
+                ),
+                (
+                    "course",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="missing_submissions",
+                        to="courses.course",
+                    ),
+                ),
+                (
+                    "student",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="missing_submissions",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["course", "due_date"], name="missing_course_due_idx"),
+                    models.Index(fields=["student", "due_date"], name="missing_student_due_idx"),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(fields=("assignment", "student"), name="unique_missing_submission")
+                ],
+            },
+        ),
+    ]
@@ -3,12 +3,15 @@ from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 
 from .querysets import (
+    CourseAccessQuerySet,
     CourseQuerySet,
     LectureQuerySet,
     HomeworkAssignmentQuerySet,
     SubmissionQuerySet,
     GradeQuerySet,
     GradeCommentQuerySet,
+    MissingSubmissionQuerySet,
+    TombstoneQuerySet,
 )
 
 User = settings.AUTH_USER_MODEL
@@ -23,6 +26,7 @@ class Course(models.Model):
     teachers = models.ManyToManyField(User, related_name="teaching_courses", blank=True)
     students = models.ManyToManyField(User, related_name="enrolled_courses", blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     objects = CourseQuerySet.as_manager()
 
     def __str__(self):
@@ -30,6 +34,37 @@ class Course(models.Model):
         return self.title
 
 
+class CourseAccess(models.Model):
+    """Row-level access table: one (user, course, role) row per course membership.
+
+    Maintained from ``Course.teachers`` / ``Course.students`` changes so that
+    visibility filters can use a single indexed semi-join instead of walking the
+    many-to-many tables.
+    """
+
+    class Roles(models.TextChoices):
+        """Enumeration for membership roles."""
+
+        TEACHER = "TEACHER", "Teacher"
+        STUDENT = "STUDENT", "Student"
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="course_access")
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name="access")
+    role = models.CharField(max_length=7, choices=Roles.choices)
+    granted_at = models.DateTimeField(auto_now_add=True)
+    objects = CourseAccessQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["user", "role", "course"], name="unique_course_access"),
+        ]
+        indexes = [models.Index(fields=["course", "role"], name="course_access_course_role_idx")]
+
+    def __str__(self):
+        """Return string representation of the access row."""
+        return f"{self.role} {self.user_id} in course {self.course_id}"
+
+
 class Lecture(models.Model):
     """Model representing a lecture within a course."""
 
@@ -38,6 +73,7 @@ class Lecture(models.Model):
     presentation = models.FileField(upload_to="presentations/", blank=True, null=True)
     created_by = models.ForeignKey(User, on_delete=models.CASCADE)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     objects = LectureQuerySet.as_manager()
 
     def __str__(self):
@@ -50,9 +86,10 @@ class HomeworkAssignment(models.Model):
 
     lecture = models.ForeignKey(Lecture, on_delete=models.CASCADE, related_name="assignments")
     text = models.TextField()
-    due_date = models.DateTimeField(blank=True, null=True)
+    due_date = models.DateTimeField(blank=True, null=True, db_index=True)
     created_by = models.ForeignKey(User, on_delete=models.CASCADE)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     objects = HomeworkAssignmentQuerySet.as_manager()
 
     def __str__(self):
@@ -68,6 +105,7 @@ class Submission(models.Model):
     text = models.TextField(blank=True)
     attachment = models.FileField(upload_to="submissions/", blank=True, null=True)
     submitted_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     objects = SubmissionQuerySet.as_manager()
 
     class Meta:
@@ -78,6 +116,49 @@ class Submission(models.Model):
         return f"Submission {self.id} by {self.student}"
 
 
+class MissingSubmission(models.Model):
+    """An enrolled student who did not submit an assignment by its due date.
+
+    Written by ``MissingSubmissionService.scan`` once the assignment is overdue
+    and removed when the student submits late. ``course`` and ``due_date`` are
+    copied from the assignment for per-course and per-student lookups.
+    """
+
+    assignment = models.ForeignKey(HomeworkAssignment, on_delete=models.CASCADE, related_name="missing_submissions")
+    student = models.ForeignKey(User, on_delete=models.CASCADE, related_name="missing_submissions")
+    course = models.ForeignKey(Course, on_delete=models.CASCADE, related_name="missing_submissions")
+    due_date = models.DateTimeField()
+    detected_at = models.DateTimeField(auto_now_add=True)
+    objects = MissingSubmissionQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["assignment", "student"], name="unique_missing_submission"),
+        ]
+        indexes = [
+            models.Index(fields=["course", "due_date"], name="missing_course_due_idx"),
+            models.Index(fields=["student", "due_date"], name="missing_student_due_idx"),
+        ]
+
+    def __str__(self):
+        """Return string representation of the missing submission."""
+        return f"Missing submission of assignment {self.assignment_id} by {self.student_id}"
+
+
+class MissingSubmissionScan(models.Model):
+    """Marks an assignment as scanned for missing submissions, at the due date it had then."""
+
+    assignment = models.OneToOneField(
+        HomeworkAssignment, on_delete=models.CASCADE, primary_key=True, related_name="missing_scan"
+    )
+    due_date = models.DateTimeField()
+    scanned_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        """Return string representation of the scan marker."""
+        return f"Assignment {self.assignment_id} scanned for due date {self.due_date}"
+
+
 class Grade(models.Model):
     """Model representing a grade for a submission."""
 
@@ -85,7 +166,7 @@ class Grade(models.Model):
     score = models.PositiveSmallIntegerField(validators=[MinValueValidator(0), MaxValueValidator(100)])
     comment = models.TextField(blank=True)
     graded_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
-    graded_at = models.DateTimeField(auto_now=True)
+    graded_at = models.DateTimeField(auto_now=True, db_index=True)
     objects = GradeQuerySet.as_manager()
 
     def __str__(self):
@@ -100,8 +181,36 @@ class GradeComment(models.Model):
     author = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
     text = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
     objects = GradeCommentQuerySet.as_manager()
 
     def __str__(self):
         """Return string representation of the grade comment."""
         return f"Comment by {self.author} on grade {self.grade_id}"
+
+
+class Tombstone(models.Model):
+    """Deletion log read by delta sync (``SyncService``), one row per deleted object.
+
+    ``course_id`` and ``user_id`` are plain copies rather than foreign keys, since
+    the rows they point at are usually being deleted too. Course deletions and
+    revoked memberships are recorded once per affected user, with ``course_id``
+    left empty.
+    """
+
+    model = models.CharField(max_length=32)
+    object_id = models.BigIntegerField()
+    course_id = models.BigIntegerField(null=True, blank=True)
+    user_id = models.BigIntegerField(null=True, blank=True)
+    deleted_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    objects = TombstoneQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["course_id", "deleted_at"], name="tombstone_course_deleted_idx"),
+            models.Index(fields=["user_id", "deleted_at"], name="tombstone_user_deleted_idx"),
+        ]
+
+    def __str__(self):
+        """Return string representation of the tombstone."""
+        return f"Deleted {self.model} {self.object_id}"
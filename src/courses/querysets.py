@@ -1,6 +1,6 @@
 from django.contrib.auth import get_user_model
 from django.db import models
-from django.db.models import Q
+from django.db.models import Exists, F, OuterRef, Q
 
 User = get_user_model()
 
@@ -29,6 +29,26 @@ class CourseQuerySet(models.QuerySet):
         return self.filter(title__icontains=title)
 
 
+class CourseAccessQuerySet(models.QuerySet):
+    """Custom QuerySet for CourseAccess model."""
+
+    def for_user(self, user):
+        """Get access rows of a specific user."""
+        return self.filter(user=user)
+
+    def teaching(self):
+        """Get access rows granting the teacher role."""
+        return self.filter(role="TEACHER")
+
+    def studying(self):
+        """Get access rows granting the student role."""
+        return self.filter(role="STUDENT")
+
+    def course_ids(self):
+        """Get the course ids, for use as an IN/semi-join subquery."""
+        return self.values("course_id")
+
+
 class LectureQuerySet(models.QuerySet):
     """Custom QuerySet for Lecture model."""
 
@@ -76,7 +96,10 @@ class SubmissionQuerySet(models.QuerySet):
 
     def for_course_teachers(self, teacher):
         """Get submissions visible to course teacher."""
-        return self.filter(assignment__lecture__course__teachers=teacher)
+        from .models import CourseAccess
+
+        teaching = CourseAccess.objects.for_user(teacher).teaching().course_ids()
+        return self.filter(assignment__lecture__course_id__in=teaching)
 
 
 class HomeworkAssignmentQuerySet(models.QuerySet):
@@ -102,6 +125,40 @@ class HomeworkAssignmentQuerySet(models.QuerySet):
 
         return self.filter(due_date__lt=timezone.now())
 
+    def for_enrolled_student(self, student):
+        """Get assignments of the courses the user is enrolled in."""
+        from .models import CourseAccess
+
+        studying = CourseAccess.objects.for_user(student).studying().course_ids()
+        return self.filter(lecture__course_id__in=studying)
+
+    def due_between(self, start, end):
+        """Get assignments due in the ``[start, end)`` window."""
+        return self.filter(due_date__gte=start, due_date__lt=end)
+
+    def with_submitted(self, student):
+        """Annotate ``submitted``: whether the student has submitted the assignment."""
+        from .models import Submission
+
+        return self.annotate(submitted=Exists(Submission.objects.filter(assignment=OuterRef("pk"), student=student)))
+
+    def missing_scan_pending(self, now):
+        """Get overdue assignments the missing-submission scan has not recorded yet."""
+        return self.filter(due_date__lt=now, missing_scan__isnull=True)
+
+    def missing_scan_stale(self):
+        """Get assignments whose due date changed after the missing-submission scan recorded them."""
+        return self.filter(missing_scan__isnull=False).exclude(due_date=F("missing_scan__due_date"))
+
+    def missing_for(self, student):
+        """Get past-due assignments the student has not submitted."""
+        from django.utils import timezone
+
+        from .models import Submission
+
+        submitted = Submission.objects.filter(assignment=OuterRef("pk"), student=student)
+        return self.filter(~Exists(submitted), due_date__lt=timezone.now())
+
 
 class GradeQuerySet(models.QuerySet):
     """Custom QuerySet for Grade model."""
@@ -141,11 +198,65 @@ class GradeCommentQuerySet(models.QuerySet):
         return self.filter(grade_id=grade_id)
 
     def visible_to(self, user):
-        """Get comments that are visible to the user, either because they are the student."""
+        """Get comments visible to the user, as the submission's student or a course teacher."""
         if user.is_anonymous:
             return self.none()
 
+        from .models import CourseAccess
+
+        teaching = CourseAccess.objects.for_user(user).teaching().course_ids()
         student_condition = Q(grade__submission__student=user)
-        teacher_condition = Q(grade__submission__assignment__lecture__course__teachers=user)
+        teacher_condition = Q(grade__submission__assignment__lecture__course_id__in=teaching)
 
         return self.filter(student_condition | teacher_condition)
+
+
+class TombstoneQuerySet(models.QuerySet):
+    """Custom QuerySet for Tombstone model."""
+
+    # Deleted objects students learn about through course membership alone.
+    SHARED_MODELS = ("lecture", "homeworkassignment")
+
+    def visible_to(self, user):
+        """Get tombstones of objects the user could see, as a course teacher, student or owner."""
+        if user.is_anonymous:
+            return self.none()
+
+        from .models import CourseAccess
+
+        access = CourseAccess.objects.for_user(user)
+        return self.filter(
+            Q(user_id=user.pk)
+            | Q(course_id__in=access.teaching().course_ids())
+            | Q(model__in=self.SHARED_MODELS, course_id__in=access.studying().course_ids())
+        )
+
+    def deleted_after(self, moment):
+        """Get tombstones written after a point in time."""
+        return self.filter(deleted_at__gt=moment)
+
+
+class MissingSubmissionQuerySet(models.QuerySet):
+    """Custom QuerySet for MissingSubmission model."""
+
+    def with_relations(self):
+        """Prefetch related objects for efficient loading."""
+        return self.select_related("student")
+
+    def for_course(self, course_id: int):
+        """Get missing submissions in a specific course."""
+        return self.filter(course_id=course_id)
+
+    def for_student(self, student):
+        """Get missing submissions of a specific student."""
+        return self.filter(student=student)
+
+    def visible_to(self, user):
+        """Get missing submissions visible to the user, as the student or a course teacher."""
+        if user.is_anonymous:
+            return self.none()
+
+        from .models import CourseAccess
+
+        teaching = CourseAccess.objects.for_user(user).teaching().course_ids()
+        return self.filter(Q(student=user) | Q(course_id__in=teaching))
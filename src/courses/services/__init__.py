@@ -1,7 +1,31 @@
-from .course_service import CourseService
-from .lecture_service import LectureService
-from .homework_service import HomeworkService
-from .submission_service import SubmissionService
-from .grading_service import GradingService
+"""Course services, imported on first attribute access.
 
-__all__ = ["CourseService", "LectureService", "HomeworkService", "SubmissionService", "GradingService"]
+Importing ``courses.services`` only pays for the service modules actually used.
+"""
+
+import importlib
+
+_SERVICES = {
+    "CourseService": "course_service",
+    "LectureService": "lecture_service",
+    "HomeworkService": "homework_service",
+    "SubmissionService": "submission_service",
+    "GradingService": "grading_service",
+    "SyncService": "sync_service",
+    "DashboardService": "dashboard_service",
+    "MissingSubmissionService": "missing_submission_service",
+}
+
+__all__ = list(_SERVICES)
+
+
+def __getattr__(name):
+    if name not in _SERVICES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    service = getattr(importlib.import_module(f".{_SERVICES[name]}", __name__), name)
+    globals()[name] = service
+    return service
+
+
+def __dir__():
+    return sorted([*globals(), *__all__])
@@ -3,6 +3,8 @@ from django.contrib.auth import get_user_model
 from django.shortcuts import get_object_or_404
 from typing import List, Optional
 
+from core.tracing import traced
+
 from ..validators import CourseValidator
 from ..exceptions import UserRoleException, ValidationException
 from ..models import Course
@@ -11,6 +13,7 @@ User = get_user_model()
 logger = logging.getLogger(__name__)
 
 
+@traced
 class CourseService:
     """Service class for course-related operations."""
 
@@ -18,11 +21,11 @@ class CourseService:
     def create_course(title: str, description: str, created_by) -> Course:
         """Create a new course and add creator as teacher."""
 
-        logger.info(f"Creating course '{title}' by user {created_by.id}")
+        logger.info("Creating course '%s' by user %s", title, created_by.id)
 
         course = Course.objects.create(title=title, description=description, created_by=created_by)
         course.teachers.add(created_by)
-        logger.info(f"Course {course.id} created successfully")
+        logger.info("Course %s created successfully", course.id)
         return course
 
     @staticmethod
@@ -35,7 +38,7 @@ class CourseService:
         CourseValidator.validate_student_not_enrolled(course, student)
 
         course.students.add(student)
-        logger.info(f"Student {student_id} added to course {course.id}")
+        logger.info("Student %s added to course %s", student_id, course.id)
 
     @staticmethod
     def remove_student_from_course(course: Course, student_id: int) -> None:
@@ -43,7 +46,7 @@ class CourseService:
 
         student = get_object_or_404(User, id=student_id)
         course.students.remove(student)
-        logger.info(f"Student {student_id} removed from course {course.id}")
+        logger.info("Student %s removed from course %s", student_id, course.id)
 
     @staticmethod
     def add_teacher_to_course(course: Course, teacher_id: int) -> None:
@@ -54,7 +57,7 @@ class CourseService:
         CourseValidator.validate_teacher_not_assigned(course, teacher)
 
         course.teachers.add(teacher)
-        logger.info(f"Teacher {teacher_id} added to course {course.id}")
+        logger.info("Teacher %s added to course %s", teacher_id, course.id)
 
     @staticmethod
     def get_course_students(course: Course) -> List[User]:
@@ -79,3 +82,15 @@ class CourseService:
         """Check if user is a student of the course."""
 
         return course.students.filter(id=user.id).exists()
+
+    @staticmethod
+    async def ais_user_course_teacher(course: Course, user) -> bool:
+        """Async variant of `is_user_course_teacher` for ASGI views."""
+
+        return await course.teachers.filter(id=user.id).aexists()
+
+    @staticmethod
+    async def ais_user_course_student(course: Course, user) -> bool:
+        """Async variant of `is_user_course_student` for ASGI views."""
+
+        return await course.students.filter(id=user.id).aexists()
@@ -0,0 +1,127 @@
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Avg, Count, F, Q
+from django.utils import timezone
+
+from core.tracing import traced
+
+from ..models import Course, CourseAccess, Grade, HomeworkAssignment, Submission
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StudentDashboard:
+    """Everything a student's home screen shows."""
+
+    courses: list[Course]
+    upcoming: list[HomeworkAssignment]
+    missing: list[HomeworkAssignment]
+    recent_grades: list[Grade]
+
+
+@dataclass
+class CourseWorkload:
+    """Per-course figures on a teacher's dashboard."""
+
+    id: int
+    title: str
+    student_count: int = 0
+    assignment_count: int = 0
+    due_this_week: int = 0
+    submission_count: int = 0
+    awaiting_grading: int = 0
+    average_score: float | None = None
+
+
+@traced
+class DashboardService:
+    """Service class for the single-call dashboards."""
+
+    @staticmethod
+    def get_student_dashboard(student) -> StudentDashboard:
+        """Collect the student's courses, upcoming and missing work and recent grades.
+
+        Takes five queries however many courses, lectures and assignments the
+        student has: one per list, plus one for the course teachers.
+        """
+
+        now = timezone.now()
+        limit = settings.DASHBOARD_LIST_LIMIT
+        studying = CourseAccess.objects.for_user(student).studying().course_ids()
+        assignments = HomeworkAssignment.objects.for_enrolled_student(student).select_related("lecture")
+
+        courses = list(Course.objects.filter(pk__in=studying).prefetch_related("teachers").order_by("title"))
+        upcoming = list(
+            assignments.due_between(now, now + timedelta(days=settings.DASHBOARD_UPCOMING_DAYS))
+            .with_submitted(student)
+            .order_by("due_date", "pk")[:limit]
+        )
+        missing = list(assignments.missing_for(student).order_by("-due_date", "-pk")[:limit])
+        recent_grades = list(
+            Grade.objects.for_student(student)
+            .select_related("submission", "graded_by")
+            .order_by("-graded_at", "-pk")[:limit]
+        )
+
+        logger.info(
+            "Student dashboard for user %s: %d courses, %d upcoming, %d missing",
+            student.pk,
+            len(courses),
+            len(upcoming),
+            len(missing),
+        )
+        return StudentDashboard(courses=courses, upcoming=upcoming, missing=missing, recent_grades=recent_grades)
+
+    @staticmethod
+    def get_teacher_dashboard(teacher) -> list[CourseWorkload]:
+        """Compute the workload of every course the user teaches.
+
+        One grouped query per table (courses, enrollments, assignments, and
+        submissions joined to their grades) with conditional aggregates, so
+        the query count does not depend on the number of courses.
+        """
+
+        now = timezone.now()
+        teaching = CourseAccess.objects.for_user(teacher).teaching().course_ids()
+        workloads = {
+            course["id"]: CourseWorkload(**course)
+            for course in Course.objects.filter(pk__in=teaching).order_by("title", "pk").values("id", "title")
+        }
+
+        enrollments = (
+            CourseAccess.objects.studying()
+            .filter(course_id__in=teaching)
+            .values("course_id")
+            .annotate(student_count=Count("pk"))
+        )
+        assignments = (
+            HomeworkAssignment.objects.filter(lecture__course_id__in=teaching)
+            .values(course_id=F("lecture__course_id"))
+            .annotate(
+                assignment_count=Count("pk"),
+                due_this_week=Count("pk", filter=Q(due_date__gte=now, due_date__lt=now + timedelta(days=7))),
+            )
+        )
+        submissions = (
+            Submission.objects.filter(assignment__lecture__course_id__in=teaching)
+            .values(course_id=F("assignment__lecture__course_id"))
+            .annotate(
+                submission_count=Count("pk"),
+                awaiting_grading=Count("pk", filter=Q(grade__isnull=True)),
+                average_score=Avg("grade__score"),
+            )
+        )
+        for rows in (enrollments, assignments, submissions):
+            for row in rows:
+                # A course the teacher joined after the first query is left out, not half-filled.
+                workload = workloads.get(row.pop("course_id"))
+                if workload is not None:
+                    for name, value in row.items():
+                        setattr(workload, name, value)
+
+        logger.info("Teacher dashboard for user %s: %d courses", teacher.pk, len(workloads))
+        return list(workloads.values())
@@ -1,6 +1,8 @@
 import logging
 from typing import Optional
 
+from core.tracing import traced
+
 from ..validators import GradingValidator
 from ..models import Grade, GradeComment, Submission
 from ..exceptions import PermissionDeniedException, ValidationException
@@ -8,6 +10,7 @@ from ..exceptions import PermissionDeniedException, ValidationException
 logger = logging.getLogger(__name__)
 
 
+@traced
 class GradingService:
     """Service class for grading operations."""
 
@@ -19,10 +22,10 @@ class GradingService:
         GradingValidator.validate_user_is_course_teacher(course, graded_by)
         GradingValidator.validate_grade_does_not_exist(submission)
 
-        logger.info(f"Creating grade for submission {submission.id} by teacher {graded_by.id}")
+        logger.info("Creating grade for submission %s by teacher %s", submission.id, graded_by.id)
 
         grade = Grade.objects.create(submission=submission, score=score, comment=comment, graded_by=graded_by)
-        logger.info(f"Grade {grade.id} created successfully")
+        logger.info("Grade %s created successfully", grade.id)
         return grade
 
     @staticmethod
@@ -32,13 +35,13 @@ class GradingService:
         course = grade.submission.assignment.lecture.course
         GradingValidator.validate_user_is_course_teacher(course, user)
 
-        logger.info(f"Updating grade {grade.id}")
+        logger.info("Updating grade %s", grade.id)
 
         for field, value in validated_data.items():
             setattr(grade, field, value)
 
         grade.save()
-        logger.info(f"Grade {grade.id} updated successfully")
+        logger.info("Grade %s updated successfully", grade.id)
         return grade
 
     @staticmethod
@@ -60,9 +63,9 @@ class GradingService:
 
         GradingValidator.validate_user_can_comment(grade, author)
 
-        logger.info(f"Creating comment on grade {grade.id} by user {author.id}")
+        logger.info("Creating comment on grade %s by user %s", grade.id, author.id)
 
         comment = GradeComment.objects.create(grade=grade, author=author, text=text)
 
-        logger.info(f"Grade comment {comment.id} created successfully")
+        logger.info("Grade comment %s created successfully", comment.id)
         return comment
@@ -2,11 +2,14 @@ import logging
 from typing import Optional
 from django.db.models import QuerySet
 
+from core.tracing import traced
+
 from ..models import HomeworkAssignment, Lecture
 
 logger = logging.getLogger(__name__)
 
 
+@traced
 class HomeworkService:
     """Service class for homework assignment operations."""
 
@@ -14,22 +17,22 @@ class HomeworkService:
     def create_homework_assignment(text: str, lecture: Lecture, created_by, due_date=None) -> HomeworkAssignment:
         """Create a new homework assignment."""
 
-        logger.info(f"Creating homework assignment for lecture {lecture.id} by user {created_by.id}")
+        logger.info("Creating homework assignment for lecture %s by user %s", lecture.id, created_by.id)
         assignment = HomeworkAssignment.objects.create(
             text=text, lecture=lecture, created_by=created_by, due_date=due_date
         )
 
-        logger.info(f"Homework assignment {assignment.id} created successfully")
+        logger.info("Homework assignment %s created successfully", assignment.id)
         return assignment
 
     @staticmethod
     def update_homework_assignment(assignment: HomeworkAssignment, **validated_data) -> HomeworkAssignment:
         """Update homework assignment with validated data."""
 
-        logger.info(f"Updating homework assignment {assignment.id}")
+        logger.info("Updating homework assignment %s", assignment.id)
         for field, value in validated_data.items():
             setattr(assignment, field, value)
 
         assignment.save()
-        logger.info(f"Homework assignment {assignment.id} updated successfully")
+        logger.info("Homework assignment %s updated successfully", assignment.id)
         return assignment
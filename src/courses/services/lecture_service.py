@@ -2,11 +2,14 @@ import logging
 from typing import Optional
 from django.db.models import QuerySet
 
+from core.tracing import traced
+
 from ..models import Lecture, Course
 
 logger = logging.getLogger(__name__)
 
 
+@traced
 class LectureService:
     """Service class for lecture-related operations."""
 
@@ -14,20 +17,20 @@ class LectureService:
     def create_lecture(topic: str, course: Course, created_by, presentation=None) -> Lecture:
         """Create a new lecture."""
 
-        logger.info(f"Creating lecture '{topic}' for course {course.id} by user {created_by.id}")
+        logger.info("Creating lecture '%s' for course %s by user %s", topic, course.id, created_by.id)
         lecture = Lecture.objects.create(topic=topic, course=course, created_by=created_by, presentation=presentation)
 
-        logger.info(f"Lecture {lecture.id} created successfully")
+        logger.info("Lecture %s created successfully", lecture.id)
         return lecture
 
     @staticmethod
     def update_lecture(lecture: Lecture, **validated_data) -> Lecture:
         """Update lecture with validated data."""
 
-        logger.info(f"Updating lecture {lecture.id}")
+        logger.info("Updating lecture %s", lecture.id)
         for field, value in validated_data.items():
             setattr(lecture, field, value)
 
         lecture.save()
-        logger.info(f"Lecture {lecture.id} updated successfully")
+        logger.info("Lecture %s updated successfully", lecture.id)
         return lecture
@@ -0,0 +1,103 @@
+import logging
+from dataclasses import dataclass
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef, Q
+from django.utils import timezone
+
+from core.tracing import traced
+
+from ..models import CourseAccess, HomeworkAssignment, MissingSubmission, MissingSubmissionScan, Submission
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScanResult:
+    """Outcome of one missing-submission scan."""
+
+    assignments: int = 0
+    recorded: int = 0
+    reset: int = 0
+
+
+@traced
+class MissingSubmissionService:
+    """Service class for recording enrolled students who missed a deadline."""
+
+    @staticmethod
+    def scan(batch_size: int | None = None) -> ScanResult:
+        """Record missing submissions of assignments that became overdue since the last scan.
+
+        Each assignment is scanned once per due date: records of assignments whose
+        due date changed are dropped and the assignment is scanned again once it
+        is overdue. Each batch of assignments runs the anti-join (enrolled students
+        without a submission) as a single query.
+        """
+
+        batch_size = batch_size or settings.MISSING_SCAN_BATCH_SIZE
+        now = timezone.now()
+        result = ScanResult()
+
+        stale = list(HomeworkAssignment.objects.missing_scan_stale().values_list("pk", flat=True))
+        if stale:
+            with transaction.atomic():
+                MissingSubmission.objects.filter(assignment_id__in=stale).delete()
+                MissingSubmissionScan.objects.filter(assignment_id__in=stale).delete()
+            result.reset = len(stale)
+
+        pending = HomeworkAssignment.objects.missing_scan_pending(now).order_by("due_date", "pk")
+        while batch := list(pending.values_list("pk", "due_date")[:batch_size]):
+            with transaction.atomic():
+                rows = MissingSubmissionService._missing([pk for pk, _ in batch])
+                MissingSubmission.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+                MissingSubmissionScan.objects.bulk_create(
+                    [MissingSubmissionScan(assignment_id=pk, due_date=due_date) for pk, due_date in batch],
+                    ignore_conflicts=True,
+                )
+            result.assignments += len(batch)
+            result.recorded += len(rows)
+
+        logger.info(
+            "Missing-submission scan: %d assignments, %d records, %d reset",
+            result.assignments,
+            result.recorded,
+            result.reset,
+        )
+        return result
+
+    @staticmethod
+    def _missing(assignment_ids) -> list[MissingSubmission]:
+        """Enrolled students without a submission, for each of the given assignments."""
+
+        students = (
+            HomeworkAssignment.objects.filter(
+                pk__in=assignment_ids, lecture__course__access__role=CourseAccess.Roles.STUDENT
+            )
+            .annotate(missing_student=F("lecture__course__access__user_id"))
+            .filter(~Exists(Submission.objects.filter(assignment=OuterRef("pk"), student=OuterRef("missing_student"))))
+            .values_list("pk", "missing_student", "lecture__course_id", "due_date")
+        )
+        return [
+            MissingSubmission(assignment_id=assignment_id, student_id=student_id, course_id=course_id, due_date=due)
+            for assignment_id, student_id, course_id, due in students
+        ]
+
+    @staticmethod
+    def clear(assignment_id: int, student_id: int) -> None:
+        """Drop the record of a submission that has now arrived."""
+
+        MissingSubmission.objects.filter(assignment_id=assignment_id, student_id=student_id).delete()
+
+    @staticmethod
+    def forget_memberships(memberships) -> None:
+        """Drop the records of ``(user_id, course_id)`` members who left the course."""
+
+        memberships = list(memberships)
+        if memberships:
+            MissingSubmission.objects.filter(
+                reduce(or_, (Q(student_id=user_id, course_id=course_id) for user_id, course_id in memberships))
+            ).delete()
@@ -1,6 +1,9 @@
 import logging
 from django.db.models import QuerySet, Q
 from typing import Optional
+
+from core.tracing import traced
+
 from ..validators import SubmissionValidator
 from ..exceptions import NotEnrolledException, AlreadyGradedException, PermissionDeniedException
 from ..models import Submission, HomeworkAssignment
@@ -8,6 +11,7 @@ from ..models import Submission, HomeworkAssignment
 logger = logging.getLogger(__name__)
 
 
+@traced
 class SubmissionService:
     """Service class for submission-related operations."""
 
@@ -18,11 +22,11 @@ class SubmissionService:
         course = assignment.lecture.course
         SubmissionValidator.validate_student_is_enrolled(course, student)
 
-        logger.info(f"Creating submission for assignment {assignment.id} by student {student.id}")
+        logger.info("Creating submission for assignment %s by student %s", assignment.id, student.id)
 
         submission = Submission.objects.create(assignment=assignment, student=student, text=text, attachment=attachment)
 
-        logger.info(f"Submission {submission.id} created successfully")
+        logger.info("Submission %s created successfully", submission.id)
         return submission
 
     @staticmethod
@@ -32,13 +36,13 @@ class SubmissionService:
         SubmissionValidator.validate_submission_not_graded(submission)
         SubmissionValidator.validate_user_is_submission_owner(submission, user)
 
-        logger.info(f"Updating submission {submission.id}")
+        logger.info("Updating submission %s", submission.id)
 
         for field, value in validated_data.items():
             setattr(submission, field, value)
 
         submission.save()
-        logger.info(f"Submission {submission.id} updated successfully")
+        logger.info("Submission %s updated successfully", submission.id)
         return submission
 
     @staticmethod
@@ -0,0 +1,270 @@
+import logging
+import re
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from django.conf import settings
+from django.db import router, transaction
+from django.db.models import F, OuterRef, Q, Subquery, prefetch_related_objects
+from django.db.models.deletion import Collector
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from core.tracing import traced
+
+from ..exceptions import CursorExpiredException, ValidationException
+from ..models import Course, CourseAccess, Grade, GradeComment, HomeworkAssignment, Lecture, Submission, Tombstone
+
+logger = logging.getLogger(__name__)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_CURSOR = re.compile(r"[0-9]{1,19}")
+
+# Set while SyncService.delete() removes a cascade whose tombstones it has already written.
+_tombstones_written: ContextVar[bool] = ContextVar("tombstones_written", default=False)
+
+
+@dataclass(frozen=True)
+class SyncSource:
+    """One synced model: where its change time is and how it is scoped to courses and students."""
+
+    key: str
+    model: type
+    timestamp: str
+    course: str
+    owner: str | None = None
+    select: tuple[str, ...] = ()
+    prefetch: tuple[str, ...] = ()
+
+    def visible(self, user, access) -> Q:
+        """Rows the user sees: everything in their courses, or for owned rows their own and their pupils'."""
+        if self.owner is None:
+            return Q(**{f"{self.course}__in": access.course_ids()})
+        return Q(**{f"{self.course}__in": access.teaching().course_ids()}) | Q(**{self.owner: user.pk})
+
+    def changed(self, user, access, since: datetime | None):
+        """Visible rows changed after ``since``, annotated with ``sync_at`` and ordered by it.
+
+        Rows of a course the user joined after ``since`` count as changed at the
+        time access was granted, so a new member receives the course's history.
+        """
+        queryset = self.model.objects.filter(self.visible(user, access)).select_related(*self.select)
+        if since is None:
+            return queryset.annotate(sync_at=F(self.timestamp)).order_by("sync_at", "pk")
+
+        granted = access.filter(course_id=OuterRef(self.course)).order_by("-granted_at").values("granted_at")[:1]
+        joined = access.filter(granted_at__gt=since).course_ids()
+        return (
+            queryset.filter(Q(**{f"{self.timestamp}__gt": since}) | Q(**{f"{self.course}__in": joined}))
+            .annotate(sync_at=Greatest(self.timestamp, Coalesce(Subquery(granted), self.timestamp)))
+            .order_by("sync_at", "pk")
+        )
+
+
+SOURCES = (
+    SyncSource("courses", Course, "updated_at", "pk", select=("created_by",), prefetch=("teachers", "students")),
+    SyncSource("lectures", Lecture, "updated_at", "course_id", select=("created_by",)),
+    SyncSource("assignments", HomeworkAssignment, "updated_at", "lecture__course_id", select=("created_by",)),
+    SyncSource(
+        "submissions", Submission, "updated_at", "assignment__lecture__course_id", "student_id", select=("student",)
+    ),
+    SyncSource(
+        "grades",
+        Grade,
+        "graded_at",
+        "submission__assignment__lecture__course_id",
+        "submission__student_id",
+        select=("graded_by",),
+    ),
+    SyncSource(
+        "grade_comments",
+        GradeComment,
+        "updated_at",
+        "grade__submission__assignment__lecture__course_id",
+        "grade__submission__student_id",
+        select=("author",),
+    ),
+)
+_SOURCES_BY_MODEL = {source.model: source for source in SOURCES}
+_KEYS_BY_MODEL_NAME = {source.model._meta.model_name: source.key for source in SOURCES}
+
+
+def _entries(user, access, since: datetime | None, *, limit: int | None = None, at: datetime | None = None):
+    """Return ``(time, source, row)`` for changes after ``since``: up to ``limit + 1`` per source, or all at ``at``.
+
+    Tombstones have ``None`` as their source.
+    """
+    entries = []
+    for source in SOURCES:
+        rows = source.changed(user, access, since)
+        rows = rows[: limit + 1] if at is None else rows.filter(sync_at=at)
+        entries += [(row.sync_at, source, row) for row in rows]
+    if since is not None:
+        tombstones = Tombstone.objects.visible_to(user).deleted_after(since).order_by("deleted_at", "pk")
+        tombstones = tombstones[: limit + 1] if at is None else tombstones.filter(deleted_at=at)
+        entries += [(tombstone.deleted_at, None, tombstone) for tombstone in tombstones]
+    entries.sort(key=lambda entry: entry[0])
+    return entries
+
+
+def _revocations(memberships) -> list[Tombstone]:
+    model_name = Course._meta.model_name
+    return [Tombstone(model=model_name, object_id=course_id, user_id=user_id) for user_id, course_id in memberships]
+
+
+@dataclass
+class ChangeSet:
+    """One page of changes: changed rows and deleted ids per source key, oldest first."""
+
+    changed: dict[str, list]
+    deleted: dict[str, list[int]]
+    cursor: datetime
+    has_more: bool
+
+
+@traced
+class SyncService:
+    """Service class for delta sync: what changed for a user since a cursor."""
+
+    @staticmethod
+    def encode_cursor(moment: datetime) -> str:
+        """Return the opaque cursor for a point in time."""
+
+        delta = moment - _EPOCH
+        return str((delta.days * 86_400 + delta.seconds) * 1_000_000 + delta.microseconds)
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> datetime:
+        """Return the point in time of a cursor, rejecting malformed and expired ones."""
+
+        if not _CURSOR.fullmatch(cursor):
+            raise ValidationException("Invalid sync cursor.")
+        try:
+            moment = _EPOCH + timedelta(microseconds=int(cursor))
+        except (OverflowError, ValueError):
+            raise ValidationException("Invalid sync cursor.") from None
+        if moment < timezone.now() - timedelta(days=settings.SYNC_TOMBSTONE_DAYS):
+            raise CursorExpiredException("Sync cursor has expired; sync again without a cursor.")
+        return moment
+
+    @staticmethod
+    def get_changes(user, since: datetime | None = None, limit: int | None = None) -> ChangeSet:
+        """Collect rows created, updated or deleted after ``since`` that are visible to the user.
+
+        Without ``since`` every visible row is returned and no deletions. At most
+        ``limit`` entries are returned; ``has_more`` then asks the client to call
+        again with ``cursor`` straight away.
+        """
+
+        limit = limit or settings.SYNC_PAGE_SIZE
+        started = timezone.now()
+        access = CourseAccess.objects.for_user(user)
+
+        entries = _entries(user, access, since, limit=limit)
+
+        has_more = len(entries) > limit
+        if has_more:
+            # The next request reads strictly after the cursor, so a page must end with every entry
+            # of its last timestamp: stop before the first timestamp the page cannot hold completely,
+            # or, when the whole page shares one timestamp, go over the limit to include all of it.
+            boundary = entries[limit][0]
+            page = [entry for entry in entries[:limit] if entry[0] < boundary]
+            if not page:
+                page = _entries(user, access, since, at=boundary)
+            cursor = page[-1][0]
+        else:
+            # Rows are stamped before their transaction commits, so one committed just after this
+            # read can carry an earlier time; re-reading a short window catches it next time.
+            page = entries
+            cursor = started - timedelta(seconds=settings.SYNC_CURSOR_LAG_SECONDS)
+            if since is not None:
+                cursor = max(cursor, since)
+
+        changed = {source.key: [] for source in SOURCES}
+        deleted = {source.key: [] for source in SOURCES}
+        for _, source, row in page:
+            if source is None:
+                deleted[_KEYS_BY_MODEL_NAME[row.model]].append(row.object_id)
+            else:
+                changed[source.key].append(row)
+        for source in SOURCES:
+            if changed[source.key]:
+                prefetch_related_objects(changed[source.key], *source.prefetch)
+                # Visible now, so a tombstone from lost and regained access no longer applies.
+                present = {row.pk for row in changed[source.key]}
+                deleted[source.key] = [pk for pk in deleted[source.key] if pk not in present]
+
+        logger.info("Sync for user %s: %d entries, has_more=%s", user.pk, len(page), has_more)
+        return ChangeSet(changed=changed, deleted=deleted, cursor=cursor, has_more=has_more)
+
+    @staticmethod
+    def delete(instance):
+        """Delete a synced object and its cascade, writing their tombstones with one query per model.
+
+        Returns what ``Model.delete()`` returns. Deleting through the model still
+        writes tombstones, one object at a time.
+        """
+
+        using = router.db_for_write(type(instance), instance=instance)
+        collector = Collector(using=using, origin=instance)
+        collector.collect([instance])
+        with transaction.atomic(using=using):
+            SyncService.record_deletions(collector.data)
+            written = _tombstones_written.set(True)
+            try:
+                return collector.delete()
+            finally:
+                _tombstones_written.reset(written)
+
+    @staticmethod
+    def record_deletion(instance) -> None:
+        """Write the tombstone of a synced object that is about to be deleted, unless ``delete`` already did."""
+
+        if not _tombstones_written.get():
+            SyncService.record_deletions({type(instance): [instance]})
+
+    @staticmethod
+    def record_deletions(instances_by_model) -> None:
+        """Write the tombstones of synced objects about to be deleted; other models are ignored."""
+
+        tombstones = []
+        for model, instances in instances_by_model.items():
+            pks = [instance.pk for instance in instances]
+            if model is Course:
+                members = CourseAccess.objects.filter(course_id__in=pks).values_list("user_id", "course_id")
+                tombstones += _revocations(set(members))
+            elif model in _SOURCES_BY_MODEL:
+                source = _SOURCES_BY_MODEL[model]
+                lookups = [source.course, source.owner] if source.owner else [source.course]
+                for pk, course_id, *owner in model.objects.filter(pk__in=pks).values_list("pk", *lookups):
+                    tombstones.append(
+                        Tombstone(
+                            model=model._meta.model_name,
+                            object_id=pk,
+                            course_id=course_id,
+                            user_id=owner[0] if owner else None,
+                        )
+                    )
+        Tombstone.objects.bulk_create(tombstones)
+
+    @staticmethod
+    def record_revoked_access(memberships) -> None:
+        """Tell each ``(user_id, course_id)`` member that the course is gone from their view."""
+
+        Tombstone.objects.bulk_create(_revocations(memberships))
+
+    @staticmethod
+    def touch_courses(course_ids) -> None:
+        """Mark courses as changed, e.g. after their teachers or students changed."""
+
+        Course.objects.filter(pk__in=course_ids).update(updated_at=timezone.now())
+
+    @staticmethod
+    def prune_tombstones(days: int | None = None) -> int:
+        """Delete tombstones older than the cursor lifetime and return how many were deleted."""
+
+        days = settings.SYNC_TOMBSTONE_DAYS if days is None else days
+        deleted, _ = Tombstone.objects.filter(deleted_at__lt=timezone.now() - timedelta(days=days)).delete()
+        logger.info("Pruned %d sync tombstones older than %d days", deleted, days)
+        return deleted
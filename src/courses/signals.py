@@ -0,0 +1,81 @@
+from django.db import transaction
+
+from .models import CourseAccess
+
+
+def _sync_course_access(role, instance, action, reverse, pk_set):
+    """Mirror a Course.teachers / Course.students change into CourseAccess.
+
+    The affected courses are marked as updated for delta sync, and members who
+    lose access get a course tombstone.
+    """
+    from .services import MissingSubmissionService, SyncService
+
+    if action == "post_add":
+        if reverse:
+            rows = [CourseAccess(user_id=instance.pk, course_id=pk, role=role) for pk in pk_set]
+        else:
+            rows = [CourseAccess(user_id=pk, course_id=instance.pk, role=role) for pk in pk_set]
+        CourseAccess.objects.bulk_create(rows, ignore_conflicts=True)
+        SyncService.touch_courses(pk_set if reverse else [instance.pk])
+    elif action in ("post_remove", "post_clear"):
+        lookup = {"user_id": instance.pk} if reverse else {"course_id": instance.pk}
+        revoked = CourseAccess.objects.filter(role=role, **lookup)
+        if action == "post_remove":
+            revoked = revoked.filter(**{"course_id__in" if reverse else "user_id__in": pk_set})
+        memberships = list(revoked.values_list("user_id", "course_id"))
+        revoked.delete()
+        SyncService.record_revoked_access(memberships)
+        if role == CourseAccess.Roles.STUDENT:
+            MissingSubmissionService.forget_memberships(memberships)
+        SyncService.touch_courses({course_id for _, course_id in memberships})
+
+
+def sync_teacher_access(sender, instance, action, reverse, pk_set, **kwargs):
+    """Keep teacher access rows in sync with Course.teachers."""
+    _sync_course_access(CourseAccess.Roles.TEACHER, instance, action, reverse, pk_set)
+
+
+def sync_student_access(sender, instance, action, reverse, pk_set, **kwargs):
+    """Keep student access rows in sync with Course.students."""
+    _sync_course_access(CourseAccess.Roles.STUDENT, instance, action, reverse, pk_set)
+
+
+def clear_missing_submission(sender, instance, created, **kwargs):
+    """Drop the missing-submission record of a student who submitted after the deadline."""
+    if created:
+        from .services import MissingSubmissionService
+
+        MissingSubmissionService.clear(instance.assignment_id, instance.student_id)
+
+
+def count_submission(sender, instance, created, **kwargs):
+    """Count created submissions once the transaction commits."""
+    if created:
+        from core.metrics import SUBMISSIONS_CREATED
+
+        transaction.on_commit(SUBMISSIONS_CREATED.inc)
+
+
+def count_grade(sender, instance, created, **kwargs):
+    """Count created grades once the transaction commits."""
+    if created:
+        from core.metrics import GRADES_CREATED
+
+        transaction.on_commit(GRADES_CREATED.inc)
+
+
+def count_enrollments(sender, action, pk_set, **kwargs):
+    """Count students newly added to courses once the transaction commits."""
+    if action == "post_add" and pk_set:
+        from core.metrics import ENROLLMENTS
+
+        added = len(pk_set)
+        transaction.on_commit(lambda: ENROLLMENTS.inc(added))
+
+
+def record_tombstone(sender, instance, **kwargs):
+    """Log a course object about to be deleted, for delta sync, unless ``SyncService.delete`` did."""
+    from .services import SyncService
+
+    SyncService.record_deletion(instance)
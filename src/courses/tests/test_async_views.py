@@ -0,0 +1,104 @@
+import pytest
+from django.test import Client
+from rest_framework_simplejwt.tokens import AccessToken
+
+from api.v1.courses.async_views import AsyncReadOnlyView
+
+from .factories import (
+    CourseFactory,
+    HomeworkAssignmentFactory,
+    LectureFactory,
+    StudentFactory,
+    SubmissionFactory,
+    TeacherFactory,
+)
+
+
+def _client_for(user) -> Client:
+    return Client(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+
+
+@pytest.mark.django_db
+class TestAsyncReadViews:
+    def test_requires_authentication(self):
+        response = Client().get("/api/v1/async/courses/")
+
+        assert response.status_code == 401
+        assert response["WWW-Authenticate"] == 'Bearer realm="api"'
+
+    def test_course_list_matches_sync_serializer(self):
+        student = StudentFactory()
+        course = CourseFactory(students=[student])
+
+        response = _client_for(student).get("/api/v1/async/courses/")
+
+        assert response.status_code == 200
+        [payload] = response.json()
+        assert payload["id"] == course.id
+        assert payload["created_by"]["id"] == course.created_by_id
+        assert [s["id"] for s in payload["students"]] == [student.id]
+
+    def test_course_retrieve_not_found(self):
+        response = _client_for(StudentFactory()).get("/api/v1/async/courses/999999/")
+        assert response.status_code == 404
+
+    def test_lecture_list_requires_course_filter(self):
+        lecture = LectureFactory()
+        client = _client_for(lecture.course.created_by)
+
+        assert client.get("/api/v1/async/lectures/").json() == []
+
+        response = client.get(f"/api/v1/async/lectures/?course={lecture.course_id}")
+        assert [item["id"] for item in response.json()] == [lecture.id]
+
+    def test_lecture_retrieve_checks_membership(self):
+        student = StudentFactory()
+        lecture = LectureFactory(course=CourseFactory(students=[student]))
+        url = f"/api/v1/async/lectures/{lecture.id}/"
+
+        assert _client_for(student).get(url).status_code == 200
+        assert _client_for(lecture.course.created_by).get(url).status_code == 200
+        assert _client_for(StudentFactory()).get(url).status_code == 403
+
+    def test_assignment_retrieve_checks_membership(self):
+        assignment = HomeworkAssignmentFactory()
+        url = f"/api/v1/async/assignments/{assignment.id}/"
+
+        assert _client_for(assignment.created_by).get(url).status_code == 200
+        assert _client_for(TeacherFactory()).get(url).status_code == 403
+
+    def test_submission_list_scoped_to_role(self):
+        submission = SubmissionFactory()
+        SubmissionFactory()
+        teacher = submission.assignment.lecture.course.created_by
+
+        student_ids = [s["id"] for s in _client_for(submission.student).get("/api/v1/async/submissions/").json()]
+        teacher_ids = [s["id"] for s in _client_for(teacher).get("/api/v1/async/submissions/").json()]
+
+        assert student_ids == [submission.id]
+        assert teacher_ids == [submission.id]
+
+    def test_submission_retrieve_outside_scope_is_not_found(self):
+        submission = SubmissionFactory()
+
+        response = _client_for(StudentFactory()).get(f"/api/v1/async/submissions/{submission.id}/")
+
+        assert response.status_code == 404
+
+    def test_claims_token_authenticates(self):
+        from authentication.serializers import TokenObtainPairSerializer
+
+        student = StudentFactory()
+        access = TokenObtainPairSerializer.get_token(student).access_token
+
+        response = Client(HTTP_AUTHORIZATION=f"Bearer {access}").get("/api/v1/async/submissions/")
+
+        assert response.status_code == 200
+
+
+def test_views_must_define_get_queryset():
+    class Incomplete(AsyncReadOnlyView):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
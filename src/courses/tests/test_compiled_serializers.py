@@ -0,0 +1,127 @@
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework import fields, serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework_simplejwt.tokens import AccessToken
+
+from api.compiled import CompiledSerializer, compile_serializer
+from api.v1.courses.serializers import (
+    CourseSerializer,
+    GradeCommentSerializer,
+    HomeworkAssignmentSerializer,
+    LectureSerializer,
+    SubmissionSerializer,
+    UserMiniSerializer,
+)
+from courses.models import Course, GradeComment, HomeworkAssignment, Lecture, Submission
+
+from .factories import (
+    CourseFactory,
+    LectureFactory,
+    StudentFactory,
+    SubmissionWithCommentsFactory,
+    TeacherFactory,
+)
+
+
+@pytest.fixture
+def course_data(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    teacher, co_teacher = TeacherFactory(), TeacherFactory()
+    students = StudentFactory.create_batch(3)
+    course = CourseFactory(created_by=teacher, teachers=[co_teacher], students=students)
+    CourseFactory(created_by=co_teacher, teachers=[teacher], students=students[:1], description="")
+    LectureFactory(course=course, presentation=SimpleUploadedFile("intro.pdf", b"%PDF"))
+    for student in students:
+        SubmissionWithCommentsFactory(assignment__lecture__course=course, student=student)
+    SubmissionWithCommentsFactory(
+        assignment__lecture__course=course,
+        student=students[0],
+        attachment=SimpleUploadedFile("answer.txt", b"42"),
+    )
+    return teacher
+
+
+CASES = [
+    (CourseSerializer, lambda: Course.objects.with_relations().order_by("-created_at")),
+    (LectureSerializer, lambda: Lecture.objects.with_relations().order_by("-created_at")),
+    (HomeworkAssignmentSerializer, lambda: HomeworkAssignment.objects.with_relations().order_by("-created_at")),
+    (SubmissionSerializer, lambda: Submission.objects.with_relations().order_by("-submitted_at")),
+    (GradeCommentSerializer, lambda: GradeComment.objects.with_relations().order_by("-created_at")),
+]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("serializer_class, queryset", CASES, ids=[case[0].__name__ for case in CASES])
+def test_compiled_output_is_byte_identical(course_data, serializer_class, queryset):
+    request = APIRequestFactory().get("/api/v1/")
+    instances = list(queryset())
+    compiled = compile_serializer(serializer_class)
+
+    expected = JSONRenderer().render(serializer_class(instances, many=True, context={"request": request}).data)
+
+    assert compiled is not None
+    assert JSONRenderer().render(compiled.many(instances, request)) == expected
+    assert JSONRenderer().render(compiled.many(instances)) == JSONRenderer().render(
+        serializer_class(instances, many=True).data
+    )
+
+
+@pytest.mark.django_db
+def test_nested_users_are_represented_once(course_data):
+    compiled = compile_serializer(CourseSerializer)
+
+    data = compiled.many(Course.objects.with_relations())
+
+    teachers = {user["id"]: user for course in data for user in course["teachers"]}
+    assert all(course["created_by"] is teachers[course["created_by"]["id"]] for course in data)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("path", ["/api/v1/courses/", "/api/v1/submissions/", "/api/v1/async/courses/"])
+def test_list_endpoints_match_drf(course_data, settings, path):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(course_data)}")
+
+    compiled = client.get(path)
+    settings.COMPILED_SERIALIZERS = False
+    plain = client.get(path)
+
+    assert compiled.status_code == plain.status_code == 200
+    assert compiled.content == plain.content
+    assert compiled.json()
+
+
+def test_unsupported_serializers_are_not_compiled():
+    class WithMethodField(UserMiniSerializer):
+        display = serializers.SerializerMethodField()
+
+        class Meta(UserMiniSerializer.Meta):
+            fields = ("id", "display")
+
+        def get_display(self, obj):
+            return obj.username.upper()
+
+    class CustomRepresentation(UserMiniSerializer):
+        def to_representation(self, instance):
+            return {"id": instance.pk}
+
+    assert compile_serializer(WithMethodField) is None
+    assert compile_serializer(CustomRepresentation) is None
+    assert compile_serializer(UserMiniSerializer) is not None
+
+
+@pytest.mark.django_db
+def test_compiles_non_integer_fields_without_big_integer_field(monkeypatch):
+    # DRF before 3.16 has no BigIntegerField; every other field type used to reach it.
+    class NameAndRole(UserMiniSerializer):
+        class Meta(UserMiniSerializer.Meta):
+            fields = ("username", "role", "date_joined")
+
+    monkeypatch.delattr(fields, "BigIntegerField")
+    users = [TeacherFactory(), StudentFactory()]
+
+    compiled = CompiledSerializer(NameAndRole)
+
+    assert compiled.many(users) == NameAndRole(users, many=True).data
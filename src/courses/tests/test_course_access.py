@@ -0,0 +1,63 @@
+import pytest
+
+from courses.models import CourseAccess, GradeComment, Submission
+
+from .factories import CourseFactory, GradeCommentFactory, StudentFactory, SubmissionFactory, TeacherFactory
+
+
+def _access(course):
+    return set(CourseAccess.objects.filter(course=course).values_list("user_id", "role"))
+
+
+@pytest.mark.django_db
+class TestCourseAccessSync:
+    def test_forward_add_and_remove(self):
+        student = StudentFactory()
+        course = CourseFactory(students=[student])
+
+        assert _access(course) == {(course.created_by_id, "TEACHER"), (student.id, "STUDENT")}
+
+        course.students.remove(student)
+        assert _access(course) == {(course.created_by_id, "TEACHER")}
+
+    def test_reverse_add_and_clear(self):
+        teacher = TeacherFactory()
+        course = CourseFactory()
+
+        teacher.teaching_courses.add(course)
+        assert (teacher.id, "TEACHER") in _access(course)
+
+        teacher.teaching_courses.clear()
+        assert (teacher.id, "TEACHER") not in _access(course)
+        assert (course.created_by_id, "TEACHER") in _access(course)
+
+    def test_forward_clear_keeps_other_role(self):
+        student = StudentFactory()
+        course = CourseFactory(students=[student])
+
+        course.teachers.clear()
+
+        assert _access(course) == {(student.id, "STUDENT")}
+
+
+@pytest.mark.django_db
+class TestAccessBasedVisibility:
+    def test_submissions_for_course_teachers(self):
+        submission = SubmissionFactory()
+        SubmissionFactory()
+        course = submission.assignment.lecture.course
+        co_teacher = TeacherFactory()
+        course.teachers.add(co_teacher)
+
+        assert list(Submission.objects.for_course_teachers(co_teacher)) == [submission]
+        assert not Submission.objects.for_course_teachers(TeacherFactory()).exists()
+
+    def test_comments_visible_without_duplicates(self):
+        comment = GradeCommentFactory()
+        GradeCommentFactory()
+        course = comment.grade.submission.assignment.lecture.course
+        course.teachers.add(TeacherFactory(), TeacherFactory())
+
+        assert list(GradeComment.objects.visible_to(course.created_by)) == [comment]
+        assert list(GradeComment.objects.visible_to(comment.grade.submission.student)) == [comment]
+        assert not GradeComment.objects.visible_to(StudentFactory()).exists()
@@ -18,8 +18,8 @@ class TestCourseService:
             assert teacher in course.teachers.all()
 
             # Check logging
-            mock_logger.info.assert_any_call(f"Creating course 'New Course' by user {teacher.id}")
-            mock_logger.info.assert_any_call(f"Course {course.id} created successfully")
+            mock_logger.info.assert_any_call("Creating course '%s' by user %s", "New Course", teacher.id)
+            mock_logger.info.assert_any_call("Course %s created successfully", course.id)
 
     def test_add_student_to_course_success(self, student):
         course = CourseFactory()
@@ -28,7 +28,7 @@ class TestCourseService:
             CourseService.add_student_to_course(course, student.id)
 
             assert student in course.students.all()
-            mock_logger.info.assert_called_with(f"Student {student.id} added to course {course.id}")
+            mock_logger.info.assert_called_with("Student %s added to course %s", student.id, course.id)
 
     def test_add_student_to_course_not_student_role(self):
         course = CourseFactory()
@@ -63,7 +63,7 @@ class TestCourseService:
             CourseService.remove_student_from_course(course, student.id)
 
             assert student not in course.students.all()
-            mock_logger.info.assert_called_with(f"Student {student.id} removed from course {course.id}")
+            mock_logger.info.assert_called_with("Student %s removed from course %s", student.id, course.id)
 
     def test_add_teacher_to_course_success(self):
         course = CourseFactory()
@@ -73,7 +73,7 @@ class TestCourseService:
             CourseService.add_teacher_to_course(course, new_teacher.id)
 
             assert new_teacher in course.teachers.all()
-            mock_logger.info.assert_called_with(f"Teacher {new_teacher.id} added to course {course.id}")
+            mock_logger.info.assert_called_with("Teacher %s added to course %s", new_teacher.id, course.id)
 
     def test_add_teacher_to_course_not_teacher_role(self):
         course = CourseFactory()
@@ -209,3 +209,15 @@ class TestCourseService:
 
         for student in students:
             assert not CourseService.is_user_course_teacher(course, student)
+
+    def test_async_membership_checks(self):
+        from asgiref.sync import async_to_sync
+
+        teacher = TeacherFactory()
+        student = StudentFactory()
+        course = CourseFactory(teachers=[teacher], students=[student])
+
+        assert async_to_sync(CourseService.ais_user_course_teacher)(course, teacher) is True
+        assert async_to_sync(CourseService.ais_user_course_teacher)(course, student) is False
+        assert async_to_sync(CourseService.ais_user_course_student)(course, student) is True
+        assert async_to_sync(CourseService.ais_user_course_student)(course, teacher) is False
@@ -0,0 +1,126 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from authentication.serializers import TokenObtainPairSerializer
+from courses.services import DashboardService
+
+from .factories import (
+    CourseFactory,
+    GradeFactory,
+    HomeworkAssignmentFactory,
+    LectureFactory,
+    StudentFactory,
+    SubmissionFactory,
+    TeacherFactory,
+)
+
+
+def _client(user):
+    client = APIClient()
+    # Claims tokens authenticate without loading the user, so budgets count only dashboard queries.
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {TokenObtainPairSerializer.get_token(user).access_token}")
+    return client
+
+
+def _enrolled_lecture(student):
+    return LectureFactory(course=CourseFactory(students=[student]))
+
+
+@pytest.mark.django_db
+class TestStudentDashboard:
+    def test_upcoming_and_missing_assignments(self):
+        student = StudentFactory()
+        lecture = _enrolled_lecture(student)
+        now = timezone.now()
+        soon = HomeworkAssignmentFactory(lecture=lecture, due_date=now + timedelta(days=2))
+        later = HomeworkAssignmentFactory(lecture=lecture, due_date=now + timedelta(days=5))
+        HomeworkAssignmentFactory(lecture=lecture, due_date=now + timedelta(days=60))
+        overdue = HomeworkAssignmentFactory(lecture=lecture, due_date=now - timedelta(days=1))
+        handed_in = HomeworkAssignmentFactory(lecture=lecture, due_date=now - timedelta(days=2))
+        SubmissionFactory(assignment=handed_in, student=student)
+        SubmissionFactory(assignment=later, student=student)
+        HomeworkAssignmentFactory(due_date=now + timedelta(days=1))
+
+        dashboard = DashboardService.get_student_dashboard(student)
+
+        assert [course.pk for course in dashboard.courses] == [lecture.course_id]
+        assert [(a.pk, a.submitted) for a in dashboard.upcoming] == [(soon.pk, False), (later.pk, True)]
+        assert [a.pk for a in dashboard.missing] == [overdue.pk]
+
+    def test_recent_grades_are_the_students_own(self):
+        grade = GradeFactory()
+        GradeFactory()
+
+        dashboard = DashboardService.get_student_dashboard(grade.submission.student)
+
+        assert [g.pk for g in dashboard.recent_grades] == [grade.pk]
+
+    def test_query_budget_does_not_grow_with_courses(self, django_assert_num_queries):
+        student = StudentFactory()
+        for _ in range(4):
+            lecture = _enrolled_lecture(student)
+            lecture.course.teachers.add(TeacherFactory())
+            for days in (-3, 3):
+                assignment = HomeworkAssignmentFactory(lecture=lecture, due_date=timezone.now() + timedelta(days=days))
+            GradeFactory(submission=SubmissionFactory(assignment=assignment, student=student))
+        client = _client(student)
+
+        with django_assert_num_queries(5):
+            response = client.get("/api/v1/dashboard/student")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert len(body["courses"]) == 4 and len(body["courses"][0]["teachers"]) == 2
+        assert len(body["upcoming"]) == 4 and all(item["submitted"] for item in body["upcoming"])
+        assert len(body["missing"]) == 4
+        assert {"course_id", "lecture_id", "lecture_topic"} <= set(body["missing"][0])
+        assert len(body["recent_grades"]) == 4
+
+    def test_teachers_are_refused(self):
+        assert _client(TeacherFactory()).get("/api/v1/dashboard/student").status_code == 403
+
+
+@pytest.mark.django_db
+class TestTeacherDashboard:
+    def test_course_workload(self):
+        teacher = TeacherFactory()
+        students = StudentFactory.create_batch(3)
+        lecture = LectureFactory(course=CourseFactory(created_by=teacher, students=students))
+        now = timezone.now()
+        this_week = HomeworkAssignmentFactory(lecture=lecture, due_date=now + timedelta(days=3))
+        HomeworkAssignmentFactory(lecture=lecture, due_date=now + timedelta(days=20))
+        GradeFactory(submission=SubmissionFactory(assignment=this_week, student=students[0]), score=70)
+        GradeFactory(submission=SubmissionFactory(assignment=this_week, student=students[1]), score=90)
+        SubmissionFactory(assignment=this_week, student=students[2])
+        empty = CourseFactory(created_by=teacher, title="zzz")
+        LectureFactory()
+
+        workloads = DashboardService.get_teacher_dashboard(teacher)
+
+        assert [workload.id for workload in workloads] == [lecture.course_id, empty.pk]
+        busy = workloads[0]
+        assert (busy.student_count, busy.assignment_count, busy.due_this_week) == (3, 2, 1)
+        assert (busy.submission_count, busy.awaiting_grading, busy.average_score) == (3, 1, 80.0)
+        assert (workloads[1].student_count, workloads[1].submission_count, workloads[1].average_score) == (0, 0, None)
+
+    def test_query_budget_does_not_grow_with_courses(self, django_assert_num_queries):
+        teacher = TeacherFactory()
+        for _ in range(4):
+            assignment = HomeworkAssignmentFactory(lecture=LectureFactory(course=CourseFactory(created_by=teacher)))
+            GradeFactory(submission=SubmissionFactory(assignment=assignment))
+            SubmissionFactory(assignment=assignment)
+        client = _client(teacher)
+
+        with django_assert_num_queries(4):
+            response = client.get("/api/v1/dashboard/teacher")
+
+        assert response.status_code == 200
+        courses = response.json()["courses"]
+        assert len(courses) == 4
+        assert all(course["submission_count"] == 2 and course["awaiting_grading"] == 1 for course in courses)
+
+    def test_students_are_refused(self):
+        assert _client(StudentFactory()).get("/api/v1/dashboard/teacher").status_code == 403
@@ -30,8 +30,10 @@ class TestGradingService:
             assert grade.graded_by == course_teacher
 
             # Check logging
-            mock_logger.info.assert_any_call(f"Creating grade for submission {submission.id} by teacher {teacher.id}")
-            mock_logger.info.assert_any_call(f"Grade {grade.id} created successfully")
+            mock_logger.info.assert_any_call(
+                "Creating grade for submission %s by teacher %s", submission.id, teacher.id
+            )
+            mock_logger.info.assert_any_call("Grade %s created successfully", grade.id)
 
     def test_create_grade_permission_denied(self):
         submission = SubmissionFactory()
@@ -71,8 +73,8 @@ class TestGradingService:
             assert updated_grade.comment == "Updated comment"
 
             # Check logging
-            mock_logger.info.assert_any_call(f"Updating grade {grade.id}")
-            mock_logger.info.assert_any_call(f"Grade {grade.id} updated successfully")
+            mock_logger.info.assert_any_call("Updating grade %s", grade.id)
+            mock_logger.info.assert_any_call("Grade %s updated successfully", grade.id)
 
     def test_update_grade_permission_denied(self):
         grade = GradeFactory()
@@ -134,8 +136,8 @@ class TestGradingService:
             assert comment.text == "Additional feedback"
 
             # Check logging
-            mock_logger.info.assert_any_call(f"Creating comment on grade {grade.id} by user {teacher.id}")
-            mock_logger.info.assert_any_call(f"Grade comment {comment.id} created successfully")
+            mock_logger.info.assert_any_call("Creating comment on grade %s by user %s", grade.id, teacher.id)
+            mock_logger.info.assert_any_call("Grade comment %s created successfully", comment.id)
 
     def test_create_grade_comment_by_student_owner(self):
         grade = GradeFactory()
@@ -21,9 +21,9 @@ class TestHomeworkService:
             assert assignment.due_date is None
 
             mock_logger.info.assert_any_call(
-                f"Creating homework assignment for lecture {lecture.id} by user {teacher.id}"
+                "Creating homework assignment for lecture %s by user %s", lecture.id, teacher.id
             )
-            mock_logger.info.assert_any_call(f"Homework assignment {assignment.id} created successfully")
+            mock_logger.info.assert_any_call("Homework assignment %s created successfully", assignment.id)
 
     def test_create_homework_assignment_with_due_date(self, teacher):
         lecture = LectureFactory(created_by=teacher)
@@ -66,5 +66,5 @@ class TestHomeworkService:
             assert updated_assignment.text == "Updated text"
             assert updated_assignment.due_date == due_date
 
-            mock_logger.info.assert_any_call(f"Updating homework assignment {assignment.id}")
-            mock_logger.info.assert_any_call(f"Homework assignment {assignment.id} updated successfully")
+            mock_logger.info.assert_any_call("Updating homework assignment %s", assignment.id)
+            mock_logger.info.assert_any_call("Homework assignment %s updated successfully", assignment.id)
@@ -21,9 +21,9 @@ class TestLectureService:
             assert lecture.presentation.name == ""
 
             mock_logger.info.assert_any_call(
-                f"Creating lecture 'Introduction to Python' for course {course.id} by user {teacher.id}"
+                "Creating lecture '%s' for course %s by user %s", "Introduction to Python", course.id, teacher.id
             )
-            mock_logger.info.assert_any_call(f"Lecture {lecture.id} created successfully")
+            mock_logger.info.assert_any_call("Lecture %s created successfully", lecture.id)
 
         # --- Test case 2: With presentation ---
         mock_presentation = Mock()
@@ -64,8 +64,8 @@ class TestLectureService:
             updated_lecture = LectureService.update_lecture(lecture=lecture, topic="Updated Topic Only")
             assert updated_lecture.topic == "Updated Topic Only"
 
-            mock_logger.info.assert_any_call(f"Updating lecture {lecture.id}")
-            mock_logger.info.assert_any_call(f"Lecture {lecture.id} updated successfully")
+            mock_logger.info.assert_any_call("Updating lecture %s", lecture.id)
+            mock_logger.info.assert_any_call("Lecture %s updated successfully", lecture.id)
 
         # --- Test case 2: Update multiple fields ---
         new_course = CourseFactory()
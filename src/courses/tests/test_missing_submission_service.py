@@ -0,0 +1,120 @@
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from courses.models import MissingSubmission
+from courses.services import MissingSubmissionService
+
+from .factories import CourseFactory, HomeworkAssignmentFactory, LectureFactory, StudentFactory, SubmissionFactory
+
+
+def _missing(**filters):
+    return set(MissingSubmission.objects.filter(**filters).values_list("assignment_id", "student_id"))
+
+
+@pytest.fixture
+def course():
+    return CourseFactory(students=StudentFactory.create_batch(3))
+
+
+def _assignment(course, days):
+    return HomeworkAssignmentFactory(
+        lecture=LectureFactory(course=course), due_date=timezone.now() + timedelta(days=days)
+    )
+
+
+@pytest.mark.django_db
+class TestMissingSubmissionScan:
+    def test_records_students_without_submission(self, course):
+        first, second, third = course.students.order_by("pk")
+        overdue = _assignment(course, -1)
+        upcoming = _assignment(course, 3)
+        SubmissionFactory(assignment=overdue, student=first)
+        SubmissionFactory(assignment=upcoming, student=second)
+        _assignment(CourseFactory(), -1)
+
+        result = MissingSubmissionService.scan()
+
+        assert _missing() == {(overdue.pk, second.pk), (overdue.pk, third.pk)}
+        assert (result.assignments, result.recorded) == (2, 2)
+        record = MissingSubmission.objects.get(student=second)
+        assert (record.course_id, record.due_date) == (course.pk, overdue.due_date)
+
+    def test_is_incremental(self, course, django_assert_num_queries):
+        _assignment(course, -2)
+        MissingSubmissionService.scan()
+
+        with django_assert_num_queries(2):
+            result = MissingSubmissionService.scan()
+        assert result.assignments == 0
+
+        later = _assignment(course, -1)
+        assert MissingSubmissionService.scan().assignments == 1
+        assert len(_missing(assignment=later)) == 3
+
+    def test_batches(self, course):
+        for days in (-3, -2, -1):
+            _assignment(course, days)
+
+        result = MissingSubmissionService.scan(batch_size=2)
+
+        assert (result.assignments, result.recorded) == (3, 9)
+
+    def test_late_submission_clears_record(self, course):
+        student = course.students.first()
+        overdue = _assignment(course, -1)
+        MissingSubmissionService.scan()
+
+        SubmissionFactory(assignment=overdue, student=student)
+
+        assert (overdue.pk, student.pk) not in _missing()
+        assert len(_missing()) == 2
+
+    def test_changed_due_date_is_rescanned(self, course):
+        overdue = _assignment(course, -1)
+        MissingSubmissionService.scan()
+
+        overdue.due_date = timezone.now() + timedelta(days=2)
+        overdue.save()
+        result = MissingSubmissionService.scan()
+        assert (result.reset, result.assignments) == (1, 0)
+        assert _missing() == set()
+
+        overdue.due_date = timezone.now() - timedelta(hours=1)
+        overdue.save()
+        assert MissingSubmissionService.scan().recorded == 3
+
+    def test_unenrolled_student_is_forgotten(self, course):
+        student = course.students.first()
+        _assignment(course, -1)
+        MissingSubmissionService.scan()
+
+        course.students.remove(student)
+
+        assert _missing(student=student) == set()
+        assert len(_missing()) == 2
+
+
+@pytest.mark.django_db
+class TestMissingSubmissionViewSet:
+    def _get(self, user, **params):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+        return client.get("/api/v1/missing-submissions/", params).json()
+
+    def test_teacher_sees_course_student_sees_own(self, course):
+        student = course.students.first()
+        overdue = _assignment(course, -1)
+        _assignment(CourseFactory(students=[student]), -1)
+        MissingSubmissionService.scan()
+
+        rows = self._get(course.created_by, course=course.pk)
+        assert len(rows) == 3
+        assert {row["assignment_id"] for row in rows} == {overdue.pk}
+
+        own = self._get(student)
+        assert len(own) == 2 and all(row["student"]["id"] == student.pk for row in own)
+        assert len(self._get(course.created_by, student=student.pk)) == 1
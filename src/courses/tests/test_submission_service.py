@@ -31,9 +31,9 @@ class TestSubmissionService:
             assert submission.student == student
 
             mock_logger.info.assert_any_call(
-                f"Creating submission for assignment {assignment.id} by student {student.id}"
+                "Creating submission for assignment %s by student %s", assignment.id, student.id
             )
-            mock_logger.info.assert_any_call(f"Submission {submission.id} created successfully")
+            mock_logger.info.assert_any_call("Submission %s created successfully", submission.id)
 
     def test_create_submission_not_enrolled(self, student):
         """Tests that a student cannot submit to a course they are not enrolled in."""
@@ -52,8 +52,8 @@ class TestSubmissionService:
             )
 
             assert updated_submission.text == "Updated submission text"
-            mock_logger.info.assert_any_call(f"Updating submission {submission.id}")
-            mock_logger.info.assert_any_call(f"Submission {submission.id} updated successfully")
+            mock_logger.info.assert_any_call("Updating submission %s", submission.id)
+            mock_logger.info.assert_any_call("Submission %s updated successfully", submission.id)
 
     def test_update_submission_fails_if_graded(self, student):
         """Tests that a submission cannot be updated after it has been graded."""
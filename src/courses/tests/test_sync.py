@@ -0,0 +1,234 @@
+from datetime import timedelta
+
+import pytest
+from django.db import connection
+from django.db.models import Count
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from courses.models import Lecture, Tombstone
+from courses.services import SyncService
+
+from .factories import (
+    CourseFactory,
+    GradeCommentFactory,
+    GradeFactory,
+    HomeworkAssignmentFactory,
+    LectureFactory,
+    StudentFactory,
+    SubmissionFactory,
+)
+
+
+def _client(user):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+    return client
+
+
+def _ids(changes, key):
+    return [row.pk for row in changes.changed[key]]
+
+
+@pytest.fixture(autouse=True)
+def no_cursor_lag(settings):
+    settings.SYNC_CURSOR_LAG_SECONDS = 0
+
+
+@pytest.mark.django_db
+class TestSyncService:
+    def test_initial_sync_returns_visible_rows(self):
+        submission = SubmissionFactory()
+        student = submission.student
+        course = submission.assignment.lecture.course
+        classmate = SubmissionFactory(assignment=submission.assignment)
+        other = SubmissionFactory()
+
+        changes = SyncService.get_changes(student)
+
+        assert _ids(changes, "courses") == [course.pk]
+        assert _ids(changes, "lectures") == [submission.assignment.lecture_id]
+        assert _ids(changes, "assignments") == [submission.assignment_id]
+        assert _ids(changes, "submissions") == [submission.pk]
+        assert other.assignment.lecture.course_id not in _ids(changes, "courses")
+        assert _ids(SyncService.get_changes(course.created_by), "submissions") == [submission.pk, classmate.pk]
+        assert not changes.has_more
+
+    def test_only_changes_after_cursor(self):
+        lecture = LectureFactory()
+        old = LectureFactory(course=lecture.course)
+        teacher = lecture.course.created_by
+        cursor = SyncService.get_changes(teacher).cursor
+
+        assert all(not rows for rows in SyncService.get_changes(teacher, cursor).changed.values())
+
+        lecture.topic = "Renamed"
+        lecture.save()
+        assignment = HomeworkAssignmentFactory(lecture=lecture)
+        changes = SyncService.get_changes(teacher, cursor)
+
+        assert _ids(changes, "lectures") == [lecture.pk]
+        assert _ids(changes, "assignments") == [assignment.pk]
+        assert old.pk not in _ids(changes, "lectures")
+
+    def test_steady_state_is_one_query_per_collection(self, django_assert_num_queries):
+        comment = GradeCommentFactory()
+        student = comment.grade.submission.student
+        cursor = SyncService.get_changes(student).cursor
+
+        with django_assert_num_queries(7):
+            changes = SyncService.get_changes(student, cursor)
+
+        assert not any(changes.changed.values()) and not any(changes.deleted.values())
+
+    def test_deletions_are_reported(self):
+        assignment = HomeworkAssignmentFactory()
+        submission = SubmissionFactory(assignment=assignment)
+        student, teacher = submission.student, assignment.created_by
+        cursor = SyncService.get_changes(student).cursor
+
+        submission_id = submission.pk
+        submission.delete()
+        assignment_id = assignment.pk
+        assignment.delete()
+
+        for user in (student, teacher):
+            deleted = SyncService.get_changes(user, cursor).deleted
+            assert deleted["submissions"] == [submission_id]
+            assert deleted["assignments"] == [assignment_id]
+
+        outsider = StudentFactory()
+        assert not any(SyncService.get_changes(outsider, cursor).deleted.values())
+
+    def test_course_deletion_reaches_former_members(self):
+        student = StudentFactory()
+        course = CourseFactory(students=[student])
+        cursor = SyncService.get_changes(student).cursor
+
+        course_id = course.pk
+        course.delete()
+
+        assert SyncService.get_changes(student, cursor).deleted["courses"] == [course_id]
+
+    def test_revoked_and_regranted_access(self):
+        lecture = LectureFactory()
+        course = lecture.course
+        student = StudentFactory()
+        course.students.add(student)
+        cursor = SyncService.get_changes(student).cursor
+
+        course.students.remove(student)
+        changes = SyncService.get_changes(student, cursor)
+        assert changes.deleted["courses"] == [course.pk]
+        assert _ids(changes, "courses") == []
+
+        course.students.add(student)
+        changes = SyncService.get_changes(student, changes.cursor)
+        assert _ids(changes, "courses") == [course.pk]
+        assert _ids(changes, "lectures") == [lecture.pk]
+        assert changes.deleted["courses"] == []
+
+    def test_pages_resume_where_they_stopped(self):
+        course = CourseFactory()
+        lectures = LectureFactory.create_batch(5, course=course)
+        teacher = course.created_by
+
+        seen, cursor, pages = [], None, 0
+        while True:
+            changes = SyncService.get_changes(teacher, cursor, limit=2)
+            seen += _ids(changes, "courses") + _ids(changes, "lectures")
+            cursor, pages = changes.cursor, pages + 1
+            if not changes.has_more:
+                break
+
+        assert pages == 3
+        assert seen == [course.pk, *(lecture.pk for lecture in lectures)]
+
+    def test_pages_do_not_split_equal_timestamps(self):
+        course = CourseFactory()
+        lectures = LectureFactory.create_batch(5, course=course)
+        Lecture.objects.update(updated_at=timezone.now())
+        teacher = course.created_by
+
+        first = SyncService.get_changes(teacher, limit=2)
+        second = SyncService.get_changes(teacher, first.cursor, limit=2)
+        third = SyncService.get_changes(teacher, second.cursor, limit=2)
+
+        assert (_ids(first, "courses"), _ids(first, "lectures")) == ([course.pk], [])
+        assert _ids(second, "lectures") == [lecture.pk for lecture in lectures]
+        assert not any(third.changed.values())
+
+    def test_delete_writes_tombstones_per_model(self):
+        student = StudentFactory()
+        course = CourseFactory(students=[student])
+        for lecture in LectureFactory.create_batch(2, course=course):
+            for assignment in HomeworkAssignmentFactory.create_batch(2, lecture=lecture):
+                GradeCommentFactory(grade=GradeFactory(submission=SubmissionFactory(assignment=assignment)))
+        cursor = SyncService.get_changes(student).cursor
+        course_id, members = course.pk, course.access.values("user_id").distinct().count()
+
+        with CaptureQueriesContext(connection) as queries:
+            SyncService.delete(course)
+
+        inserts = [query for query in queries if query["sql"].startswith('INSERT INTO "courses_tombstone"')]
+        assert len(inserts) == 1
+        counts = dict(Tombstone.objects.values_list("model").annotate(count=Count("pk")))
+        assert counts == {
+            "course": members,
+            "lecture": 2,
+            "homeworkassignment": 4,
+            "submission": 4,
+            "grade": 4,
+            "gradecomment": 4,
+        }
+        assert SyncService.get_changes(student, cursor).deleted["courses"] == [course_id]
+
+    def test_prune_tombstones(self):
+        Tombstone.objects.create(model="lecture", object_id=1, course_id=1)
+        Tombstone.objects.update(deleted_at=timezone.now() - timedelta(days=40))
+        Tombstone.objects.create(model="lecture", object_id=2, course_id=1)
+
+        assert SyncService.prune_tombstones(days=30) == 1
+        assert list(Tombstone.objects.values_list("object_id", flat=True)) == [2]
+
+
+@pytest.mark.django_db
+class TestSyncView:
+    def test_cursor_round_trip(self):
+        lecture = LectureFactory()
+        client = _client(lecture.course.created_by)
+
+        first = client.get("/api/v1/sync").json()
+        assert [row["id"] for row in first["changed"]["lectures"]] == [lecture.pk]
+        assert first["changed"]["lectures"][0]["course_id"] == lecture.course_id
+        assert first["has_more"] is False
+
+        lecture.delete()
+        second = client.get("/api/v1/sync", {"since": first["cursor"]}).json()
+        assert second["changed"]["lectures"] == []
+        assert second["deleted"]["lectures"] == [first["changed"]["lectures"][0]["id"]]
+
+    def test_invalid_and_expired_cursors(self):
+        client = _client(StudentFactory())
+
+        for cursor in ("yesterday", "-1", "²", "9" * 5000, "9" * 19):
+            assert client.get("/api/v1/sync", {"since": cursor}).status_code == 400
+        expired = SyncService.encode_cursor(timezone.now() - timedelta(days=31))
+        response = client.get("/api/v1/sync", {"since": expired})
+        assert response.status_code == 410
+        assert response.json()["code"] == "cursor_expired"
+
+    def test_destroy_writes_tombstones(self):
+        lecture = HomeworkAssignmentFactory().lecture
+        teacher = lecture.course.created_by
+        lecture.course.teachers.add(teacher)
+        client = _client(teacher)
+        cursor = client.get("/api/v1/sync").json()["cursor"]
+
+        assert client.delete(f"/api/v1/lectures/{lecture.pk}/?course={lecture.course_id}").status_code == 204
+
+        deleted = client.get("/api/v1/sync", {"since": cursor}).json()["deleted"]
+        assert deleted["lectures"] == [lecture.pk]
+        assert len(deleted["assignments"]) == 1
@@ -0,0 +1,18 @@
+from django.apps import AppConfig
+from django.db.models.signals import post_save
+
+
+class NotificationsConfig(AppConfig):
+    """Configuration class for the notifications app."""
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "notifications"
+
+    def ready(self):
+        """Connect the grade and grade comment notification signals."""
+        from courses.models import Grade, GradeComment
+
+        from .signals import notify_grade, notify_grade_comment
+
+        post_save.connect(notify_grade, sender=Grade, dispatch_uid="notifications.grade")
+        post_save.connect(notify_grade_comment, sender=GradeComment, dispatch_uid="notifications.grade_comment")
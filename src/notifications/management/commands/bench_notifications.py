@@ -0,0 +1,63 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from notifications.models import Notification
+from notifications.services import NotificationService
+from notifications.services.notification_service import INSERT_BATCH_SIZE
+from notifications.smtp_stub import StubSMTPServer
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure notification throughput: queue --count notifications for --users users and deliver them to a "
+        "local SMTP stub. Everything is rolled back afterwards; run it against a development database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=100_000, help="Notifications to queue and deliver.")
+        parser.add_argument("--users", type=int, default=5_000, help="Recipients they are spread over.")
+        parser.add_argument("--batch-size", type=int, default=None, help="Digests per batch (NOTIFY_BATCH_SIZE).")
+
+    def handle(self, *args, **options):
+        count, user_count = options["count"], max(options["users"], 1)
+        with transaction.atomic():
+            users = User.objects.bulk_create(
+                [
+                    User(username=f"bench_notify_{i}", email=f"bench_notify_{i}@example.com", password="!")
+                    for i in range(user_count)
+                ],
+                batch_size=INSERT_BATCH_SIZE,
+            )
+            start = time.perf_counter()
+            Notification.objects.bulk_create(
+                (
+                    Notification(
+                        user_id=users[i % user_count].pk,
+                        kind=Notification.Kinds.GRADE,
+                        object_id=i,
+                        text=f"Your submission {i} was graded: {i % 101}/100.",
+                    )
+                    for i in range(count)
+                ),
+                batch_size=INSERT_BATCH_SIZE,
+            )
+            enqueued = time.perf_counter() - start
+
+            with StubSMTPServer() as server:
+                start = time.perf_counter()
+                result = NotificationService.deliver(server.connection(), options["batch_size"])
+                delivered = time.perf_counter() - start
+                connections, messages = server.connections, len(server.messages)
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"enqueue: {count} notifications in {enqueued:.2f} s ({count / enqueued:,.0f}/s)")
+        self.stdout.write(
+            f"deliver: {result.notifications} notifications in {result.digests} digests in {delivered:.2f} s"
+            f" ({result.notifications / delivered:,.0f} notifications/s, {result.digests / delivered:,.0f} emails/s)"
+        )
+        self.stdout.write(f"smtp: {messages} messages over {connections} connection(s)")
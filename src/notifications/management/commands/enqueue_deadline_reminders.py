@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from notifications.services import NotificationService
+
+
+class Command(BaseCommand):
+    help = "Queue reminders for enrolled students who have not submitted homework due within NOTIFY_REMINDER_HOURS."
+
+    def handle(self, *args, **options):
+        candidates = NotificationService.enqueue_deadline_reminders()
+        self.stdout.write(f"Queued {candidates} deadline reminder candidates; any already queued were skipped.")
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from notifications.services import NotificationService
+
+
+class Command(BaseCommand):
+    help = "Send pending notifications as one digest email per user, in batches over one SMTP connection."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=None, help="Digests per batch (NOTIFY_BATCH_SIZE).")
+
+    def handle(self, *args, **options):
+        result = NotificationService.deliver(batch_size=options["batch_size"])
+        self.stdout.write(
+            f"Sent {result.notifications} notifications in {result.digests} digests"
+            f" ({result.skipped} for users without an email address)."
+        )
@@ -0,0 +1,39 @@
+from django.conf import settings
+from django.db import models
+from django.db.models import Q
+
+from .querysets import NotificationQuerySet
+
+
+class Notification(models.Model):
+    """One event for a user, queued until it goes out in their next digest email."""
+
+    class Kinds(models.TextChoices):
+        """Enumeration for notification kinds."""
+
+        GRADE = "GRADE", "Grade"
+        COMMENT = "COMMENT", "Grade comment"
+        DEADLINE = "DEADLINE", "Deadline reminder"
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="notifications")
+    kind = models.CharField(max_length=8, choices=Kinds.choices)
+    # The grade, grade comment or homework assignment the notification is about.
+    object_id = models.BigIntegerField()
+    text = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(blank=True, null=True)
+    objects = NotificationQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "object_id"], condition=Q(kind="DEADLINE"), name="unique_deadline_reminder"
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["user"], condition=Q(sent_at__isnull=True), name="notification_pending_idx"),
+        ]
+
+    def __str__(self):
+        """Return string representation of the notification."""
+        return f"{self.kind} notification for user {self.user_id}"
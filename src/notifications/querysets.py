@@ -0,0 +1,13 @@
+from django.db import models
+
+
+class NotificationQuerySet(models.QuerySet):
+    """Custom QuerySet for Notification model."""
+
+    def pending(self):
+        """Get notifications not delivered yet."""
+        return self.filter(sent_at__isnull=True)
+
+    def for_user(self, user):
+        """Get notifications of a specific user."""
+        return self.filter(user=user)
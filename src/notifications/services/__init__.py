@@ -0,0 +1,5 @@
+from .notification_service import NotificationService
+
+__all__ = [
+    "NotificationService",
+]
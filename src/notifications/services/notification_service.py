@@ -0,0 +1,175 @@
+import logging
+import smtplib
+from dataclasses import dataclass
+from datetime import timedelta
+from itertools import groupby
+from operator import itemgetter
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.mail import EmailMessage, get_connection
+from django.db.models import Exists, F, OuterRef
+from django.utils import timezone
+
+from core.tracing import traced
+from courses.models import CourseAccess, HomeworkAssignment, Submission
+
+from ..models import Notification
+
+User = get_user_model()
+logger = logging.getLogger(__name__)
+
+INSERT_BATCH_SIZE = 1000
+
+
+@dataclass
+class DeliveryResult:
+    """Outcome of one delivery run."""
+
+    notifications: int = 0
+    digests: int = 0
+    skipped: int = 0
+
+
+@traced
+class NotificationService:
+    """Service class for queueing notifications and delivering them as digests."""
+
+    @staticmethod
+    def notify_grade(grade) -> Notification:
+        """Queue the notification of a new grade for the submission's student."""
+
+        return Notification.objects.create(
+            user_id=grade.submission.student_id,
+            kind=Notification.Kinds.GRADE,
+            object_id=grade.pk,
+            text=f"Your submission {grade.submission_id} was graded: {grade.score}/100.",
+        )
+
+    @staticmethod
+    def notify_grade_comment(comment) -> Notification:
+        """Queue the notification of a grade comment for the student, or for the grader if the student wrote it."""
+
+        grade = comment.grade
+        student_id = grade.submission.student_id
+        recipient_id = grade.graded_by_id if comment.author_id == student_id else student_id
+        return Notification.objects.create(
+            user_id=recipient_id,
+            kind=Notification.Kinds.COMMENT,
+            object_id=comment.pk,
+            text=f"New comment on the grade of submission {grade.submission_id}: {comment.text[:200]}",
+        )
+
+    @staticmethod
+    def enqueue_deadline_reminders(now=None) -> int:
+        """Queue one reminder per enrolled student who has not submitted an assignment due soon.
+
+        Assignments due within ``NOTIFY_REMINDER_HOURS`` are matched against
+        enrolled students in one anti-join query; students already reminded of an
+        assignment are skipped, so the job can run as often as wanted.
+
+        Returns the number of candidate reminders. A run overlapping this one may
+        have queued some of them first; the unique constraint then drops the
+        duplicates, so fewer rows may have been inserted.
+        """
+
+        now = now or timezone.now()
+        reminded = Notification.objects.filter(
+            kind=Notification.Kinds.DEADLINE, user_id=OuterRef("reminded_student"), object_id=OuterRef("pk")
+        )
+        submitted = Submission.objects.filter(assignment=OuterRef("pk"), student=OuterRef("reminded_student"))
+        due = (
+            HomeworkAssignment.objects.due_between(now, now + timedelta(hours=settings.NOTIFY_REMINDER_HOURS))
+            .filter(lecture__course__access__role=CourseAccess.Roles.STUDENT)
+            .annotate(reminded_student=F("lecture__course__access__user_id"))
+            .filter(~Exists(submitted), ~Exists(reminded))
+            .values_list("pk", "reminded_student", "lecture__topic", "due_date")
+        )
+        reminders = [
+            Notification(
+                user_id=student_id,
+                kind=Notification.Kinds.DEADLINE,
+                object_id=assignment_id,
+                text=f"Homework for '{topic}' is due {due_date:%Y-%m-%d %H:%M} UTC and you have not submitted it yet.",
+            )
+            for assignment_id, student_id, topic, due_date in due
+        ]
+        Notification.objects.bulk_create(reminders, batch_size=INSERT_BATCH_SIZE, ignore_conflicts=True)
+        logger.info("Queued %d deadline reminder candidates; any already queued were skipped", len(reminders))
+        return len(reminders)
+
+    @staticmethod
+    def deliver(connection=None, batch_size: int | None = None) -> DeliveryResult:
+        """Send every pending notification, coalesced into one digest email per user.
+
+        Digests go out ``batch_size`` users at a time over a single SMTP
+        connection that stays open for the whole run. The digests a batch got
+        through are marked as sent even if a later one fails, so an error never
+        resends mail. Notifications of users without an email address, or whose
+        address the server refuses, are marked as sent and counted as skipped.
+        """
+
+        batch_size = batch_size or settings.NOTIFY_BATCH_SIZE
+        connection = connection or get_connection()
+        result = DeliveryResult()
+        last_user_id = 0
+
+        with connection:
+            while True:
+                user_ids = list(
+                    Notification.objects.pending()
+                    .filter(user_id__gt=last_user_id)
+                    .order_by("user_id")
+                    .values_list("user_id", flat=True)
+                    .distinct()[:batch_size]
+                )
+                if not user_ids:
+                    break
+                last_user_id = user_ids[-1]
+
+                pending = list(
+                    Notification.objects.pending()
+                    .filter(user_id__in=user_ids)
+                    .order_by("user_id", "created_at", "pk")
+                    .values_list("pk", "user_id", "text")
+                )
+                emails = dict(User.objects.filter(pk__in=user_ids).exclude(email="").values_list("pk", "email"))
+                done, digests = [], []
+                for user_id, rows in groupby(pending, key=itemgetter(1)):
+                    rows = list(rows)
+                    pks = [pk for pk, _, _ in rows]
+                    if user_id not in emails:
+                        result.skipped += len(pks)
+                        done += pks
+                        continue
+                    digests.append((pks, NotificationService._digest(emails[user_id], [text for _, _, text in rows])))
+
+                try:
+                    for pks, message in digests:
+                        try:
+                            connection.send_messages([message])
+                        except smtplib.SMTPRecipientsRefused:
+                            logger.warning("Mail server refused %s; dropped %d notifications", message.to[0], len(pks))
+                            result.skipped += len(pks)
+                        else:
+                            result.digests += 1
+                        done += pks
+                finally:
+                    Notification.objects.filter(pk__in=done).update(sent_at=timezone.now())
+                    result.notifications += len(done)
+
+        logger.info(
+            "Delivered %d notifications in %d digests (%d without email address)",
+            result.notifications,
+            result.digests,
+            result.skipped,
+        )
+        return result
+
+    @staticmethod
+    def _digest(email: str, lines: list[str]) -> EmailMessage:
+        """Build the digest email of one user."""
+
+        subject = "1 new notification" if len(lines) == 1 else f"{len(lines)} new notifications"
+        body = "\n".join(f"- {line}" for line in lines)
+        return EmailMessage(f"OCMS: {subject}", body, settings.NOTIFY_FROM_EMAIL, [email])
@@ -0,0 +1,14 @@
+def notify_grade(sender, instance, created, **kwargs):
+    """Queue a notification for the student whose submission was graded."""
+    if created:
+        from .services import NotificationService
+
+        NotificationService.notify_grade(instance)
+
+
+def notify_grade_comment(sender, instance, created, **kwargs):
+    """Queue a notification for the other party of a grade discussion."""
+    if created:
+        from .services import NotificationService
+
+        NotificationService.notify_grade_comment(instance)
@@ -0,0 +1,115 @@
+"""A minimal in-process SMTP server standing in for a real relay.
+
+It speaks just enough SMTP for ``smtplib`` (EHLO/HELO, MAIL, RCPT, DATA, RSET,
+NOOP, QUIT), keeps every accepted message in memory and counts connections,
+so tests and ``manage.py bench_notifications`` can check batching and
+connection reuse without a mail server. Recipients listed in ``refused`` are
+rejected at RCPT with a 550, as a relay does for unknown mailboxes.
+"""
+
+import socketserver
+import threading
+from dataclasses import dataclass
+
+
+@dataclass
+class ReceivedMessage:
+    """One message accepted by the stub server."""
+
+    sender: str
+    recipients: list[str]
+    data: bytes
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        server = self.server.stub
+        with server.lock:
+            server.connections += 1
+        self.reply(b"220 stub ESMTP ready")
+        sender, recipients = "", []
+        while line := self.rfile.readline():
+            command, _, argument = line.rstrip(b"\r\n").decode("ascii", "replace").partition(" ")
+            command = command.upper()
+            if command == "EHLO":
+                self.reply(b"250-stub", b"250 8BITMIME")
+            elif command == "HELO":
+                self.reply(b"250 stub")
+            elif command == "MAIL":
+                sender, recipients = argument.partition(":")[2].strip(" <>"), []
+                self.reply(b"250 OK")
+            elif command == "RCPT":
+                recipient = argument.partition(":")[2].strip(" <>")
+                if recipient in server.refused:
+                    self.reply(b"550 No such user")
+                    continue
+                recipients.append(recipient)
+                self.reply(b"250 OK")
+            elif command == "DATA":
+                self.reply(b"354 End data with <CR><LF>.<CR><LF>")
+                data = self.read_data()
+                with server.lock:
+                    server.messages.append(ReceivedMessage(sender, recipients, data))
+                sender, recipients = "", []
+                self.reply(b"250 OK")
+            elif command == "RSET":
+                sender, recipients = "", []
+                self.reply(b"250 OK")
+            elif command == "NOOP":
+                self.reply(b"250 OK")
+            elif command == "QUIT":
+                self.reply(b"221 Bye")
+                return
+            else:
+                self.reply(b"502 Command not implemented")
+
+    def read_data(self) -> bytes:
+        lines = []
+        while (line := self.rfile.readline()) not in (b".\r\n", b".\n", b""):
+            lines.append(line[1:] if line.startswith(b"..") else line)
+        return b"".join(lines)
+
+    def reply(self, *lines: bytes):
+        self.wfile.write(b"".join(line + b"\r\n" for line in lines))
+
+
+class _ThreadingServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class StubSMTPServer:
+    """Run the stub on a free localhost port for the duration of a ``with`` block."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, refused=()):
+        self.messages: list[ReceivedMessage] = []
+        self.refused = frozenset(refused)
+        self.connections = 0
+        self.lock = threading.Lock()
+        self._server = _ThreadingServer((host, port), _SMTPHandler)
+        self._server.stub = self
+        self.host, self.port = self._server.server_address[:2]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="smtp-stub", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def connection(self, **kwargs):
+        """Return a Django SMTP email backend pointed at this server."""
+        from django.core.mail import get_connection
+
+        return get_connection(
+            "django.core.mail.backends.smtp.EmailBackend",
+            host=self.host,
+            port=self.port,
+            username="",
+            password="",
+            use_tls=False,
+            use_ssl=False,
+            **kwargs,
+        )
@@ -0,0 +1,137 @@
+from datetime import timedelta
+
+import pytest
+from django.core import mail
+from django.utils import timezone
+
+from courses.tests.factories import (
+    CourseFactory,
+    GradeCommentFactory,
+    GradeFactory,
+    HomeworkAssignmentFactory,
+    LectureFactory,
+    StudentFactory,
+    SubmissionFactory,
+    UserFactory,
+)
+from notifications.models import Notification
+from notifications.services import NotificationService
+from notifications.smtp_stub import StubSMTPServer
+
+
+def _notify(user, count):
+    Notification.objects.bulk_create(
+        Notification(user=user, kind=Notification.Kinds.GRADE, object_id=i, text=f"note {i}") for i in range(count)
+    )
+
+
+@pytest.mark.django_db
+class TestEnqueue:
+    def test_grade_notifies_student(self):
+        grade = GradeFactory()
+
+        notification = Notification.objects.get()
+        assert notification.user_id == grade.submission.student_id
+        assert notification.kind == Notification.Kinds.GRADE
+        assert notification.object_id == grade.pk
+        assert notification.sent_at is None
+
+    def test_comment_notifies_other_party(self):
+        grade = GradeFactory()
+        student_comment = GradeCommentFactory(grade=grade, author=grade.submission.student)
+        teacher_comment = GradeCommentFactory(grade=grade, author=grade.graded_by)
+
+        comments = Notification.objects.filter(kind=Notification.Kinds.COMMENT)
+        assert comments.get(object_id=student_comment.pk).user_id == grade.graded_by_id
+        assert comments.get(object_id=teacher_comment.pk).user_id == grade.submission.student_id
+
+
+@pytest.mark.django_db
+class TestDeadlineReminders:
+    def test_reminds_students_without_submission_once(self):
+        submitted, pending = StudentFactory.create_batch(2)
+        course = CourseFactory(students=[submitted, pending])
+        lecture = LectureFactory(course=course)
+        due_soon = HomeworkAssignmentFactory(lecture=lecture, due_date=timezone.now() + timedelta(hours=3))
+        HomeworkAssignmentFactory(lecture=lecture, due_date=timezone.now() + timedelta(days=5))
+        HomeworkAssignmentFactory(lecture=lecture, due_date=timezone.now() - timedelta(hours=3))
+        SubmissionFactory(assignment=due_soon, student=submitted)
+
+        assert NotificationService.enqueue_deadline_reminders() == 1
+        assert NotificationService.enqueue_deadline_reminders() == 0
+
+        reminder = Notification.objects.get(kind=Notification.Kinds.DEADLINE)
+        assert (reminder.user_id, reminder.object_id) == (pending.pk, due_soon.pk)
+
+    def test_query_count_does_not_grow_with_students(self, django_assert_num_queries):
+        course = CourseFactory(students=StudentFactory.create_batch(5))
+        for _ in range(3):
+            HomeworkAssignmentFactory(
+                lecture=LectureFactory(course=course), due_date=timezone.now() + timedelta(hours=1)
+            )
+
+        with django_assert_num_queries(2):
+            assert NotificationService.enqueue_deadline_reminders() == 15
+
+
+@pytest.mark.django_db
+class TestDeliver:
+    def test_one_digest_per_user(self):
+        first, second = UserFactory.create_batch(2)
+        _notify(first, 3)
+        _notify(second, 1)
+
+        result = NotificationService.deliver()
+
+        assert (result.notifications, result.digests, result.skipped) == (4, 2, 0)
+        digests = {message.to[0]: message for message in mail.outbox}
+        assert digests[first.email].subject == "OCMS: 3 new notifications"
+        assert digests[first.email].body == "- note 0\n- note 1\n- note 2"
+        assert digests[second.email].subject == "OCMS: 1 new notification"
+        assert not Notification.objects.pending().exists()
+
+    def test_sent_notifications_are_not_resent(self):
+        user = UserFactory()
+        _notify(user, 2)
+        NotificationService.deliver()
+        _notify(user, 1)
+
+        result = NotificationService.deliver()
+
+        assert (result.notifications, result.digests) == (1, 1)
+        assert len(mail.outbox) == 2
+
+    def test_users_without_email_are_skipped(self):
+        _notify(UserFactory(email=""), 2)
+
+        result = NotificationService.deliver()
+
+        assert (result.notifications, result.digests, result.skipped) == (2, 0, 2)
+        assert mail.outbox == []
+        assert not Notification.objects.pending().exists()
+
+    def test_batches_share_one_smtp_connection(self):
+        users = UserFactory.create_batch(5)
+        for user in users:
+            _notify(user, 2)
+
+        with StubSMTPServer() as server:
+            result = NotificationService.deliver(server.connection(), batch_size=2)
+
+        assert (result.notifications, result.digests) == (10, 5)
+        assert server.connections == 1
+        assert sorted(recipient for message in server.messages for recipient in message.recipients) == sorted(
+            user.email for user in users
+        )
+
+    def test_refused_recipient_does_not_block_the_batch(self):
+        bad, first, second = UserFactory.create_batch(3)
+        for user in (bad, first, second):
+            _notify(user, 2)
+
+        with StubSMTPServer(refused=[bad.email]) as server:
+            result = NotificationService.deliver(server.connection())
+
+        assert (result.notifications, result.digests, result.skipped) == (6, 2, 2)
+        assert sorted(message.recipients[0] for message in server.messages) == sorted([first.email, second.email])
+        assert not Notification.objects.pending().exists()
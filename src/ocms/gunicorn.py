@@ -0,0 +1,72 @@
+"""Production server configuration.
+
+Run from ``src/`` with::
+
+    gunicorn -c python:ocms.gunicorn ocms.asgi:application
+
+Every value comes from the ``SERVER_*`` environment variables read in ``ocms/settings.py``.
+"""
+
+import os
+import shutil
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "ocms.settings")
+
+from ocms import settings  # noqa: E402
+
+# Must be set before prometheus_client is imported (the app is preloaded) so every worker writes to the
+# shared directory. Samples of a previous run are discarded in on_starting, not here.
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", settings.METRICS_MULTIPROC_DIR)
+os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+bind = settings.SERVER_BIND
+workers = settings.SERVER_WORKERS
+worker_class = settings.SERVER_WORKER_CLASS
+max_requests = settings.SERVER_MAX_REQUESTS
+max_requests_jitter = settings.SERVER_MAX_REQUESTS_JITTER
+timeout = settings.SERVER_TIMEOUT
+graceful_timeout = settings.SERVER_GRACEFUL_TIMEOUT
+keepalive = settings.SERVER_KEEPALIVE
+preload_app = True
+accesslog = "-"
+
+
+def on_starting(server):
+    """Discard metric samples left over from a previous run, once, when the master starts.
+
+    Not done at import: re-reading the config (``--check-config``, reloads) must
+    not wipe the files of running workers. The preloaded master's own samples
+    go too, which is fine as it serves no requests.
+    """
+    shutil.rmtree(os.environ["PROMETHEUS_MULTIPROC_DIR"], ignore_errors=True)
+    os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+
+def when_ready(server):
+    """Warm the preloaded application in the master so every forked worker starts hot."""
+    from ocms.warmup import close_database_connections, warm_up_application
+
+    warm_up_application()
+    # Connections and pools must not be shared across fork; each worker opens its own.
+    close_database_connections()
+
+
+def post_fork(server, worker):
+    """Fill the worker's own connection pools before it accepts requests."""
+    from ocms.warmup import open_connection_pools
+
+    open_connection_pools()
+
+
+def worker_exit(server, worker):
+    """Release database connections once in-flight requests have drained."""
+    from ocms.warmup import close_database_connections
+
+    close_database_connections()
+
+
+def child_exit(server, worker):
+    """Drop the live gauges of an exited worker from the aggregated metrics."""
+    from core.metrics import mark_process_dead
+
+    mark_process_dead(worker.pid)
@@ -1,4 +1,6 @@
+import importlib.util
 import os
+from copy import deepcopy
 from datetime import timedelta
 from pathlib import Path
 
@@ -25,9 +27,16 @@ INSTALLED_APPS = [
     "users",
     "courses",
     "authentication",
+    "notifications",
+    "core",
 ]
 
 MIDDLEWARE = [
+    "core.middleware.RequestIdMiddleware",
+    "core.middleware.TracingMiddleware",
+    "core.middleware.ServerTimingMiddleware",
+    "core.middleware.MetricsMiddleware",
+    "core.middleware.CompressionMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -56,15 +65,62 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "ocms.wsgi.application"
+ASGI_APPLICATION = "ocms.asgi.application"
+
+# Production application server (see ocms/gunicorn.py).
+SERVER_BIND = os.getenv("SERVER_BIND", "0.0.0.0:8000")
+SERVER_WORKERS = int(os.getenv("SERVER_WORKERS", (os.cpu_count() or 1) * 2 + 1))
+SERVER_WORKER_CLASS = os.getenv("SERVER_WORKER_CLASS", "uvicorn_worker.UvicornWorker")
+SERVER_MAX_REQUESTS = int(os.getenv("SERVER_MAX_REQUESTS", "2000"))
+SERVER_MAX_REQUESTS_JITTER = int(os.getenv("SERVER_MAX_REQUESTS_JITTER", "200"))
+SERVER_TIMEOUT = int(os.getenv("SERVER_TIMEOUT", "30"))
+SERVER_GRACEFUL_TIMEOUT = int(os.getenv("SERVER_GRACEFUL_TIMEOUT", "30"))
+SERVER_KEEPALIVE = int(os.getenv("SERVER_KEEPALIVE", "5"))
+
+DB_ENGINE = os.getenv("DB_ENGINE", "django.db.backends.sqlite3")
+# psycopg's built-in pool replaces persistent connections; Django refuses to combine the two.
+DB_POOL = DB_ENGINE == "django.db.backends.postgresql" and os.getenv("DB_POOL", "1") == "1"
 
 DATABASES = {
     "default": {
-        "ENGINE": os.getenv("DB_ENGINE", "django.db.backends.sqlite3"),
+        "ENGINE": DB_ENGINE,
         "NAME": os.getenv("DB_NAME", BASE_DIR / "db.sqlite3"),
         "USER": os.getenv("DB_USER", ""),
         "PASSWORD": os.getenv("DB_PASSWORD", ""),
         "HOST": os.getenv("DB_HOST", ""),
         "PORT": os.getenv("DB_PORT", ""),
+        "CONN_MAX_AGE": 0 if DB_POOL else int(os.getenv("DB_CONN_MAX_AGE", "0")),
+        "CONN_HEALTH_CHECKS": os.getenv("DB_CONN_HEALTH_CHECKS", "1") == "1",
+        "OPTIONS": {},
+    }
+}
+
+if DB_POOL:
+    DATABASES["default"]["OPTIONS"]["pool"] = {
+        "min_size": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+        "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+        "timeout": float(os.getenv("DB_POOL_TIMEOUT", "10")),
+        "max_lifetime": float(os.getenv("DB_POOL_MAX_LIFETIME", "1800")),
+        "max_idle": float(os.getenv("DB_POOL_MAX_IDLE", "300")),
+    }
+
+# Optional read replica: safe-method API reads go there unless the user wrote recently.
+if os.getenv("DB_REPLICA_HOST"):
+    DATABASES["replica"] = {
+        **deepcopy(DATABASES["default"]),
+        "HOST": os.getenv("DB_REPLICA_HOST"),
+        "PORT": os.getenv("DB_REPLICA_PORT", DATABASES["default"]["PORT"]),
+        "TEST": {"MIRROR": "default"},
+    }
+
+DATABASE_ROUTERS = ["core.db_router.PrimaryReplicaRouter"]
+DB_REPLICA_STICKY_SECONDS = int(os.getenv("DB_REPLICA_STICKY_SECONDS", "10"))
+
+# Must be shared across workers (e.g. Redis) for cross-process state such as replica stickiness.
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "core.cache.LocMemCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", ""),
     }
 }
 
@@ -75,6 +131,116 @@ AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.NumericPasswordValidator"},
 ]
 
+# Processes used to hash passwords during bulk user provisioning.
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 1))
+# Rows accepted by POST /api/v1/users/bulk; hashing must fit in SERVER_TIMEOUT, larger intakes use provision_users.
+BULK_PROVISION_MAX_ROWS = int(os.getenv("BULK_PROVISION_MAX_ROWS", "200"))
+
+# Login password checks run in a dedicated pool; excess concurrent logins get 503 + Retry-After.
+LOGIN_HASH_WORKERS = int(os.getenv("LOGIN_HASH_WORKERS", "2"))
+LOGIN_QUEUE_SIZE = int(os.getenv("LOGIN_QUEUE_SIZE", "16"))
+LOGIN_HASH_TIMEOUT = float(os.getenv("LOGIN_HASH_TIMEOUT", "10"))
+LOGIN_RETRY_AFTER = int(os.getenv("LOGIN_RETRY_AFTER", "2"))
+
+# Per-phase Server-Timing header: "0" off, "staff" for staff users only, "1" for everyone (exposes
+# timings usable for enumeration). SERVER_TIMING_LOG logs one line per request whatever the header does.
+SERVER_TIMING = os.getenv("SERVER_TIMING", "0")
+SERVER_TIMING_LOG = os.getenv("SERVER_TIMING_LOG", "0") == "1"
+
+# Negotiated response compression (zstd and br only when their packages are installed).
+COMPRESSION = os.getenv("COMPRESSION", "1") == "1"
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_ENCODINGS = os.getenv("COMPRESSION_ENCODINGS", "zstd,br,gzip").split(",")
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+COMPRESSION_ZSTD_LEVEL = int(os.getenv("COMPRESSION_ZSTD_LEVEL", "3"))
+
+# List actions render through serializers compiled into generated functions (api/compiled.py).
+COMPILED_SERIALIZERS = os.getenv("COMPILED_SERIALIZERS", "1") == "1"
+
+# Delta sync (/api/v1/sync): page size, re-read window for late commits, and cursor/tombstone lifetime.
+SYNC_PAGE_SIZE = int(os.getenv("SYNC_PAGE_SIZE", "500"))
+SYNC_CURSOR_LAG_SECONDS = int(os.getenv("SYNC_CURSOR_LAG_SECONDS", "5"))
+SYNC_TOMBSTONE_DAYS = int(os.getenv("SYNC_TOMBSTONE_DAYS", "30"))
+
+# Dashboards: how far ahead "upcoming" looks, and the length of each list.
+DASHBOARD_UPCOMING_DAYS = int(os.getenv("DASHBOARD_UPCOMING_DAYS", "14"))
+DASHBOARD_LIST_LIMIT = int(os.getenv("DASHBOARD_LIST_LIMIT", "20"))
+
+# Assignments per anti-join query of the missing-submission scan (manage.py scan_missing_submissions).
+MISSING_SCAN_BATCH_SIZE = int(os.getenv("MISSING_SCAN_BATCH_SIZE", "200"))
+
+# Outgoing mail; notification digests are sent by manage.py send_notifications, never inside requests.
+EMAIL_BACKEND = os.getenv("EMAIL_BACKEND", "django.core.mail.backends.smtp.EmailBackend")
+EMAIL_HOST = os.getenv("EMAIL_HOST", "localhost")
+EMAIL_PORT = int(os.getenv("EMAIL_PORT", "25"))
+EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER", "")
+EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD", "")
+EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS", "0") == "1"
+EMAIL_TIMEOUT = int(os.getenv("EMAIL_TIMEOUT", "30"))
+DEFAULT_FROM_EMAIL = os.getenv("DEFAULT_FROM_EMAIL", "ocms@localhost")
+# Reminders go out this many hours before a due date; digests are sent this many users per batch.
+NOTIFY_REMINDER_HOURS = int(os.getenv("NOTIFY_REMINDER_HOURS", "24"))
+NOTIFY_BATCH_SIZE = int(os.getenv("NOTIFY_BATCH_SIZE", "100"))
+NOTIFY_FROM_EMAIL = os.getenv("NOTIFY_FROM_EMAIL", DEFAULT_FROM_EMAIL)
+
+# Opt-in tracing: request, service-method and SQL spans exported as OTLP/JSON to a file or collector URL.
+TRACING = os.getenv("TRACING", "0") == "1"
+TRACING_EXPORT = os.getenv("TRACING_EXPORT", str(BASE_DIR.parent / "traces.jsonl"))
+TRACING_SERVICE_NAME = os.getenv("TRACING_SERVICE_NAME", "ocms")
+TRACING_MAX_SPANS = int(os.getenv("TRACING_MAX_SPANS", "1000"))
+
+# Prometheus metrics at /metrics; aggregated across workers through PROMETHEUS_MULTIPROC_DIR under gunicorn.
+# Without METRICS_TOKEN only direct (unproxied) requests from localhost may scrape.
+METRICS = os.getenv("METRICS", "1") == "1"
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+METRICS_MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR", "/tmp/ocms-metrics")
+
+# SQL fingerprint statistics per process, flushed to QUERY_STATS_DIR; plans captured for slow SELECTs.
+QUERY_STATS = os.getenv("QUERY_STATS", "0") == "1"
+QUERY_STATS_DIR = os.getenv("QUERY_STATS_DIR", "/tmp/ocms-querystats")
+QUERY_STATS_FLUSH_SECONDS = float(os.getenv("QUERY_STATS_FLUSH_SECONDS", "30"))
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "100"))
+
+# Logs are queued and written by a background thread; JSON lines carry the request id.
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json")
+LOG_FILE = os.getenv("LOG_FILE") or None
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+LOG_INFO_SAMPLE_RATE = float(os.getenv("LOG_INFO_SAMPLE_RATE", "1.0"))
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "filters": {
+        "require_debug_false": {"()": "django.utils.log.RequireDebugFalse"},
+        "request_id": {"()": "core.logs.RequestIdFilter"},
+        "sampling": {"()": "core.logs.SamplingFilter", "rate": LOG_INFO_SAMPLE_RATE},
+    },
+    "formatters": {
+        "json": {"()": "core.logs.JsonFormatter"},
+        "text": {"format": "%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s"},
+    },
+    "handlers": {
+        "background": {
+            "()": "core.logs.BackgroundHandler",
+            "filename": LOG_FILE,
+            "queue_size": LOG_QUEUE_SIZE,
+            "formatter": LOG_FORMAT,
+            "filters": ["request_id", "sampling"],
+        },
+        # Django's default: server errors are mailed to ADMINS when DEBUG is off.
+        "mail_admins": {
+            "level": "ERROR",
+            "filters": ["require_debug_false"],
+            "class": "django.utils.log.AdminEmailHandler",
+        },
+    },
+    "root": {"handlers": ["background"], "level": LOG_LEVEL},
+    # Replace Django's console handler so its records reach the background handler once, through the root.
+    "loggers": {"django": {"handlers": ["mail_admins"], "level": LOG_LEVEL, "propagate": True}},
+}
+
 LANGUAGE_CODE = "en-us"
 TIME_ZONE = "UTC"
 USE_I18N = True
@@ -86,12 +252,54 @@ MEDIA_ROOT = BASE_DIR / "media"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 AUTH_USER_MODEL = "users.User"
+# Like ModelBackend, but password checks run in the bounded login pool (LOGIN_HASH_*).
+AUTHENTICATION_BACKENDS = ["authentication.backends.PooledModelBackend"]
+
+# Token-claims user mode: authenticated API requests build the user from the access token, no query.
+AUTH_TOKEN_CLAIMS_USER = os.getenv("AUTH_TOKEN_CLAIMS_USER", "1") == "1"
+# Users' token versions are cached this long; a revocation reaches processes with their own cache within it.
+AUTH_TOKEN_VERSION_CACHE_SECONDS = int(os.getenv("AUTH_TOKEN_VERSION_CACHE_SECONDS", "60"))
+
+# Accept / Content-Type: application/msgpack on the API when the msgpack package is installed.
+MSGPACK = importlib.util.find_spec("msgpack") is not None
+
+# Token-bucket throttling per client and scope: "<burst>/<period>", refilled evenly over the period.
+THROTTLE_LOGIN_RATE = os.getenv("THROTTLE_LOGIN_RATE", "10/min")
+THROTTLE_SUBMISSION_RATE = os.getenv("THROTTLE_SUBMISSION_RATE", "30/min")
+THROTTLE_GRADING_RATE = os.getenv("THROTTLE_GRADING_RATE", "120/min")
+THROTTLE_READ_RATE = os.getenv("THROTTLE_READ_RATE", "600/min")
+# Reverse proxies in front of the app that append to X-Forwarded-For; 0 keys anonymous clients on REMOTE_ADDR.
+THROTTLE_NUM_PROXIES = int(os.getenv("THROTTLE_NUM_PROXIES", "0"))
 
 REST_FRAMEWORK = {
-    "DEFAULT_AUTHENTICATION_CLASSES": ("rest_framework_simplejwt.authentication.JWTAuthentication",),
+    "DEFAULT_AUTHENTICATION_CLASSES": (
+        "authentication.backends.ClaimsJWTAuthentication"
+        if AUTH_TOKEN_CLAIMS_USER
+        else "rest_framework_simplejwt.authentication.JWTAuthentication",
+    ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
+    # orjson-backed JSON with DRF's exact output; both fall back to the stdlib without orjson.
+    "DEFAULT_RENDERER_CLASSES": (
+        "api.renderers.JSONRenderer",
+        *(["api.renderers.MessagePackRenderer"] if MSGPACK else []),
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "api.parsers.JSONParser",
+        *(["api.parsers.MessagePackParser"] if MSGPACK else []),
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
+    "DEFAULT_THROTTLE_CLASSES": ("api.throttling.TokenBucketThrottle",),
+    "DEFAULT_THROTTLE_RATES": {
+        "login": THROTTLE_LOGIN_RATE,
+        "submission": THROTTLE_SUBMISSION_RATE,
+        "grading": THROTTLE_GRADING_RATE,
+        "read": THROTTLE_READ_RATE,
+    },
+    "NUM_PROXIES": THROTTLE_NUM_PROXIES,
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
-    "EXCEPTION_HANDLER": "api.exceptions.custom_exception_handler",
+    "EXCEPTION_HANDLER": "api.v1.exceptions.custom_exception_handler",
 }
 
 SPECTACULAR_SETTINGS = {
@@ -101,9 +309,15 @@ SPECTACULAR_SETTINGS = {
     "SERVE_INCLUDE_SCHEMA": False,
 }
 
+# The schema is served from memory; exported artifacts (manage.py export_schema) are used when present.
+SCHEMA_ARTIFACT_DIR = os.getenv("SCHEMA_ARTIFACT_DIR", str(BASE_DIR / "schema"))
+SCHEMA_PRELOAD = os.getenv("SCHEMA_PRELOAD", "1") == "1"
+SCHEMA_MAX_AGE = int(os.getenv("SCHEMA_MAX_AGE", "300"))
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(hours=12),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
     "ROTATE_REFRESH_TOKENS": False,
     "BLACKLIST_AFTER_ROTATION": True,
+    "TOKEN_OBTAIN_SERIALIZER": "authentication.serializers.TokenObtainPairSerializer",
 }
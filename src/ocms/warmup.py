@@ -0,0 +1,87 @@
+import logging
+
+from django.conf import settings
+from django.db import connections
+from django.urls import URLPattern, URLResolver, get_resolver
+
+logger = logging.getLogger(__name__)
+
+
+def warm_up_application() -> None:
+    """Pay the lazy one-off costs once, in the server master, before workers fork."""
+
+    patterns, views = _warm_url_resolver()
+    serializers = _warm_serializers(views)
+    logger.info("Warm-up resolved %s URL patterns and compiled %s serializers", patterns, serializers)
+    if settings.SCHEMA_PRELOAD:
+        from api.schema import load_schemas
+
+        load_schemas()
+        logger.info("Warm-up loaded the OpenAPI schema")
+
+
+def open_connection_pools() -> int:
+    """Open the psycopg pool of every pooled database alias and wait for its ``min_size`` connections.
+
+    Django connections belong to a thread, so only a pool, which every thread
+    of the process draws from, can usefully be filled ahead of requests.
+    Returns the number of pools opened.
+    """
+
+    opened = 0
+    for connection in connections.all():
+        pool = getattr(connection, "pool", None)
+        if pool is None:
+            continue
+        try:
+            pool.open(wait=True, timeout=pool.timeout)
+        except Exception:
+            logger.warning("Could not fill the '%s' connection pool during warm-up", connection.alias, exc_info=True)
+            continue
+        opened += 1
+    return opened
+
+
+def close_database_connections() -> None:
+    """Close the current thread's connections and every connection pool of the process."""
+
+    connections.close_all()
+    for connection in connections.all():
+        if getattr(connection, "pool", None) is not None:
+            connection.close_pool()
+
+
+def _warm_url_resolver() -> tuple[int, list]:
+    """Import every URLconf and populate the reverse lookup tables."""
+
+    views = []
+
+    def walk(resolver: URLResolver) -> int:
+        resolver.reverse_dict  # populates the lookup caches
+        count = 0
+        for pattern in resolver.url_patterns:
+            if isinstance(pattern, URLResolver):
+                count += walk(pattern)
+            elif isinstance(pattern, URLPattern):
+                views.append(pattern.callback)
+                count += 1
+        return count
+
+    return walk(get_resolver()), views
+
+
+def _warm_serializers(views) -> int:
+    """Compile every serializer reachable from a view; the cached result is inherited by forked workers."""
+
+    if not settings.COMPILED_SERIALIZERS:
+        return 0
+
+    from api.compiled import compile_serializer
+
+    compiled = set()
+    for view in views:
+        view_class = getattr(view, "cls", None) or getattr(view, "view_class", None)
+        serializer_class = getattr(view_class, "serializer_class", None)
+        if serializer_class is not None and compile_serializer(serializer_class) is not None:
+            compiled.add(serializer_class)
+    return len(compiled)
@@ -0,0 +1,54 @@
+import atexit
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+
+# Below this many passwords the pool start-up costs more than it saves.
+MIN_PARALLEL_PASSWORDS = 64
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def setup_hashing_worker():
+    """Configure Django in a freshly spawned hashing process."""
+    import django
+
+    django.setup()
+
+
+def _shared_pool() -> ProcessPoolExecutor:
+    """Return the process-wide pool of ``PASSWORD_HASH_WORKERS`` processes, starting it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = _start_pool(settings.PASSWORD_HASH_WORKERS)
+            atexit.register(_pool.shutdown, cancel_futures=True)
+        return _pool
+
+
+def _start_pool(workers: int) -> ProcessPoolExecutor:
+    # "spawn" keeps the pool safe to start from threaded application servers.
+    context = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=setup_hashing_worker)
+
+
+def hash_passwords(passwords: list[str], workers: int | None = None) -> list[str]:
+    """Hash passwords across a process pool, preserving order.
+
+    Without ``workers`` the long-lived shared pool is used, so requests do not
+    pay for spawning processes; an explicit worker count gets its own pool.
+    """
+
+    count = workers or settings.PASSWORD_HASH_WORKERS
+    if count <= 1 or len(passwords) < MIN_PARALLEL_PASSWORDS:
+        return [make_password(password) for password in passwords]
+
+    chunksize = max(1, len(passwords) // (count * 4))
+    if workers is None or workers == settings.PASSWORD_HASH_WORKERS:
+        return list(_shared_pool().map(make_password, passwords, chunksize=chunksize))
+    with _start_pool(workers) as pool:
+        return list(pool.map(make_password, passwords, chunksize=chunksize))
@@ -0,0 +1,33 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from users.provisioning import detect_format, read_rows
+from users.services import UserService
+
+
+class Command(BaseCommand):
+    help = "Create users in bulk from a CSV (username,email,password,role) or JSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV or JSON file with one user per row.")
+        parser.add_argument("--format", choices=["csv", "json"], help="Input format; guessed from the extension.")
+        parser.add_argument("--workers", type=int, help="Password hashing processes (PASSWORD_HASH_WORKERS).")
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        if not path.exists():
+            raise CommandError(f"File not found: {path}")
+
+        try:
+            rows = read_rows(path.read_bytes(), options["format"] or detect_format(path.name))
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        result = UserService.bulk_create_users(rows, workers=options["workers"])
+
+        for error in result.errors:
+            self.stderr.write(f"row {error['row']}: {json.dumps(error['errors'])}")
+        summary = f"Created {len(result.created)} users, rejected {len(result.errors)} rows."
+        self.stdout.write(self.style.SUCCESS(summary))
@@ -13,6 +13,7 @@ class User(AbstractUser):
         STUDENT = "STUDENT", "Student"
 
     role = models.CharField(max_length=7, choices=Roles.choices)
+    token_version = models.PositiveIntegerField(default=0)
     objects = UserQuerySet.as_manager()
 
     def is_teacher(self):
@@ -0,0 +1,28 @@
+import csv
+import io
+import json
+
+PROVISIONING_FIELDS = ("username", "email", "password", "role")
+
+
+def read_rows(content: str | bytes, fmt: str) -> list[dict]:
+    """Parse a CSV (with header) or JSON (list of objects) user provisioning file."""
+
+    if isinstance(content, bytes):
+        content = content.decode("utf-8-sig")
+
+    if fmt == "csv":
+        return [dict(row) for row in csv.DictReader(io.StringIO(content))]
+    if fmt == "json":
+        rows = json.loads(content)
+        if isinstance(rows, dict):
+            rows = rows.get("users", [])
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise ValueError("JSON input must be a list of user objects.")
+        return rows
+    raise ValueError(f"Unsupported format: {fmt}")
+
+
+def detect_format(filename: str) -> str:
+    """Guess the provisioning format from a file name."""
+    return "json" if filename.lower().endswith(".json") else "csv"
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import F
 
 
 class UserQuerySet(models.QuerySet):
@@ -15,3 +16,16 @@ class UserQuerySet(models.QuerySet):
     def with_related_courses(self):
         """Prefetches related teaching and enrolled courses for efficiency."""
         return self.prefetch_related("teaching_courses", "enrolled_courses")
+
+    def update(self, **kwargs):
+        """Update the rows; changing a token claim bumps ``token_version`` like ``save()`` does."""
+        from authentication.claims import CLAIM_FIELDS, forget_token_versions
+
+        if "token_version" in kwargs or not any(name in kwargs for name in CLAIM_FIELDS):
+            return super().update(**kwargs)
+        user_ids = list(self.values_list("pk", flat=True))
+        updated = self.model._base_manager.filter(pk__in=user_ids).update(
+            token_version=F("token_version") + 1, **kwargs
+        )
+        forget_token_versions(user_ids)
+        return updated
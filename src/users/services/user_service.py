@@ -1,12 +1,33 @@
 import logging
+from dataclasses import dataclass, field
+
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import IntegrityError, transaction
+
+from core.tracing import traced
+
+from ..hashing import hash_passwords
+from ..provisioning import PROVISIONING_FIELDS
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+LOOKUP_BATCH_SIZE = 1000
+INSERT_BATCH_SIZE = 1000
+
 
+@dataclass
+class BulkProvisionResult:
+    """Outcome of a bulk provisioning run: created users and per-row errors."""
+
+    created: list = field(default_factory=list)
+    errors: list[dict] = field(default_factory=list)
+
+
+@traced
 class UserService:
     """Service class for user-related operations."""
 
@@ -14,7 +35,7 @@ class UserService:
     def create_user(username, email, password, role) -> User:
         """Validates password and creates a new user."""
 
-        logger.info(f"Attempting to create user with username: {username}")
+        logger.info("Attempting to create user with username: %s", username)
         try:
             validate_password(password)
         except ValidationError as e:
@@ -23,5 +44,122 @@ class UserService:
         user = User.objects.create(username=username, email=email, role=role)
         user.set_password(password)
         user.save()
-        logger.info(f"User {user.id} ({username}) created successfully")
+        logger.info("User %s (%s) created successfully", user.id, username)
         return user
+
+    @staticmethod
+    def bulk_create_users(rows: list[dict], workers: int | None = None) -> BulkProvisionResult:
+        """Validate, hash and insert many users at once, reporting errors per row.
+
+        Uniqueness is checked with batched ``IN`` queries, passwords are hashed
+        across a process pool and valid rows are inserted with ``bulk_create``.
+        Rows are numbered from 1 in the error report.
+        """
+
+        logger.info("Bulk provisioning %s users", len(rows))
+        result = BulkProvisionResult()
+        candidates = []
+        seen_usernames, seen_emails = set(), set()
+
+        for number, raw_row in enumerate(rows, start=1):
+            row = {name: str(raw_row.get(name) or "") for name in PROVISIONING_FIELDS}
+            for name in ("username", "email", "role"):
+                row[name] = row[name].strip()
+
+            errors = UserService._validate_row(row)
+            if row["username"] and row["username"] in seen_usernames:
+                errors.setdefault("username", []).append("Duplicate username in this batch.")
+            if row["email"] and row["email"] in seen_emails:
+                errors.setdefault("email", []).append("Duplicate email in this batch.")
+            seen_usernames.add(row["username"])
+            seen_emails.add(row["email"])
+
+            if errors:
+                result.errors.append({"row": number, "errors": errors})
+            else:
+                candidates.append((number, row))
+
+        taken_usernames = UserService._existing_values("username", [row["username"] for _, row in candidates])
+        taken_emails = UserService._existing_values("email", [row["email"] for _, row in candidates if row["email"]])
+
+        valid, numbers = [], []
+        for number, row in candidates:
+            errors = {}
+            if row["username"] in taken_usernames:
+                errors["username"] = ["A user with that username already exists."]
+            if row["email"] and row["email"] in taken_emails:
+                errors["email"] = ["A user with that email already exists."]
+            if errors:
+                result.errors.append({"row": number, "errors": errors})
+            else:
+                valid.append(row)
+                numbers.append(number)
+
+        hashes = hash_passwords([row["password"] for row in valid], workers=workers)
+        users = [
+            User(username=row["username"], email=row["email"], role=row["role"], password=password_hash)
+            for row, password_hash in zip(valid, hashes)
+        ]
+        try:
+            with transaction.atomic():
+                result.created = User.objects.bulk_create(users, batch_size=INSERT_BATCH_SIZE)
+        except IntegrityError:
+            # A concurrent request took one of the usernames after the check; find which, one savepoint per row.
+            result.created = UserService._create_each(users, numbers, result.errors)
+
+        result.errors.sort(key=lambda error: error["row"])
+        logger.info("Bulk provisioning created %s users, rejected %s rows", len(result.created), len(result.errors))
+        return result
+
+    @staticmethod
+    def _create_each(users: list, numbers: list[int], errors: list[dict]) -> list:
+        """Insert users one by one, reporting the rows that hit a uniqueness conflict."""
+
+        created = []
+        for number, user in zip(numbers, users):
+            try:
+                with transaction.atomic():
+                    user.save(force_insert=True)
+            except IntegrityError:
+                user.pk = None
+                errors.append({"row": number, "errors": {"username": ["A user with that username already exists."]}})
+            else:
+                created.append(user)
+        return created
+
+    @staticmethod
+    def _validate_row(row: dict) -> dict[str, list[str]]:
+        """Run field and password validation for a single provisioning row."""
+
+        errors = {}
+        for name in ("username", "password", "role"):
+            if not row[name]:
+                errors[name] = ["This field is required."]
+
+        candidate = User(username=row["username"], email=row["email"])
+        checks = [
+            ("username", lambda: User.username_validator(row["username"])),
+            ("email", lambda: validate_email(row["email"])),
+            ("password", lambda: validate_password(row["password"], candidate)),
+        ]
+        for name, check in checks:
+            if name in errors or (name == "email" and not row["email"]):
+                continue
+            try:
+                check()
+            except ValidationError as e:
+                errors[name] = list(e.messages)
+
+        if row["role"] and row["role"] not in User.Roles.values:
+            errors["role"] = [f"Role must be one of: {', '.join(User.Roles.values)}."]
+        return errors
+
+    @staticmethod
+    def _existing_values(field_name: str, values: list[str]) -> set[str]:
+        """Return which of the given values already exist, querying in batches."""
+
+        existing = set()
+        for start in range(0, len(values), LOOKUP_BATCH_SIZE):
+            batch = values[start : start + LOOKUP_BATCH_SIZE]
+            existing.update(User.objects.filter(**{f"{field_name}__in": batch}).values_list(field_name, flat=True))
+        return existing
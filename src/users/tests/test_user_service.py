@@ -30,3 +30,81 @@ class TestUserService:
             )
 
         assert User.objects.count() == 0
+
+
+@pytest.mark.django_db
+class TestBulkCreateUsers:
+    def _row(self, n, **overrides):
+        row = {"username": f"student{n}", "email": f"s{n}@example.com", "password": "Str0ngPass!x", "role": "STUDENT"}
+        row.update(overrides)
+        return row
+
+    def test_creates_valid_rows(self):
+        result = UserService.bulk_create_users([self._row(1), self._row(2)], workers=1)
+
+        assert len(result.created) == 2
+        assert result.errors == []
+        user = User.objects.get(username="student1")
+        assert user.check_password("Str0ngPass!x")
+        assert user.role == User.Roles.STUDENT
+
+    def test_reports_errors_per_row(self):
+        User.objects.create(username="taken", email="taken@example.com", role=User.Roles.STUDENT)
+        rows = [
+            self._row(1),
+            self._row(2, username="taken"),
+            self._row(3, password="123"),
+            self._row(4, role="ADMIN"),
+            self._row(5, username="student1"),
+            self._row(6, email="not-an-email"),
+        ]
+
+        result = UserService.bulk_create_users(rows, workers=1)
+
+        assert [user.username for user in result.created] == ["student1"]
+        assert [error["row"] for error in result.errors] == [2, 3, 4, 5, 6]
+        assert set(result.errors[0]["errors"]) == {"username"}
+        assert set(result.errors[1]["errors"]) == {"password"}
+        assert set(result.errors[2]["errors"]) == {"role"}
+        assert "Duplicate username in this batch." in result.errors[3]["errors"]["username"]
+        assert set(result.errors[4]["errors"]) == {"email"}
+
+    def test_uniqueness_checks_are_batched(self, django_assert_num_queries):
+        rows = [self._row(n) for n in range(10)]
+
+        # username lookup, email lookup, SAVEPOINT, INSERT, RELEASE SAVEPOINT
+        with django_assert_num_queries(5):
+            UserService.bulk_create_users(rows, workers=1)
+
+    def test_username_taken_concurrently_is_reported_per_row(self, monkeypatch):
+        User.objects.create(username="student2", role=User.Roles.STUDENT)
+        # Simulate a concurrent request creating the user between the check and the insert.
+        monkeypatch.setattr(UserService, "_existing_values", staticmethod(lambda field_name, values: set()))
+
+        result = UserService.bulk_create_users([self._row(1), self._row(2), self._row(3)], workers=1)
+
+        assert [user.username for user in result.created] == ["student1", "student3"]
+        assert all(user.pk for user in result.created)
+        assert result.errors == [{"row": 2, "errors": {"username": ["A user with that username already exists."]}}]
+
+    def test_shared_pool_is_reused(self, settings):
+        from users import hashing
+
+        settings.PASSWORD_HASH_WORKERS = 2
+        passwords = ["Str0ngPass!x"] * hashing.MIN_PARALLEL_PASSWORDS
+
+        hashing.hash_passwords(passwords)
+        pool = hashing._pool
+        hashing.hash_passwords(passwords)
+
+        assert pool is not None and hashing._pool is pool
+
+    def test_hashes_across_process_pool(self):
+        from users.hashing import MIN_PARALLEL_PASSWORDS
+
+        rows = [self._row(n) for n in range(MIN_PARALLEL_PASSWORDS)]
+
+        result = UserService.bulk_create_users(rows, workers=2)
+
+        assert len(result.created) == MIN_PARALLEL_PASSWORDS
+        assert User.objects.get(username="student7").check_password("Str0ngPass!x")
@@ -29,3 +29,51 @@ class TestUserViews:
         assert response.status_code == 200
         assert response.data["username"] == student.username
         assert response.data["role"] == "STUDENT"
+
+
+@pytest.mark.django_db
+class TestBulkProvisionView:
+    def _admin_client(self):
+        from rest_framework.test import APIClient
+
+        client = APIClient()
+        client.force_authenticate(user=User.objects.create(username="admin", is_staff=True))
+        return client
+
+    def test_json_body(self):
+        user = {"username": "bulk1", "email": "b1@example.com", "password": "Str0ngPass!x", "role": "TEACHER"}
+        data = {"users": [user]}
+
+        response = self._admin_client().post("/api/v1/users/bulk", data, format="json")
+
+        assert response.status_code == 201
+        assert response.data == {"created": 1, "errors": []}
+
+    def test_csv_upload(self):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        content = b"username,email,password,role\nbulk2,b2@example.com,Str0ngPass!x,STUDENT\nbulk3,,short,STUDENT\n"
+        upload = SimpleUploadedFile("intake.csv", content, content_type="text/csv")
+
+        response = self._admin_client().post("/api/v1/users/bulk", {"file": upload}, format="multipart")
+
+        assert response.status_code == 201
+        assert response.data["created"] == 1
+        assert response.data["errors"][0]["row"] == 2
+
+    def test_too_many_rows_are_rejected(self, settings):
+        settings.BULK_PROVISION_MAX_ROWS = 1
+        rows = [{"username": f"bulk{n}", "password": "Str0ngPass!x", "role": "STUDENT"} for n in range(2)]
+
+        response = self._admin_client().post("/api/v1/users/bulk", rows, format="json")
+
+        assert response.status_code == 413
+        assert not User.objects.filter(username__startswith="bulk").exists()
+
+    def test_requires_admin(self):
+        from rest_framework.test import APIClient
+
+        client = APIClient()
+        client.force_authenticate(user=User.objects.create(username="plain"))
+
+        assert client.post("/api/v1/users/bulk", [], format="json").status_code == 403